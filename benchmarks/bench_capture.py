@@ -0,0 +1,43 @@
+"""mss ScreenShot -> PIL conversion benchmark.
+
+Uses synthetic BGRA buffers, so it runs without a display:
+
+    python benchmarks/bench_capture.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mss.screenshot import ScreenShot
+
+from printado.core.capture import CAPTURE_BACKENDS
+
+
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "3x4K": (3 * 3840, 2160),
+}
+
+
+def _best_ms(func, repeat=5):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    header = f"{'size':<8}" + "".join(f"{name + ' (ms)':>14}" for name in CAPTURE_BACKENDS)
+    print(header)
+
+    for name, (width, height) in SIZES.items():
+        data = bytearray(os.urandom(width * height * 4))
+        row = f"{name:<8}"
+        for convert in CAPTURE_BACKENDS.values():
+            # A fresh ScreenShot per run: mss caches the .rgb conversion.
+            row += f"{_best_ms(lambda: convert(ScreenShot.from_size(data, width, height))):>14.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
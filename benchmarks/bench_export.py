@@ -0,0 +1,59 @@
+"""Export encoder benchmark: encode time vs. output size per preset.
+
+Runs every preset over the sample captures in tests/data/captures and
+compares them with PIL's default PNG settings:
+
+    python benchmarks/bench_export.py
+"""
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PIL import Image
+
+from printado.core.encoding import EXPORT_PRESETS, encode_image
+
+
+CAPTURES_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "data", "captures")
+
+
+def default_png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    captures = [
+        (name, Image.open(os.path.join(CAPTURES_DIR, name)).convert("RGB"))
+        for name in sorted(os.listdir(CAPTURES_DIR))
+    ]
+    encoders = {"pil-default": default_png}
+    encoders.update({name: (lambda image, name=name: encode_image(image, preset=name)) for name in EXPORT_PRESETS})
+
+    print(f"{'capture':<24}{'encoder':<14}{'time (ms)':>12}{'KiB':>10}{'ratio':>8}")
+    totals = {name: [0.0, 0] for name in encoders}
+    for capture_name, image in captures:
+        baseline = len(default_png(image))
+        for name, encode in encoders.items():
+            elapsed = _best_ms(lambda: encode(image))
+            size = len(encode(image))
+            totals[name][0] += elapsed
+            totals[name][1] += size
+            print(f"{capture_name:<24}{name:<14}{elapsed:>12.1f}{size / 1024:>10.1f}{size / baseline:>8.2f}")
+
+    print()
+    baseline = totals["pil-default"][1]
+    for name, (elapsed, size) in totals.items():
+        print(f"{'total':<24}{name:<14}{elapsed:>12.1f}{size / 1024:>10.1f}{size / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
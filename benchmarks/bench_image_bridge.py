@@ -0,0 +1,54 @@
+"""PIL -> Qt conversion micro-benchmark.
+
+Compares the previous RGBA round-trip with pil_image_to_qpixmap for typical
+capture sizes:
+
+    python benchmarks/bench_image_bridge.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from printado.core.image_utils import pil_image_to_qpixmap
+
+
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "3x4K": (3 * 3840, 2160),
+}
+
+
+def legacy_pil_image_to_qpixmap(pil_image):
+    image = pil_image.convert("RGBA")
+    data = image.tobytes("raw", "RGBA")
+    qimage = QImage(data, image.width, image.height, QImage.Format_RGBA8888)
+    return QPixmap.fromImage(qimage)
+
+
+def _best_ms(func, repeat=5):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'size':<8}{'legacy (ms)':>14}{'bridge (ms)':>14}{'speedup':>10}")
+    for name, size in SIZES.items():
+        image = Image.effect_noise(size, 64).convert("RGB")
+        legacy = _best_ms(lambda: legacy_pil_image_to_qpixmap(image))
+        bridge = _best_ms(lambda: pil_image_to_qpixmap(image))
+        print(f"{name:<8}{legacy:>14.1f}{bridge:>14.1f}{legacy / bridge:>9.1f}x")
+
+    return app
+
+
+if __name__ == "__main__":
+    main()
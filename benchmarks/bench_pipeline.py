@@ -0,0 +1,304 @@
+"""Capture -> render -> export pipeline benchmarks, compared with stored baselines.
+
+    python benchmarks/bench_pipeline.py                    # run everything, compare
+    python benchmarks/bench_pipeline.py -k render_image    # only matching cases
+    python benchmarks/bench_pipeline.py --save             # store results as baselines
+
+Every case is run ``--repeat`` times and reports its best and median time.
+The best time is compared with ``baselines.json``; a case more than
+``--threshold`` slower is reported as a regression and the script exits
+with status 1. Baselines only mean something on the machine that recorded
+them: run ``--save`` there first (the machine is noted in the file).
+
+Images are built by tiling the sample captures in tests/data/captures, so
+encoders and the brightness check see UI-like content rather than noise.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from functools import lru_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_PATH = os.path.join(BENCHMARKS_DIR, "baselines.json")
+CAPTURES_DIR = os.path.join(BENCHMARKS_DIR, "..", "tests", "data", "captures")
+
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "8K": (7680, 4320),
+}
+ELEMENT_COUNTS = (10, 100, 1000)
+
+
+# -- inputs ------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def capture_like(size_name):
+    """A capture of the given size, tiled from the sample screenshots."""
+    width, height = SIZES[size_name]
+    tiles = [
+        Image.open(os.path.join(CAPTURES_DIR, name)).convert("RGB")
+        for name in sorted(os.listdir(CAPTURES_DIR))
+    ]
+    image = Image.new("RGB", (width, height))
+    x = y = row_height = index = 0
+    while y < height:
+        tile = tiles[index % len(tiles)]
+        image.paste(tile, (x, y))
+        row_height = max(row_height, tile.height)
+        x += tile.width
+        index += 1
+        if x >= width:
+            x, y, row_height = 0, y + row_height, 0
+    return image
+
+
+def annotations(count, size, seed=0):
+    """``count`` arrows, lines, rectangles and texts spread over an image of ``size``."""
+    from printado.core.annotations import Arrow, Line, Rectangle, Text
+
+    rng = random.Random(seed)
+    width, height = size
+    colors = ("#ff0000", "#00aa00", "#0000ff", "#ffcc00")
+    elements = []
+    for index in range(count):
+        x, y = rng.randrange(width), rng.randrange(height)
+        color = colors[index % len(colors)]
+        kind = index % 4
+        if kind == 3:
+            elements.append(Text(f"nota {index}", x, y, color, font_size=rng.choice((14, 18, 24))))
+            continue
+        x2 = min(width - 1, x + rng.randrange(20, 400))
+        y2 = min(height - 1, y + rng.randrange(20, 300))
+        shape = (Arrow, Line, Rectangle)[kind]
+        elements.append(shape(x, y, x2, y2, rng.choice((2, 4, 6)), color))
+    return elements
+
+
+_app = None
+
+
+def qt_app():
+    global _app
+    from PyQt5.QtWidgets import QApplication
+
+    _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+@lru_cache(maxsize=None)
+def upload_server():
+    """A local stand-in for the upload endpoint; returns its URL."""
+    from tests.http_stub import StubServer
+
+    return StubServer(lambda request: (200, {"link": "https://example.com/bench"}), "/upload", record=False).start().url
+
+
+# -- cases -------------------------------------------------------------------
+#
+# A case factory builds its inputs (outside the timing) and returns
+# ``(func, setup)``; ``setup`` runs before every timed call of ``func``.
+
+def render_image_case(size_name, count):
+    from printado.core.screenshot_editor import render_image
+
+    image = capture_like(size_name)
+    elements = annotations(count, image.size)
+    return (lambda: render_image(image, elements)), None
+
+
+def qpixmap_case(size_name):
+    from printado.core.image_utils import pil_image_to_qpixmap
+
+    qt_app()
+    image = capture_like(size_name)
+    return (lambda: pil_image_to_qpixmap(image)), None
+
+
+def background_dark_case(size_name):
+    from printado.core import toolbar
+
+    image = capture_like(size_name)
+    # The result is memoized per image; measure the first call of a capture.
+    return (lambda: toolbar.is_background_dark(image)), toolbar._brightness_cache.clear
+
+
+def blur_case(size_name):
+    from printado.core.blur_background import blur_frame
+
+    image = capture_like(size_name)
+    return (lambda: blur_frame(image)), None
+
+
+def png_case(size_name):
+    from printado.core.image_utils import pil_image_to_png_bytes
+
+    image = capture_like(size_name)
+    return (lambda: pil_image_to_png_bytes(image)), None
+
+
+def upload_case(size_name):
+    from printado.core.image_utils import pil_image_to_png_bytes
+    from printado.modules.multipart import MultipartStream
+    from printado.modules.upload_client import UploadClient
+
+    url = upload_server()
+    data = pil_image_to_png_bytes(capture_like(size_name))
+    client = UploadClient(retries=0)
+    client.upload(MultipartStream("image", "bench.png", data=data), url=url)  # open the connection
+
+    def upload():
+        response = client.upload(MultipartStream("image", "bench.png", data=data), url=url)
+        assert response.status_code == 200
+
+    return upload, None
+
+
+def build_cases():
+    cases = {}
+    for size_name in SIZES:
+        for count in ELEMENT_COUNTS:
+            cases[f"render_image[{count}@{size_name}]"] = (render_image_case, size_name, count)
+    for size_name in SIZES:
+        cases[f"pil_image_to_qpixmap[{size_name}]"] = (qpixmap_case, size_name)
+        cases[f"is_background_dark[{size_name}]"] = (background_dark_case, size_name)
+        cases[f"blur_frame[{size_name}]"] = (blur_case, size_name)
+    # PNG at 8K takes seconds per run and adds nothing the 4K case does not show.
+    for size_name in ("1080p", "4K"):
+        cases[f"pil_image_to_png_bytes[{size_name}]"] = (png_case, size_name)
+        cases[f"upload[{size_name}]"] = (upload_case, size_name)
+    return cases
+
+
+# -- runner ------------------------------------------------------------------
+
+def measure(func, setup=None, repeat=5):
+    """Time ``repeat`` calls of ``func``; returns the samples in milliseconds."""
+    func()  # warm-up: imports, font cache, connection pool
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run(cases, repeat):
+    results = {}
+    for name, (factory, *args) in cases.items():
+        func, setup = factory(*args)
+        samples = measure(func, setup, repeat)
+        results[name] = {"best_ms": round(min(samples), 3), "median_ms": round(statistics.median(samples), 3)}
+        print(f"{name:<34}{results[name]['best_ms']:>12.2f}{results[name]['median_ms']:>12.2f}", flush=True)
+    return results
+
+
+def load_baselines(path=BASELINES_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as baselines_file:
+            return json.load(baselines_file)
+    except FileNotFoundError:
+        return {"cases": {}}
+
+
+def save_baselines(results, path=BASELINES_PATH):
+    baselines = load_baselines(path)
+    baselines["machine"] = machine_info()
+    baselines.setdefault("cases", {}).update(results)
+    with open(path, "w", encoding="utf-8") as baselines_file:
+        json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+        baselines_file.write("\n")
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baselines, threshold, min_delta_ms=0.5):
+    """Rows of ``(name, baseline_ms, best_ms, ratio, status)``; status is ok/regression/faster/new.
+
+    Differences below ``min_delta_ms`` are noise for sub-millisecond cases
+    and never count as a change.
+    """
+    rows = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            rows.append((name, None, result["best_ms"], None, "new"))
+            continue
+        ratio = result["best_ms"] / max(baseline["best_ms"], 1e-6)
+        if abs(result["best_ms"] - baseline["best_ms"]) < min_delta_ms:
+            status = "ok"
+        elif ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, baseline["best_ms"], result["best_ms"], ratio, status))
+    return rows
+
+
+def print_report(rows):
+    print()
+    print(f"{'case':<34}{'baseline':>12}{'now':>12}{'ratio':>8}  status")
+    for name, baseline, best, ratio, status in rows:
+        baseline_text = f"{baseline:>12.2f}" if baseline is not None else f"{'-':>12}"
+        ratio_text = f"{ratio:>7.2f}x" if ratio is not None else f"{'-':>8}"
+        print(f"{name:<34}{baseline_text}{best:>12.2f}{ratio_text}  {status}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", action="append", default=[], help="run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="ignore differences below this (ms)")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--save", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    cases = build_cases()
+    if args.filter:
+        cases = {name: case for name, case in cases.items() if any(part in name for part in args.filter)}
+    if not cases:
+        parser.error("no case matches the filter")
+
+    print(f"{'case':<34}{'best (ms)':>12}{'median (ms)':>12}")
+    results = run(cases, args.repeat)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as results_file:
+            json.dump({"machine": machine_info(), "cases": results}, results_file, indent=2, sort_keys=True)
+
+    if args.save:
+        save_baselines(results, args.baselines)
+        print(f"\nBaselines saved to {args.baselines}")
+        return 0
+
+    rows = compare(results, load_baselines(args.baselines).get("cases", {}), args.threshold, args.min_delta)
+    print_report(rows)
+    return 1 if any(status == "regression" for *_, status in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
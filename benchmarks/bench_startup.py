@@ -0,0 +1,74 @@
+"""Hotkey-to-first-paint latency of the capture overlay.
+
+Compares building a new ScreenshotTool per capture (the previous tray
+behaviour) with taking a pre-built editor from EditorPool:
+
+    python benchmarks/bench_startup.py
+
+Freeze-frame is disabled so the numbers do not depend on the screen
+grab; run it under a real display for representative paint timings.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+
+from printado.config import Config
+from printado.core.selection_window import SelectionWindow
+from printado.modules.editor_pool import EditorPool
+from printado.modules.gui import ScreenshotTool
+
+
+class FirstPaint(QObject):
+    def __init__(self):
+        super().__init__()
+        self.painted_at = None
+
+    def eventFilter(self, obj, event):
+        if self.painted_at is None and event.type() == QEvent.Paint and isinstance(obj, SelectionWindow):
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def _measure(app, start_capture, repeat=10):
+    samples = []
+    for _ in range(repeat):
+        probe = FirstPaint()
+        app.installEventFilter(probe)
+        started = time.perf_counter()
+        editor = start_capture()
+        while probe.painted_at is None and time.perf_counter() - started < 2:
+            app.processEvents()
+        app.removeEventFilter(probe)
+        if probe.painted_at is not None:
+            samples.append((probe.painted_at - started) * 1000)
+        editor.close()
+        app.processEvents()
+    samples.sort()
+    return samples[len(samples) // 2], samples[0]
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    Config.FREEZE_FRAME = False
+
+    cold_median, cold_best = _measure(app, ScreenshotTool)
+
+    pool = EditorPool(size=1)
+    pool.warm()
+    app.processEvents()
+    warm_median, warm_best = _measure(app, pool.acquire)
+
+    print(f"{'path':<14}{'median (ms)':>14}{'best (ms)':>12}")
+    print(f"{'new editor':<14}{cold_median:>14.1f}{cold_best:>12.1f}")
+    print(f"{'editor pool':<14}{warm_median:>14.1f}{warm_best:>12.1f}")
+    return app
+
+
+if __name__ == "__main__":
+    main()
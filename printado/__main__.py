@@ -1,4 +1,24 @@
-from printado.tray import main
+import sys
+
+
+def main():
+    if "--profile-startup" in sys.argv[1:]:
+        from printado.startup_profile import main as profile_main
+
+        sys.exit(profile_main())
+
+    # Subcommands run headless; anything else starts (or talks to) the tray.
+    # printado.cli imports Pillow lazily, so reading SUBCOMMANDS here is cheap.
+    from printado.cli import SUBCOMMANDS
+
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        from printado.cli import main as cli_main
+
+        sys.exit(cli_main(sys.argv[1:]))
+
+    from printado.tray import main as tray_main
+
+    tray_main()
 
 
 if __name__ == "__main__":
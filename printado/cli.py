@@ -0,0 +1,228 @@
+"""Headless command line for scripted captures.
+
+    python -m printado capture --monitor 1 -o tela.png
+    python -m printado annotate anotacoes.json capturas/*.png -o saida/ --jobs 4
+    python -m printado export capturas/*.png -o saida/ --preset webp
+    python -m printado upload saida/*.webp
+
+Nothing here builds a widget. Inputs are processed in parallel by a
+process pool and every result is printed as one JSON line on stdout as
+soon as it is ready.
+
+Pillow and the encoders are imported where they are used, so
+``python -m printado`` can read ``SUBCOMMANDS`` without loading them.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+SUBCOMMANDS = ("capture", "annotate", "export", "upload")
+FORMAT_CHOICES = {"png": "PNG", "webp": "WEBP", "jpg": "JPEG"}
+
+
+def load_spec(path):
+    """Read an annotation spec: a list of annotations, or ``{"annotations": [...]}``."""
+    from printado.core.annotations import annotation_from_dict
+
+    with open(path, "r", encoding="utf-8") as spec_file:
+        spec = json.load(spec_file)
+    if isinstance(spec, dict):
+        spec = spec.get("annotations", [])
+    return [annotation_from_dict(item) for item in spec]
+
+
+def output_path(input_path, output_dir, preset, format=None):
+    from printado.core.encoding import EXTENSIONS, get_preset
+
+    extension = EXTENSIONS[format or get_preset(preset).format]
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, stem + extension)
+
+
+def duplicate_outputs(inputs, output_dir, preset, format=None):
+    """Output paths that more than one input would be written to."""
+    seen = {}
+    for input_path in inputs:
+        path = output_path(input_path, output_dir, preset, format)
+        seen.setdefault(path, []).append(input_path)
+    return {path: sources for path, sources in seen.items() if len(sources) > 1}
+
+
+def _write(image, path, preset, format):
+    from printado.core.encoding import encode_image
+
+    tmp_path = f"{path}.part"
+    with open(tmp_path, "wb") as output_file:
+        encode_image(image, output_file, preset=preset, format=format)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+# Tasks run in worker processes: module-level, picklable arguments only.
+
+def annotate_task(input_path, spec_path, output_dir, preset, format):
+    from PIL import Image
+    from printado.core.screenshot_editor import render_image
+
+    with Image.open(input_path) as source:
+        image = source.convert("RGB")
+    rendered = render_image(image, load_spec(spec_path))
+    path = output_path(input_path, output_dir, preset, format)
+    return {"output": path, "bytes": _write(rendered, path, preset, format)}
+
+
+def export_task(input_path, output_dir, preset, format):
+    from PIL import Image
+
+    with Image.open(input_path) as source:
+        image = source.convert("RGB")
+    path = output_path(input_path, output_dir, preset, format)
+    return {"output": path, "bytes": _write(image, path, preset, format)}
+
+
+def upload_task(input_path):
+    from printado.modules.multipart import MultipartStream
+    from printado.modules.upload_client import get_upload_client
+
+    body = MultipartStream("image", os.path.basename(input_path), path=input_path)
+    try:
+        response = get_upload_client().upload(body)
+    finally:
+        body.close()
+    if response.status_code != 200:
+        raise RuntimeError(f"Erro {response.status_code}: {response.text}")
+    link = response.json().get("link", "")
+    if not link:
+        raise RuntimeError("Resposta do servidor não contém um link válido.")
+    return {"link": link}
+
+
+def _run_task(task, input_path, *args):
+    started = time.perf_counter()
+    try:
+        result = {"input": input_path, "ok": True}
+        result.update(task(input_path, *args))
+    except Exception as e:
+        result = {"input": input_path, "ok": False, "error": str(e)}
+    result["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def run_tasks(task, inputs, args=(), jobs=None):
+    """Yield one result dict per input, in completion order."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(inputs) <= 1:
+        for input_path in inputs:
+            yield _run_task(task, input_path, *args)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(inputs))) as pool:
+        futures = [pool.submit(_run_task, task, input_path, *args) for input_path in inputs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def capture_task(input_path, region, monitor_index, output, preset, format):
+    import mss
+    from printado.core.capture import grab_image
+
+    with mss.mss() as sct:
+        if region:
+            left, top, width, height = region
+            monitor = {"left": left, "top": top, "width": width, "height": height}
+        else:
+            monitor = sct.monitors[monitor_index]
+        image = grab_image(sct, monitor)
+
+    path = output
+    if os.path.isdir(path):
+        path = output_path(time.strftime("printado-%Y%m%d-%H%M%S"), path, preset, format)
+    return {"output": path, "bytes": _write(image, path, preset, format)}
+
+
+def _region(value):
+    try:
+        left, top, width, height = (int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError("use X,Y,LARGURA,ALTURA")
+    return left, top, width, height
+
+
+def build_parser():
+    from printado.core.encoding import EXPORT_PRESETS
+
+    parser = argparse.ArgumentParser(prog="printado", description="Printado em modo linha de comando.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_output_options(subparser):
+        subparser.add_argument("--preset", choices=sorted(EXPORT_PRESETS), default=None,
+                               help="preset de exportação (padrão: EXPORT_PRESET)")
+        subparser.add_argument("--format", choices=sorted(FORMAT_CHOICES), default=None,
+                               help="formato de saída (padrão: o do preset)")
+
+    capture_parser = subparsers.add_parser("capture", help="captura a tela sem abrir o editor")
+    target = capture_parser.add_mutually_exclusive_group()
+    target.add_argument("--region", type=_region, help="região X,Y,LARGURA,ALTURA em pixels")
+    target.add_argument("--monitor", type=int, default=0, help="monitor (0 = todos)")
+    capture_parser.add_argument("-o", "--output", required=True, help="arquivo ou diretório de saída")
+    add_output_options(capture_parser)
+
+    annotate_parser = subparsers.add_parser("annotate", help="aplica um arquivo de anotações às imagens")
+    annotate_parser.add_argument("spec", help="JSON com a lista de anotações")
+    annotate_parser.add_argument("inputs", nargs="+")
+    annotate_parser.add_argument("-o", "--output-dir", required=True)
+    add_output_options(annotate_parser)
+
+    export_parser = subparsers.add_parser("export", help="recodifica imagens com um preset")
+    export_parser.add_argument("inputs", nargs="+")
+    export_parser.add_argument("-o", "--output-dir", required=True)
+    add_output_options(export_parser)
+
+    upload_parser = subparsers.add_parser("upload", help="envia imagens e imprime os links")
+    upload_parser.add_argument("inputs", nargs="+")
+
+    for subparser in (annotate_parser, export_parser, upload_parser):
+        subparser.add_argument("-j", "--jobs", type=int, default=None, help="processos em paralelo")
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    format = FORMAT_CHOICES.get(args.format) if args.format else None
+    if args.command == "capture":
+        results = [_run_task(capture_task, "screen", args.region, args.monitor, args.output, args.preset, format)]
+    elif args.command == "upload":
+        results = run_tasks(upload_task, args.inputs, jobs=args.jobs)
+    else:
+        duplicates = duplicate_outputs(args.inputs, args.output_dir, args.preset, format)
+        if duplicates:
+            clashes = "; ".join(f"{', '.join(sources)} -> {path}" for path, sources in duplicates.items())
+            parser.error(f"entradas gravariam o mesmo arquivo de saída: {clashes}")
+        os.makedirs(args.output_dir, exist_ok=True)
+        if args.command == "annotate":
+            try:
+                load_spec(args.spec)  # fail fast on a broken spec
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                parser.error(f"arquivo de anotações inválido: {e}")
+            results = run_tasks(annotate_task, args.inputs, (args.spec, args.output_dir, args.preset, format), args.jobs)
+        else:
+            results = run_tasks(export_task, args.inputs, (args.output_dir, args.preset, format), args.jobs)
+
+    failed = False
+    for result in results:
+        result = {"command": args.command, **result}
+        failed = failed or not result["ok"]
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
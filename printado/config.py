@@ -1,7 +1,25 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+
+def _find_dotenv(filename=".env"):
+    """Same lookup as python-dotenv's find_dotenv(): upwards from this package."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, filename)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return ""
+        path = parent
+
+
+_dotenv_path = _find_dotenv()
+if _dotenv_path:
+    # python-dotenv is only imported when there is something to load.
+    from dotenv import load_dotenv
+
+    load_dotenv(_dotenv_path)
 
 class Config:
 
@@ -9,8 +27,68 @@ class Config:
     UPLOAD_URL = os.getenv("UPLOAD_URL", "")
     API_KEY = os.getenv("API_KEY", "DEFAULT_SECRET")
 
+    # Upload HTTP client: kept-alive connections, retries with backoff on 5xx/connection errors
+    UPLOAD_POOL_SIZE = int(os.getenv("UPLOAD_POOL_SIZE", "4"))
+    UPLOAD_RETRIES = int(os.getenv("UPLOAD_RETRIES", "3"))
+    UPLOAD_BACKOFF = float(os.getenv("UPLOAD_BACKOFF", "0.5"))
+    UPLOAD_TIMEOUT = float(os.getenv("UPLOAD_TIMEOUT", "10"))
+
+    # Offline upload queue: spooled captures are retried with exponential backoff (seconds)
+    UPLOAD_QUEUE_ENABLED = os.getenv("UPLOAD_QUEUE_ENABLED", "True").lower() in ("true", "1")
+    UPLOAD_QUEUE_CONCURRENCY = int(os.getenv("UPLOAD_QUEUE_CONCURRENCY", "2"))
+    UPLOAD_QUEUE_BACKOFF = float(os.getenv("UPLOAD_QUEUE_BACKOFF", "5"))
+    UPLOAD_QUEUE_MAX_BACKOFF = float(os.getenv("UPLOAD_QUEUE_MAX_BACKOFF", "900"))
+    UPLOAD_QUEUE_MAX_ATTEMPTS = int(os.getenv("UPLOAD_QUEUE_MAX_ATTEMPTS", "20"))
+    UPLOAD_QUEUE_POLL_INTERVAL = float(os.getenv("UPLOAD_QUEUE_POLL_INTERVAL", "60"))
+
     DEBUG_MODE = os.getenv("DEBUG_MODE", "False").lower() in ("true", "1")
 
+    # Render edits on a display-sized copy of the capture; full resolution only on save/upload
+    PREVIEW_PROXY = os.getenv("PREVIEW_PROXY", "True").lower() in ("true", "1")
+
+    # How mss captures become PIL images: "buffer" (default) or "rgb" (legacy)
+    CAPTURE_BACKEND = os.getenv("CAPTURE_BACKEND", "buffer").lower()
+
+    # Upper bound to wait for the selection overlay to leave the screen, and extra
+    # time given to the compositor to repaint before grabbing (milliseconds)
+    CAPTURE_HIDE_TIMEOUT_MS = int(os.getenv("CAPTURE_HIDE_TIMEOUT_MS", "200"))
+    CAPTURE_SETTLE_MS = int(os.getenv("CAPTURE_SETTLE_MS", "16"))
+
+    # Grab the desktop once when the capture starts and select from that frozen frame
+    FREEZE_FRAME = os.getenv("FREEZE_FRAME", "True").lower() in ("true", "1")
+
+    # The backdrop blur is computed on a 1/N downscaled copy of the desktop
+    BLUR_DOWNSCALE = int(os.getenv("BLUR_DOWNSCALE", "4"))
+
+    # Number of PIL font objects (family, size, style) kept loaded for text annotations
+    FONT_CACHE_SIZE = int(os.getenv("FONT_CACHE_SIZE", "32"))
+
+    # Undo steps kept by the editor (0 = unlimited)
+    HISTORY_DEPTH = int(os.getenv("HISTORY_DEPTH", "200"))
+
+    # Keep a rendered copy every N annotations so edits in the middle of the list
+    # replay from the nearest checkpoint instead of from scratch (0 = off)
+    RENDER_CHECKPOINT_INTERVAL = int(os.getenv("RENDER_CHECKPOINT_INTERVAL", "0"))
+    RENDER_CHECKPOINT_LIMIT = int(os.getenv("RENDER_CHECKPOINT_LIMIT", "4"))
+
+    # Hidden editors the tray keeps ready for the next capture (0 builds one per capture)
+    EDITOR_POOL_SIZE = int(os.getenv("EDITOR_POOL_SIZE", "1"))
+
+    # Encoder preset for saves and uploads: fast, balanced, small or webp
+    EXPORT_PRESET = os.getenv("EXPORT_PRESET", "balanced")
+
+    # Worker threads used to render and encode saves/uploads off the GUI thread
+    EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "2"))
+
+    # Time the capture/render/export pipeline (printado.core.tracing); TRACE_FILE also
+    # turns it on and receives the histograms and a Chrome trace when the app exits
+    TRACE_ENABLED = os.getenv("TRACE_ENABLED", "False").lower() in ("true", "1")
+    TRACE_FILE = os.getenv("TRACE_FILE", "")
+    TRACE_EVENT_LIMIT = int(os.getenv("TRACE_EVENT_LIMIT", "10000"))
+
+    # Minimum time between update checks (seconds); the last answer is cached on disk
+    UPDATE_CHECK_INTERVAL = int(os.getenv("UPDATE_CHECK_INTERVAL", str(6 * 60 * 60)))
+
     @classmethod
     def show_config(cls):
         config_vars = {key: value for key, value in cls.__dict__.items() if not key.startswith("__")}
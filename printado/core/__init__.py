@@ -1,4 +1,26 @@
-from .blur_background import BlurBackground
-from .selection_window import SelectionWindow
-from .toolbar import setup_toolbar_buttons, update_button_styles, set_active_tool, is_background_dark
-from .utils import delete_temp_screenshot
+import importlib
+
+# Exports are resolved on first access so that importing a light submodule
+# (e.g. printado.core.utils) does not pull in the widgets and qtawesome.
+_EXPORTS = {
+    "BlurBackground": ".blur_background",
+    "SelectionWindow": ".selection_window",
+    "setup_toolbar_buttons": ".toolbar",
+    "update_button_styles": ".toolbar",
+    "set_active_tool": ".toolbar",
+    "is_background_dark": ".toolbar",
+    "is_screenshot_dark": ".toolbar",
+    "delete_temp_screenshot": ".utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
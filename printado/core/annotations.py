@@ -0,0 +1,221 @@
+"""Annotation model shared by the editor, the renderer and the undo history.
+
+Annotations are immutable, slotted dataclasses in base-image coordinates.
+Colors are parsed to RGBA once, and every annotation carries a conservative
+bounding box of the pixels it touches (before clipping to the image).
+"""
+import json
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from PIL import ImageColor
+
+from printado.core.fonts import get_pil_font
+
+
+def parse_color(color):
+    """RGBA tuple from a color name/hex string, an RGB(A) tuple or a QColor."""
+    if hasattr(color, "getRgb"):
+        return tuple(color.getRgb())
+    if isinstance(color, str):
+        return ImageColor.getcolor(color, "RGBA")
+    color = tuple(int(c) for c in color)
+    return color if len(color) == 4 else color + (255,)
+
+
+def color_to_hex(rgba):
+    hex_color = "#{:02x}{:02x}{:02x}".format(*rgba[:3])
+    return hex_color if rgba[3] == 255 else hex_color + f"{rgba[3]:02x}"
+
+
+@dataclass(frozen=True, slots=True)
+class Shape:
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    size: int
+    rgba: tuple
+    bbox: tuple = field(init=False, repr=False, compare=False)
+
+    kind: ClassVar[str] = ""
+
+    def __post_init__(self):
+        for name in ("x1", "y1", "x2", "y2", "size"):
+            object.__setattr__(self, name, int(getattr(self, name)))
+        object.__setattr__(self, "rgba", parse_color(self.rgba))
+        object.__setattr__(self, "bbox", self._bbox())
+
+    @property
+    def points(self):
+        return self.x1, self.y1, self.x2, self.y2
+
+    def _bbox(self):
+        pad = max(2, self.size) + 2
+        return (
+            min(self.x1, self.x2) - pad,
+            min(self.y1, self.y2) - pad,
+            max(self.x1, self.x2) + pad + 1,
+            max(self.y1, self.y2) + pad + 1,
+        )
+
+    def scaled(self, scale_x, scale_y):
+        return type(self)(
+            round(self.x1 * scale_x),
+            round(self.y1 * scale_y),
+            round(self.x2 * scale_x),
+            round(self.y2 * scale_y),
+            max(1, round(self.size * scale_x)),
+            self.rgba,
+        )
+
+    def to_dict(self):
+        return {"kind": self.kind, "points": list(self.points), "size": self.size, "color": color_to_hex(self.rgba)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*data["points"], data.get("size", 5), data.get("color", "#ff0000"))
+
+
+@dataclass(frozen=True, slots=True)
+class Line(Shape):
+    kind: ClassVar[str] = "line"
+
+
+@dataclass(frozen=True, slots=True)
+class Rectangle(Shape):
+    kind: ClassVar[str] = "rectangle"
+
+    def __post_init__(self):
+        # Always stored as top-left / bottom-right.
+        x1, x2 = sorted((int(self.x1), int(self.x2)))
+        y1, y2 = sorted((int(self.y1), int(self.y2)))
+        object.__setattr__(self, "x1", x1)
+        object.__setattr__(self, "y1", y1)
+        object.__setattr__(self, "x2", x2)
+        object.__setattr__(self, "y2", y2)
+        Shape.__post_init__(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Arrow(Shape):
+    kind: ClassVar[str] = "arrow"
+
+    @property
+    def head_size(self):
+        return max(10, max(2, self.size) * 4)
+
+    def _bbox(self):
+        left, top, right, bottom = Shape._bbox(self)
+        head = self.head_size
+        return left - head, top - head, right + head, bottom + head
+
+
+@dataclass(frozen=True, slots=True)
+class Text:
+    text: str
+    x: int
+    y: int
+    rgba: tuple
+    font_family: str = "Arial"
+    font_size: int = 18
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    bbox: tuple = field(init=False, repr=False, compare=False)
+
+    kind: ClassVar[str] = "text"
+
+    def __post_init__(self):
+        object.__setattr__(self, "x", int(self.x))
+        object.__setattr__(self, "y", int(self.y))
+        object.__setattr__(self, "font_size", int(self.font_size))
+        object.__setattr__(self, "rgba", parse_color(self.rgba))
+        object.__setattr__(self, "bbox", self._bbox())
+
+    @property
+    def font(self):
+        return get_pil_font(self.font_family, self.font_size, self.bold, self.italic)
+
+    def _bbox(self):
+        font = self.font
+        font_size = getattr(font, "size", self.font_size)
+        try:
+            left, top, right, bottom = (int(v) for v in font.getbbox(self.text))
+        except Exception:
+            left, top = 0, 0
+            right, bottom = len(self.text) * max(8, font_size), font_size * 2
+
+        if self.underline:
+            try:
+                text_width = int(font.getlength(self.text))
+            except Exception:
+                text_width = int(len(self.text) * max(8, font_size // 2))
+            right = max(right, text_width + 1)
+            bottom = max(bottom, font_size + 4)
+
+        return self.x + left - 2, self.y + top - 2, self.x + right + 3, self.y + bottom + 3
+
+    def scaled(self, scale_x, scale_y):
+        return Text(
+            self.text,
+            round(self.x * scale_x),
+            round(self.y * scale_y),
+            self.rgba,
+            self.font_family,
+            max(1, round(self.font_size * scale_y)),
+            self.bold,
+            self.italic,
+            self.underline,
+        )
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "text": self.text,
+            "position": [self.x, self.y],
+            "color": color_to_hex(self.rgba),
+            "font": {
+                "family": self.font_family,
+                "size": self.font_size,
+                "bold": self.bold,
+                "italic": self.italic,
+                "underline": self.underline,
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        font = data.get("font", {})
+        x, y = data["position"]
+        return cls(
+            data["text"],
+            x,
+            y,
+            data.get("color", "#000000"),
+            font.get("family", "Arial"),
+            font.get("size", 18),
+            font.get("bold", False),
+            font.get("italic", False),
+            font.get("underline", False),
+        )
+
+
+ANNOTATION_TYPES = {cls.kind: cls for cls in (Arrow, Line, Rectangle, Text)}
+
+
+def annotation_from_dict(data):
+    try:
+        annotation_type = ANNOTATION_TYPES[data["kind"]]
+    except KeyError:
+        raise ValueError(f"Tipo de anotação desconhecido: {data.get('kind')!r}")
+    return annotation_type.from_dict(data)
+
+
+def dumps(annotations):
+    """Serialize annotations to compact JSON."""
+    return json.dumps([a.to_dict() for a in annotations], separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data):
+    return [annotation_from_dict(item) for item in json.loads(data)]
@@ -1,15 +1,71 @@
-from PyQt5.QtWidgets import QLabel, QApplication
-from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtWidgets import QLabel, QApplication, QGraphicsOpacityEffect
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QRect, QThread, QPropertyAnimation, pyqtSignal
 from PIL import ImageGrab, ImageFilter
+from printado.config import Config
+from printado.core.image_utils import pil_image_to_qimage
+from printado.core.tracing import span
+
+BLUR_RADIUS = 15
+FADE_IN_MS = 150
+
+# Workers still running when their BlurBackground goes away must stay referenced
+# until they finish, otherwise Qt aborts on destroying a running QThread.
+_running_workers = set()
+
+
+def blur_frame(frame, radius=BLUR_RADIUS, downscale=None):
+    """Blur a downscaled copy of ``frame``.
+
+    A strong blur has no fine detail left, so blurring at 1/N size with a
+    radius divided by N looks the same once stretched back to full size,
+    at a fraction of the cost.
+    """
+    downscale = max(1, int(Config.BLUR_DOWNSCALE if downscale is None else downscale))
+    with span("blur", downscale=downscale):
+        small = frame.reduce(downscale) if downscale > 1 else frame
+        return small.filter(ImageFilter.GaussianBlur(radius=radius / downscale))
+
+
+class BlurWorker(QThread):
+    blur_ready = pyqtSignal(object)
+
+    def __init__(self, frame):
+        super().__init__()
+        self.frame = frame
+
+    def run(self):
+        try:
+            screenshot = self.frame
+            if hasattr(screenshot, "composite"):
+                # Per-screen frozen frames: stitched here, off the GUI thread.
+                with span("capture.composite"):
+                    screenshot = screenshot.composite()
+            self.frame = None
+            # QImage (unlike QPixmap) may be built outside the GUI thread.
+            self.blur_ready.emit(pil_image_to_qimage(blur_frame(screenshot)))
+        except Exception:
+            self.blur_ready.emit(None)
+
 
 class BlurBackground(QLabel):
-    def __init__(self, parent=None):
+    blur_applied = pyqtSignal()
+
+    def __init__(self, parent=None, frame=None):
         super().__init__(parent)
+        self.frame = frame
+        self.worker = None
+        self.fade_animation = None
         self.setWindowFlags(Qt.SubWindow | Qt.FramelessWindowHint | Qt.BypassWindowManagerHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         geometry = self.get_fullscreen_geometry()
         self.setGeometry(geometry)
+        self.setScaledContents(True)
+
+        self.opacity_effect = QGraphicsOpacityEffect(self)
+        self.opacity_effect.setOpacity(0.0)
+        self.setGraphicsEffect(self.opacity_effect)
+
         self.apply_blur()
 
     def show_blur(self):
@@ -31,14 +87,35 @@ class BlurBackground(QLabel):
         return QRect(x_min, y_min, width, height)
 
     def apply_blur(self):
-        screenshot = ImageGrab.grab()
-        blurred_image = screenshot.filter(ImageFilter.GaussianBlur(radius=15))
-        qimage = self.pil_to_qimage(blurred_image)
-        pixmap = QPixmap.fromImage(qimage)
-        self.setPixmap(pixmap)
-        self.setScaledContents(True)
+        """Blur in a worker thread; the pixmap fades in once it is ready."""
+        # Reuse the frame grabbed for the selection when there is one. Otherwise
+        # grab now, on the GUI thread: the editor is shown right after this and
+        # must not end up in its own backdrop.
+        frame = self.frame
+        self.frame = None
+        if frame is None:
+            try:
+                frame = ImageGrab.grab()
+            except Exception:
+                return
+
+        worker = BlurWorker(frame)
+        self.worker = worker
+
+        _running_workers.add(worker)
+        worker.finished.connect(lambda: _running_workers.discard(worker))
+        worker.blur_ready.connect(self._on_blur_ready)
+        worker.start()
+
+    def _on_blur_ready(self, qimage):
+        if qimage is None or self.sender() is not self.worker:
+            return
+
+        self.setPixmap(QPixmap.fromImage(qimage))
 
-    def pil_to_qimage(self, pil_image):
-        pil_image = pil_image.convert("RGBA")
-        data = pil_image.tobytes("raw", "BGRA")
-        return QImage(data, pil_image.width, pil_image.height, QImage.Format_ARGB32)
\ No newline at end of file
+        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self.fade_animation.setDuration(FADE_IN_MS)
+        self.fade_animation.setStartValue(0.0)
+        self.fade_animation.setEndValue(1.0)
+        self.fade_animation.finished.connect(self.blur_applied.emit)
+        self.fade_animation.start()
@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+
+import mss
+from PIL import Image
+
+from printado.config import Config
+from printado.core.tracing import span
+
+
+def _from_buffer(raw_screenshot):
+    """Unpack mss' BGRA buffer straight into Pillow (one C-level copy)."""
+    return Image.frombuffer("RGB", raw_screenshot.size, raw_screenshot.raw, "raw", "BGRX", 0, 1)
+
+
+def _from_rgb(raw_screenshot):
+    """Previous path: mss builds an RGB copy in Python, then Pillow copies it."""
+    return Image.frombytes("RGB", raw_screenshot.size, raw_screenshot.rgb)
+
+
+CAPTURE_BACKENDS = {
+    "buffer": _from_buffer,
+    "rgb": _from_rgb,
+}
+
+
+def screenshot_to_image(raw_screenshot, backend=None):
+    """Convert an mss ScreenShot to an RGB PIL Image."""
+    convert = CAPTURE_BACKENDS.get(backend or Config.CAPTURE_BACKEND, _from_buffer)
+    return convert(raw_screenshot)
+
+
+def grab_image(sct, monitor, backend=None):
+    with span("capture.grab"):
+        return screenshot_to_image(sct.grab(monitor), backend)
+
+
+# --- Per-monitor, DPI-aware capture -------------------------------------
+#
+# Qt reports screens in logical (device independent) pixels while mss grabs
+# physical pixels. With mixed DPI each screen has its own ratio, so a single
+# scale for the whole virtual desktop is wrong; every screen is mapped to its
+# own mss monitor instead.
+
+@dataclass(frozen=True, slots=True)
+class ScreenRegion:
+    """A screen's logical geometry (Qt) and the physical monitor (mss) it maps to."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    ratio: float
+    monitor: tuple  # (left, top, width, height) in physical pixels
+
+    @property
+    def logical(self):
+        return (self.x, self.y, self.width, self.height)
+
+    @property
+    def scale(self):
+        return self.monitor[2] / max(1, self.width), self.monitor[3] / max(1, self.height)
+
+    def physical_box(self, rect):
+        """Map a logical rect inside this screen to an absolute physical box."""
+        x, y, width, height = rect
+        scale_x, scale_y = self.scale
+        left, top = self.monitor[0], self.monitor[1]
+        return (
+            left + int(round((x - self.x) * scale_x)),
+            top + int(round((y - self.y) * scale_y)),
+            left + int(round((x + width - self.x) * scale_x)),
+            top + int(round((y + height - self.y) * scale_y)),
+        )
+
+    def contains(self, x, y):
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+
+def match_screens(screens, monitors):
+    """Pair Qt screens ``(x, y, width, height, ratio)`` with mss monitors.
+
+    A screen matches the monitor whose physical size is its logical size
+    times its ratio, closest to its scaled origin; leftovers are paired in
+    order.
+    """
+    available = [dict(monitor) for monitor in monitors]
+    regions = []
+    for x, y, width, height, ratio in screens:
+        def distance(monitor):
+            size_error = abs(monitor["width"] - width * ratio) + abs(monitor["height"] - height * ratio)
+            origin_error = abs(monitor["left"] - x * ratio) + abs(monitor["top"] - y * ratio)
+            return (size_error > 2, origin_error, size_error)
+
+        if not available:
+            break
+        monitor = min(available, key=distance)
+        available.remove(monitor)
+        regions.append(ScreenRegion(
+            x, y, width, height, ratio,
+            (monitor["left"], monitor["top"], monitor["width"], monitor["height"]),
+        ))
+    return regions
+
+
+def bounding_rect(regions):
+    """The logical rect covering every region."""
+    left = min(region.x for region in regions)
+    top = min(region.y for region in regions)
+    right = max(region.x + region.width for region in regions)
+    bottom = max(region.y + region.height for region in regions)
+    return (left, top, right - left, bottom - top)
+
+
+def intersect_rects(a, b):
+    left, top = max(a[0], b[0]), max(a[1], b[1])
+    right, bottom = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right - left, bottom - top)
+
+
+def compose_logical_rect(rect, regions, grab):
+    """Build the image for a logical ``rect`` from the screens it intersects.
+
+    ``grab(region, box)`` returns the pixels of an absolute physical box on
+    one screen. A rect on a single screen comes back at that screen's native
+    resolution; one spanning screens with different ratios is assembled at
+    the highest of them.
+    """
+    parts = [(region, part) for region in regions if (part := intersect_rects(rect, region.logical))]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        region, part = parts[0]
+        return grab(region, region.physical_box(part))
+
+    scale = max(max(region.scale) for region, _ in parts)
+    canvas = Image.new("RGB", (int(round(rect[2] * scale)), int(round(rect[3] * scale))))
+    for region, part in parts:
+        image = grab(region, region.physical_box(part))
+        size = (int(round(part[2] * scale)), int(round(part[3] * scale)))
+        if image.size != size:
+            image = image.resize(size, Image.LANCZOS)
+        canvas.paste(image, (int(round((part[0] - rect[0]) * scale)), int(round((part[1] - rect[1]) * scale))))
+    return canvas
+
+
+def _monitor_dict(box):
+    return {"left": box[0], "top": box[1], "width": box[2] - box[0], "height": box[3] - box[1]}
+
+
+def grab_logical_rect(rect, regions, backend=None):
+    """Grab only the physical pixels behind a logical rect."""
+    with mss.mss() as sct:
+        return compose_logical_rect(rect, regions, lambda region, box: grab_image(sct, _monitor_dict(box), backend))
+
+
+class FrozenDesktop:
+    """One native-resolution frame per screen, grabbed when a capture starts."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)  # [(ScreenRegion, Image)]
+
+    @classmethod
+    def from_image(cls, image, desktop_rect):
+        """Wrap a single frame of the whole virtual desktop (``desktop_rect`` is logical)."""
+        ratio = image.width / max(1, desktop_rect[2])
+        region = ScreenRegion(*desktop_rect, ratio, (0, 0, image.width, image.height))
+        return cls([(region, image)])
+
+    @property
+    def regions(self):
+        return [region for region, _ in self.frames]
+
+    @property
+    def bounds(self):
+        return bounding_rect(self.regions)
+
+    def crop(self, rect):
+        frames = {id(region): image for region, image in self.frames}
+
+        def grab(region, box):
+            left, top = region.monitor[0], region.monitor[1]
+            return frames[id(region)].crop((box[0] - left, box[1] - top, box[2] - left, box[3] - top))
+
+        return compose_logical_rect(rect, self.regions, grab)
+
+    def composite(self):
+        """The whole desktop as one image in logical pixels (e.g. for the blur)."""
+        left, top, width, height = self.bounds
+        canvas = Image.new("RGB", (width, height))
+        for region, image in self.frames:
+            size = (region.width, region.height)
+            if image.size != size:
+                image = image.resize(size, Image.BILINEAR)
+            canvas.paste(image, (region.x - left, region.y - top))
+        return canvas
+
+
+def grab_frozen_desktop(regions, backend=None):
+    """Grab every screen separately, at its native resolution."""
+    with mss.mss() as sct:
+        return FrozenDesktop(
+            (region, grab_image(sct, _monitor_dict(region.physical_box(region.logical)), backend))
+            for region in regions
+        )
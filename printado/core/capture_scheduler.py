@@ -0,0 +1,61 @@
+from PyQt5.QtCore import QElapsedTimer, QObject, QTimer, pyqtSignal
+
+from printado.config import Config
+
+
+class CaptureScheduler(QObject):
+    """Hides an overlay and runs the capture as soon as it is off screen.
+
+    Instead of sleeping on the GUI thread, the overlay's native window is
+    polled from the event loop until it is no longer exposed (or until
+    ``timeout_ms`` passes), then ``settle_ms`` more are given to the
+    compositor to repaint the area before ``callback`` is called.
+    """
+
+    ready = pyqtSignal()
+
+    def __init__(self, widget, callback=None, timeout_ms=None, settle_ms=None, poll_ms=5, parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.timeout_ms = Config.CAPTURE_HIDE_TIMEOUT_MS if timeout_ms is None else timeout_ms
+        self.settle_ms = Config.CAPTURE_SETTLE_MS if settle_ms is None else settle_ms
+        self.latency_ms = None
+        self.timed_out = False
+
+        if callback is not None:
+            self.ready.connect(callback)
+
+        self._hidden_detected = False
+        self._elapsed = QElapsedTimer()
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def start(self):
+        self._elapsed.start()
+        self.widget.hide()
+        self._poll_timer.start()
+        self._poll()
+
+    def is_hidden(self):
+        if self.widget.isVisible():
+            return False
+        handle = self.widget.windowHandle()
+        return handle is None or not handle.isExposed()
+
+    def _poll(self):
+        if self._hidden_detected:
+            return
+
+        hidden = self.is_hidden()
+        if not hidden and self._elapsed.elapsed() < self.timeout_ms:
+            return
+
+        self._hidden_detected = True
+        self.timed_out = not hidden
+        self._poll_timer.stop()
+        QTimer.singleShot(self.settle_ms, self._fire)
+
+    def _fire(self):
+        self.latency_ms = self._elapsed.elapsed()
+        self.ready.emit()
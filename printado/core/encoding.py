@@ -0,0 +1,97 @@
+"""Image encoders used when saving or uploading a capture.
+
+Screenshots are mostly flat UI colors, so the presets favour lossless
+formats: a palette PNG when the capture has at most 256 colors (exact, no
+dithering), and lossless WebP for the smallest uploads.
+"""
+import io
+import os
+from dataclasses import dataclass
+
+from PIL import Image
+
+from printado.config import Config
+from printado.core.tracing import span
+
+
+@dataclass(frozen=True, slots=True)
+class EncoderPreset:
+    name: str
+    format: str = "PNG"
+    compress_level: int = 6
+    optimize: bool = False
+    quantize: bool = False
+    webp_method: int = 4
+    webp_quality: int = 80  # lossless effort, not fidelity
+
+
+EXPORT_PRESETS = {
+    "fast": EncoderPreset("fast", compress_level=1),
+    "balanced": EncoderPreset("balanced", compress_level=6, quantize=True),
+    "small": EncoderPreset("small", compress_level=9, optimize=True, quantize=True),
+    "webp": EncoderPreset("webp", format="WEBP"),
+}
+
+EXTENSIONS = {"PNG": ".png", "WEBP": ".webp", "JPEG": ".jpg", "BMP": ".bmp"}
+FORMATS_BY_EXTENSION = {".png": "PNG", ".webp": "WEBP", ".jpg": "JPEG", ".jpeg": "JPEG", ".bmp": "BMP"}
+
+PALETTE_COLORS = 256
+
+
+def get_preset(preset=None):
+    """Return an ``EncoderPreset`` from a preset, a preset name or ``Config.EXPORT_PRESET``."""
+    if isinstance(preset, EncoderPreset):
+        return preset
+    name = preset or Config.EXPORT_PRESET
+    try:
+        return EXPORT_PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Preset de exportação desconhecido: {name}") from None
+
+
+def preset_extension(preset=None):
+    return EXTENSIONS[get_preset(preset).format]
+
+
+def format_for_filename(filename, default="PNG"):
+    return FORMATS_BY_EXTENSION.get(os.path.splitext(filename)[1].lower(), default)
+
+
+def to_palette(image, max_colors=PALETTE_COLORS):
+    """Convert to an exact palette image, or return None when it has too many colors."""
+    if image.mode not in ("RGB", "L"):
+        return None
+    colors = image.getcolors(max_colors)
+    if colors is None:
+        return None
+    if image.mode == "L":
+        return image
+    return image.quantize(colors=len(colors), method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def encode_image(image, fp=None, preset=None, format=None):
+    """Encode ``image`` with ``preset``; returns the bytes when ``fp`` is None.
+
+    ``format`` overrides the preset's container (e.g. taken from the file
+    extension chosen in the save dialog); the preset's effort settings
+    still apply.
+    """
+    preset = get_preset(preset)
+    format = format or preset.format
+    buffer = io.BytesIO() if fp is None else fp
+
+    with span("encode", preset=preset.name, format=format):
+        if format == "PNG":
+            if preset.quantize:
+                image = to_palette(image) or image
+            image.save(buffer, format="PNG", compress_level=preset.compress_level, optimize=preset.optimize)
+        elif format == "WEBP":
+            image.save(buffer, format="WEBP", lossless=True, quality=preset.webp_quality, method=preset.webp_method)
+        elif format == "JPEG":
+            image.convert("RGB").save(buffer, format="JPEG", quality=95, optimize=preset.optimize)
+        else:
+            image.save(buffer, format=format)
+
+    if fp is None:
+        return buffer.getvalue()
+    return None
@@ -1,27 +1,68 @@
-def handle_mouse_press(self, event):
-    adjusted_x = event.x() - self.image_offset_x
-    adjusted_y = event.y() - self.image_offset_y
+from PyQt5.QtCore import QPoint
+
+
+def image_origin(self):
+    """Top-left of the displayed image in the editor window's coordinates.
+
+    The pixmap is centered inside the label, which sits inside the window's
+    layout, so the label's own position counts too.
+    """
+    return self.label.mapTo(self.label.window(), QPoint(self.image_offset_x, self.image_offset_y))
+
+def _adjusted_position(self, event):
+    origin = image_origin(self)
+    adjusted_x = event.x() - origin.x()
+    adjusted_y = event.y() - origin.y()
     adjusted_x = max(0, min(adjusted_x, self.new_width))
     adjusted_y = max(0, min(adjusted_y, self.new_height))
+    return adjusted_x, adjusted_y
+
+def _begin_shape_preview(self, kind, start):
+    preview = getattr(self, "shape_preview", None)
+    if preview is None:
+        return
+
+    # Same thickness the committed shape will have once scaled for display.
+    scale = self.new_width / max(1, getattr(self, "original_width", self.new_width))
+    minimum = 1 if kind == "rectangle" else 2
+    pen_width = max(minimum, self.tool_size) * scale
+    origin = preview.mapFrom(self.label.window(), image_origin(self))
+    preview.begin(kind, start, self.selected_color, pen_width, (origin.x(), origin.y()))
+
+def _finish_shape_preview(self):
+    preview = getattr(self, "shape_preview", None)
+    if preview is not None:
+        preview.finish()
+
+def handle_mouse_press(self, event):
+    adjusted_x, adjusted_y = _adjusted_position(self, event)
 
     if self.rectangle_mode:
         self.rectangle_start = (adjusted_x, adjusted_y)
+        _begin_shape_preview(self, "rectangle", self.rectangle_start)
 
     elif self.line_mode:
         self.line_start = (adjusted_x, adjusted_y)
+        _begin_shape_preview(self, "line", self.line_start)
 
     elif self.arrow_mode:
         self.arrow_start = (adjusted_x, adjusted_y)
+        _begin_shape_preview(self, "arrow", self.arrow_start)
 
     elif self.text_mode:
         self.text_position = (adjusted_x, adjusted_y)
         self.show_text_input()
 
+def handle_mouse_move(self, event):
+    preview = getattr(self, "shape_preview", None)
+    if preview is None or not preview.is_active():
+        return
+
+    preview.move_to(_adjusted_position(self, event))
+
 def handle_mouse_release(self, event):
-    adjusted_x = event.x() - self.image_offset_x
-    adjusted_y = event.y() - self.image_offset_y
-    adjusted_x = max(0, min(adjusted_x, self.new_width))
-    adjusted_y = max(0, min(adjusted_y, self.new_height))
+    adjusted_x, adjusted_y = _adjusted_position(self, event)
+    _finish_shape_preview(self)
 
     if self.rectangle_mode and self.rectangle_start:
         self.rectangle_end = (adjusted_x, adjusted_y)
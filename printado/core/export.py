@@ -0,0 +1,146 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from printado.config import Config
+from printado.core.encoding import encode_image, format_for_filename
+from printado.core.screenshot_editor import render_image
+
+
+class ExportJob(QObject):
+    """Handle for one background export; signals are delivered on the GUI thread."""
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    # Emitted from the worker. They are connected before the job is
+    # submitted, so the queued delivery can't race with callers connecting
+    # to the public signals right after submit().
+    _progressed = pyqtSignal(int)
+    _succeeded = pyqtSignal(object)
+    _errored = pyqtSignal(str)
+
+    def __init__(self, description):
+        super().__init__()
+        self.description = description
+        self.result = None
+        self.error = None
+        self.future = None
+        self._progressed.connect(self.progress)
+        self._succeeded.connect(self.finished)
+        self._errored.connect(self.failed)
+
+    def done(self):
+        return self.future is not None and self.future.done()
+
+    def wait(self, timeout=None):
+        if self.future is not None:
+            self.future.exception(timeout)
+
+
+class ExportService(QObject):
+    """Renders and encodes captures on a worker pool, off the GUI thread.
+
+    Jobs only use an immutable snapshot (base image + annotation list), so
+    the editor can keep being edited, or be closed, while they run.
+    """
+
+    job_started = pyqtSignal(object)
+    job_finished = pyqtSignal(object)
+    job_failed = pyqtSignal(object, str)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.EXPORT_WORKERS,
+            thread_name_prefix="printado-export",
+        )
+        self.jobs = set()
+
+    def save(self, base_image, elements, filename, preset=None):
+        """Render and write the capture to ``filename``; the job result is the path."""
+        elements = tuple(elements)
+
+        def task(job):
+            rendered = self._render(job, base_image, elements)
+            tmp_path = _temporary_path(filename)
+            try:
+                with open(tmp_path, "wb") as fp:
+                    encode_image(rendered, fp, preset=preset, format=format_for_filename(filename))
+                os.replace(tmp_path, filename)
+            except Exception:
+                _remove_quietly(tmp_path)
+                raise
+            return filename
+
+        return self.submit(f"Salvando {os.path.basename(filename)}", task)
+
+    def encode(self, base_image, elements, preset=None):
+        """Render and encode the capture with ``preset``; the job result is the encoded bytes."""
+        elements = tuple(elements)
+
+        def task(job):
+            rendered = self._render(job, base_image, elements)
+            return encode_image(rendered, preset=preset)
+
+        return self.submit("Preparando imagem", task)
+
+    def submit(self, description, task):
+        job = ExportJob(description)
+        job.finished.connect(lambda _result: self._job_done(job))
+        job.failed.connect(lambda _error: self._job_done(job))
+        self.jobs.add(job)
+        self.job_started.emit(job)
+        job.future = self.executor.submit(self._run, job, task)
+        return job
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+    def _render(self, job, base_image, elements):
+        job._progressed.emit(10)
+        rendered = render_image(base_image, list(elements))
+        job._progressed.emit(50)
+        return rendered
+
+    def _run(self, job, task):
+        try:
+            job.result = task(job)
+        except Exception as e:
+            job.error = str(e)
+            job._errored.emit(job.error)
+        else:
+            job._progressed.emit(100)
+            job._succeeded.emit(job.result)
+
+    def _job_done(self, job):
+        self.jobs.discard(job)
+        if job.error is None:
+            self.job_finished.emit(job)
+        else:
+            self.job_failed.emit(job, job.error)
+
+
+def _temporary_path(filename):
+    directory, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(directory, f".{name}.part")
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+
+
+_export_service = None
+
+
+def get_export_service():
+    """Process-wide export pool (owned by the tray app when it is running)."""
+    global _export_service
+    if _export_service is None:
+        _export_service = ExportService()
+    return _export_service
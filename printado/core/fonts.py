@@ -0,0 +1,150 @@
+import functools
+import shutil
+import subprocess
+import threading
+
+from PIL import ImageFont
+
+from printado.config import Config
+
+
+# Used when fontconfig is unavailable or cannot resolve a family.
+_FALLBACK_FONTS = {
+    (False, False): "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    (True, False): "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    (False, True): "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
+    (True, True): "/usr/share/fonts/truetype/dejavu/DejaVuSans-BoldOblique.ttf",
+}
+
+# Families looked up with fc-match when fc-list has no face of that name
+# (fontconfig aliases Arial, the default text family, to Liberation Sans).
+ALIASED_FAMILIES = ("Arial",)
+
+_STYLES = ((False, False), (True, False), (False, True), (True, True))
+_FC_WEIGHT_REGULAR = 80
+_FC_WEIGHT_BOLD = 200
+
+_font_index = None
+_font_index_lock = threading.Lock()
+_font_cache = None
+
+
+def _fontconfig(command, *args):
+    executable = shutil.which(command)
+    if not executable:
+        return ""
+    try:
+        result = subprocess.run([executable, *args], capture_output=True, text=True, timeout=10)
+    except Exception:
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
+
+def _number(value, default):
+    # Variable fonts report ranges such as "[0 210]"; the first bound is enough.
+    try:
+        return float(value.strip("[]").split()[0])
+    except (ValueError, IndexError):
+        return default
+
+
+def _build_font_index(aliases):
+    index = {}
+    distances = {}
+    output = _fontconfig("fc-list", "--format=%{family}\t%{weight}\t%{slant}\t%{file}\n")
+    for line in output.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 4 or not parts[3]:
+            continue
+        families, weight, slant, path = parts
+        weight = _number(weight, _FC_WEIGHT_REGULAR)
+        bold = weight >= _FC_WEIGHT_BOLD
+        italic = _number(slant, 0) > 0
+        # Prefer the face closest to plain Regular/Bold over Black, Light...
+        distance = abs(weight - (_FC_WEIGHT_BOLD if bold else _FC_WEIGHT_REGULAR))
+        for family in families.split(","):
+            key = (family.strip().lower(), bold, italic)
+            if distance < distances.get(key, float("inf")):
+                index[key] = path
+                distances[key] = distance
+
+    for family in aliases:
+        if (family.lower(), False, False) in index:
+            continue
+        for bold, italic in _STYLES:
+            pattern = family + (":bold" if bold else "") + (":italic" if italic else "")
+            path = _fontconfig("fc-match", "--format=%{file}", pattern).strip()
+            if path:
+                index[(family.lower(), bold, italic)] = path
+    return index
+
+
+def load_font_index(aliases=ALIASED_FAMILIES):
+    """Map (family, bold, italic) to font files, asking fontconfig only once.
+
+    The tray calls this from a background thread at startup, so text
+    annotations never wait on fontconfig on the GUI thread.
+    """
+    global _font_index
+    if _font_index is None:
+        with _font_index_lock:
+            if _font_index is None:
+                _font_index = _build_font_index(aliases)
+    return _font_index
+
+
+def resolve_font_path(family, bold=False, italic=False):
+    """Font file for a family/style; the closest style of the family, or DejaVu."""
+    index = load_font_index()
+    key = (family or "").lower()
+    for style in ((bold, italic), (bold, False), (False, italic), (False, False)):
+        path = index.get((key, *style))
+        if path:
+            return path
+    return _FALLBACK_FONTS[(bool(bold), bool(italic))]
+
+
+def _load_font(path, size, bold, italic):
+    # bold/italic are part of the key: fontconfig may resolve several styles
+    # to the same file when a family has no dedicated face for them.
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        try:
+            return ImageFont.load_default(size)
+        except Exception:
+            return ImageFont.load_default()
+
+
+def _cached_load_font():
+    # Built on first use so FONT_CACHE_SIZE is read when fonts are needed,
+    # not when this module is imported.
+    global _font_cache
+    if _font_cache is None:
+        _font_cache = functools.lru_cache(maxsize=Config.FONT_CACHE_SIZE)(_load_font)
+    return _font_cache
+
+
+def get_pil_font(family, size, bold=False, italic=False):
+    """Cached PIL font for a family, pixel size and style."""
+    path = resolve_font_path(family, bool(bold), bool(italic))
+    return _cached_load_font()(path, int(size), bool(bold), bool(italic))
+
+
+def font_cache_info():
+    """Hit/miss counters of the font cache."""
+    fonts = _cached_load_font().cache_info()
+    return {
+        "hits": fonts.hits,
+        "misses": fonts.misses,
+        "size": fonts.currsize,
+        "max_size": fonts.maxsize,
+    }
+
+
+def clear_font_cache():
+    """Drop loaded fonts and the font index; both are rebuilt on next use."""
+    global _font_cache, _font_index
+    with _font_index_lock:
+        _font_index = None
+    _font_cache = None
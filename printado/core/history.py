@@ -0,0 +1,102 @@
+from collections import deque
+
+from printado.config import Config
+
+
+class AddAnnotation:
+    __slots__ = ("index", "annotation")
+
+    def __init__(self, index, annotation):
+        self.index = index
+        self.annotation = annotation
+
+    def apply(self, elements):
+        elements.insert(self.index, self.annotation)
+
+    def revert(self, elements):
+        del elements[self.index]
+
+
+class RemoveAnnotation:
+    __slots__ = ("index", "annotation")
+
+    def __init__(self, index, annotation):
+        self.index = index
+        self.annotation = annotation
+
+    def apply(self, elements):
+        del elements[self.index]
+
+    def revert(self, elements):
+        elements.insert(self.index, self.annotation)
+
+
+class ModifyAnnotation:
+    __slots__ = ("index", "before", "after")
+
+    def __init__(self, index, before, after):
+        self.index = index
+        self.before = before
+        self.after = after
+
+    def apply(self, elements):
+        elements[self.index] = self.after
+
+    def revert(self, elements):
+        elements[self.index] = self.before
+
+
+class History:
+    """Undo/redo of annotation edits, stored as operations rather than snapshots.
+
+    Memory grows with the number of operations kept (at most ``max_depth``),
+    not with the number of annotations times the number of edits.
+    """
+
+    def __init__(self, elements=None, max_depth=None):
+        self.max_depth = Config.HISTORY_DEPTH if max_depth is None else max_depth
+        self.elements = list(elements or [])
+        self._undo = deque(maxlen=self.max_depth or None)
+        self._redo = []
+
+    def reset(self, elements=None):
+        self.elements[:] = list(elements or [])
+        self._undo.clear()
+        self._redo.clear()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def execute(self, command):
+        command.apply(self.elements)
+        self._undo.append(command)
+        self._redo.clear()
+
+    def add(self, annotation, index=None):
+        index = len(self.elements) if index is None else index
+        self.execute(AddAnnotation(index, annotation))
+
+    def remove(self, index):
+        self.execute(RemoveAnnotation(index, self.elements[index]))
+
+    def modify(self, index, annotation):
+        self.execute(ModifyAnnotation(index, self.elements[index], annotation))
+
+    def undo(self):
+        if not self._undo:
+            return False
+        command = self._undo.pop()
+        command.revert(self.elements)
+        self._redo.append(command)
+        return True
+
+    def redo(self):
+        if not self._redo:
+            return False
+        command = self._redo.pop()
+        command.apply(self.elements)
+        self._undo.append(command)
+        return True
@@ -1,14 +1,63 @@
 import io
+import sys
 
 from PyQt5.QtGui import QImage, QPixmap
 
+from printado.core.tracing import span
+
+
+# PIL mode -> (raw mode for tobytes, QImage format, bytes per pixel).
+# Qt's native 32-bit formats are stored as 0xAARRGGBB words, so their byte
+# order depends on the platform; QPixmap.fromImage uses them without any
+# further conversion.
+if sys.byteorder == "little":
+    _QT_FORMATS = {
+        "RGB": ("BGRX", QImage.Format_RGB32, 4),
+        "RGBX": ("BGRX", QImage.Format_RGB32, 4),
+        "RGBA": ("BGRa", QImage.Format_ARGB32_Premultiplied, 4),
+        "L": ("L", QImage.Format_Grayscale8, 1),
+    }
+else:
+    _QT_FORMATS = {
+        "RGB": ("RGB", QImage.Format_RGB888, 3),
+        "RGBX": ("RGBX", QImage.Format_RGBX8888, 4),
+        "RGBA": ("RGBA", QImage.Format_RGBA8888, 4),
+        "L": ("L", QImage.Format_Grayscale8, 1),
+    }
+
+
+def pil_image_to_qimage(pil_image) -> QImage:
+    """Wrap a PIL Image in a QImage with a single copy of the pixel data.
+
+    Images without alpha are never converted to RGBA. The returned QImage
+    references the bytes buffer it was built from and keeps it alive; use
+    ``QImage.copy()`` if the image must outlive the wrapper object.
+    """
+    if pil_image.mode not in _QT_FORMATS:
+        has_alpha = "A" in pil_image.getbands() or "transparency" in pil_image.info
+        pil_image = pil_image.convert("RGBA" if has_alpha else "RGB")
+
+    raw_mode, qt_format, bytes_per_pixel = _QT_FORMATS[pil_image.mode]
+    width, height = pil_image.size
+    data = pil_image.tobytes("raw", raw_mode)
+
+    qimage = QImage(data, width, height, width * bytes_per_pixel, qt_format)
+    qimage._buffer = data
+    return qimage
+
 
 def pil_image_to_qpixmap(pil_image) -> QPixmap:
     """Convert a PIL Image to a QPixmap without disk IO."""
-    image = pil_image.convert("RGBA")
-    data = image.tobytes("raw", "RGBA")
-    qimage = QImage(data, image.width, image.height, QImage.Format_RGBA8888)
-    return QPixmap.fromImage(qimage)
+    # Raster pixmaps may share the QImage's pixels instead of copying them,
+    # and the wrapped bytes buffer dies with the wrapper: Qt must end up with
+    # pixels it owns. Packed RGB is not a pixmap format, so for captures the
+    # conversion Qt does anyway makes that copy; other modes are copied.
+    with span("pil_image_to_qpixmap"):
+        if pil_image.mode == "RGB":
+            width, height = pil_image.size
+            data = pil_image.tobytes("raw", "RGB")
+            return QPixmap.fromImage(QImage(data, width, height, width * 3, QImage.Format_RGB888))
+        return QPixmap.fromImage(pil_image_to_qimage(pil_image).copy())
 
 
 def pil_image_to_png_bytes(pil_image) -> bytes:
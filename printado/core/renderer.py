@@ -0,0 +1,156 @@
+from collections import deque
+
+from PIL import ImageDraw
+
+from printado.config import Config
+from printado.core.screenshot_editor import draw_element, element_bbox, scale_element
+from printado.core.tracing import span
+
+
+class AnnotationRenderer:
+    """Keeps a composited copy of the base image in sync with an element list.
+
+    Appending elements only draws the new ones on top of the cached layer.
+    Removing trailing elements (undo) only recomposites the area covered by
+    the removed elements. Any other change falls back to a full replay.
+
+    ``scale`` is an optional ``(scale_x, scale_y)`` applied to elements (which
+    are always given in base-image coordinates) when ``base_image`` is a
+    downscaled proxy of the capture.
+
+    With ``checkpoint_interval`` set, a copy of the composite is kept every N
+    elements (at most ``checkpoint_limit`` of them); a change that cannot be
+    applied incrementally then replays from the nearest matching checkpoint.
+    """
+
+    def __init__(self, base_image, scale=None, checkpoint_interval=None, checkpoint_limit=None):
+        self.base_image = base_image
+        self.scale = scale
+        self.checkpoint_interval = (
+            Config.RENDER_CHECKPOINT_INTERVAL if checkpoint_interval is None else checkpoint_interval
+        )
+        limit = Config.RENDER_CHECKPOINT_LIMIT if checkpoint_limit is None else checkpoint_limit
+        self.composite = None
+        self._elements = []
+        self._drawn = []
+        self._bboxes = []
+        self._checkpoints = deque(maxlen=max(1, limit))
+
+    def render(self, elements):
+        elements = list(elements)
+
+        with span("renderer.render", elements=len(elements), proxy=self.scale is not None):
+            if self.composite is None:
+                self._rebuild(elements)
+            elif self._is_prefix(self._elements, elements):
+                self._append(elements[len(self._elements):])
+            elif self._is_prefix(elements, self._elements):
+                self._remove_tail(len(elements))
+            else:
+                self._rebuild(elements)
+
+        return self.composite
+
+    def invalidate(self):
+        self.composite = None
+        self._elements = []
+        self._drawn = []
+        self._bboxes = []
+
+    @staticmethod
+    def _is_prefix(prefix, elements):
+        if len(prefix) > len(elements):
+            return False
+        return all(a is b for a, b in zip(prefix, elements))
+
+    def _rebuild(self, elements):
+        self.invalidate()
+
+        checkpoint = self._find_checkpoint(elements)
+        if checkpoint is None:
+            self.composite = self.base_image.copy()
+        else:
+            done, drawn, bboxes, image = checkpoint
+            self._elements, self._drawn, self._bboxes = list(done), list(drawn), list(bboxes)
+            self.composite = image.copy()
+
+        self._append(elements[len(self._elements):])
+
+    def _find_checkpoint(self, elements):
+        best = None
+        for checkpoint in self._checkpoints:
+            if self._is_prefix(checkpoint[0], elements) and (best is None or len(checkpoint[0]) > len(best[0])):
+                best = checkpoint
+        return best
+
+    def _save_checkpoint(self):
+        for checkpoint in self._checkpoints:
+            if len(checkpoint[0]) == len(self._elements) and self._is_prefix(checkpoint[0], self._elements):
+                return
+        self._checkpoints.append(
+            (list(self._elements), list(self._drawn), list(self._bboxes), self.composite.copy())
+        )
+
+    def _append(self, elements):
+        if not elements:
+            return
+
+        draw = ImageDraw.Draw(self.composite)
+        for element in elements:
+            drawn = element if self.scale is None else scale_element(element, *self.scale)
+            draw_element(draw, drawn)
+            self._elements.append(element)
+            self._drawn.append(drawn)
+            self._bboxes.append(element_bbox(drawn, self.composite.size))
+            if self.checkpoint_interval and len(self._elements) % self.checkpoint_interval == 0:
+                self._save_checkpoint()
+
+    def _remove_tail(self, keep):
+        removed_bboxes = self._bboxes[keep:]
+        self._elements = self._elements[:keep]
+        self._drawn = self._drawn[:keep]
+        self._bboxes = self._bboxes[:keep]
+
+        dirty = _union(removed_bboxes)
+        if dirty is None:
+            return
+
+        redraw = [
+            (drawn, bbox)
+            for drawn, bbox in zip(self._drawn, self._bboxes)
+            if _intersects(bbox, dirty)
+        ]
+
+        # Redrawn elements may spill outside the dirty area, over pixels of
+        # later elements. Elements are drawn in full-image coordinates (so
+        # rasterization matches a full replay exactly) and everything outside
+        # the dirty area is restored from a snapshot afterwards.
+        touched = _union([dirty] + [bbox for _, bbox in redraw])
+        snapshot = self.composite.crop(touched)
+
+        self.composite.paste(self.base_image.crop(dirty), dirty[:2])
+        draw = ImageDraw.Draw(self.composite)
+        for drawn, _ in redraw:
+            draw_element(draw, drawn)
+
+        restored = self.composite.crop(dirty)
+        self.composite.paste(snapshot, touched[:2])
+        self.composite.paste(restored, dirty[:2])
+
+
+def _union(bboxes):
+    bboxes = [bbox for bbox in bboxes if bbox is not None]
+    if not bboxes:
+        return None
+    return (
+        min(bbox[0] for bbox in bboxes),
+        min(bbox[1] for bbox in bboxes),
+        max(bbox[2] for bbox in bboxes),
+        max(bbox[3] for bbox in bboxes),
+    )
+
+
+def _intersects(a, b):
+    if a is None or b is None:
+        return False
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
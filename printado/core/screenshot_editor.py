@@ -1,14 +1,9 @@
 import math
-from PIL import ImageDraw, ImageFont
+from PIL import ImageDraw
 from PyQt5.QtCore import Qt
 
 from printado.core.image_utils import pil_image_to_qpixmap
-
-
-_FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-_FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-_FONT_ITALIC = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf"
-_FONT_BOLD_ITALIC = "/usr/share/fonts/truetype/dejavu/DejaVuSans-BoldOblique.ttf"
+from printado.core.tracing import span
 
 
 def update_screenshot(self):
@@ -16,96 +11,121 @@ def update_screenshot(self):
     if not getattr(self, "base_screenshot", None):
         return
 
-    rendered = render_image(self.base_screenshot, getattr(self, "elements", []))
-    self.rendered_screenshot = rendered
+    elements = getattr(self, "elements", [])
+    preview_renderer = getattr(self, "preview_renderer", None)
+
+    if preview_renderer is not None:
+        # Interactive edits only touch the display-sized proxy; saves and
+        # uploads render the full resolution image in ExportService.
+        rendered = preview_renderer.render(elements)
+        self.rendered_screenshot = None
+    else:
+        rendered = render_full_resolution(self)
 
     pixmap = pil_image_to_qpixmap(rendered)
-    scaled_pixmap = pixmap.scaled(
-        self.new_width,
-        self.new_height,
-        Qt.KeepAspectRatio,
-        Qt.SmoothTransformation,
-    )
-
-    self.label.setPixmap(scaled_pixmap)
+    if pixmap.width() != self.new_width or pixmap.height() != self.new_height:
+        with span("pixmap.scaled"):
+            pixmap = pixmap.scaled(
+                self.new_width,
+                self.new_height,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+
+    self.label.setPixmap(pixmap)
     self.label.adjustSize()
 
 
+def render_full_resolution(self):
+    """Render base image + elements at capture resolution (display without the preview proxy)."""
+    if not getattr(self, "base_screenshot", None):
+        return None
+
+    elements = getattr(self, "elements", [])
+    renderer = getattr(self, "renderer", None)
+    if renderer is not None and renderer.base_image is self.base_screenshot:
+        rendered = renderer.render(elements)
+    else:
+        rendered = render_image(self.base_screenshot, elements)
+
+    self.rendered_screenshot = rendered
+    return rendered
+
+
 def render_image(base_image, elements):
-    edited = base_image.copy()
-    draw = ImageDraw.Draw(edited)
-
-    for element in elements:
-        kind = element[0]
-        if kind == "text":
-            _draw_text(draw, element)
-        elif kind == "arrow":
-            _draw_arrow(draw, element)
-        elif kind == "line":
-            _draw_line(draw, element)
-        elif kind == "rectangle":
-            _draw_rectangle(draw, element)
+    with span("render_image", elements=len(elements)):
+        edited = base_image.copy()
+        draw = ImageDraw.Draw(edited)
+
+        for element in elements:
+            draw_element(draw, element)
 
     return edited
 
 
-def _pil_font_from_qfont(qfont):
-    size = int(qfont.pointSize() or 18)
+def draw_element(draw, element):
+    _DRAWERS[element.kind](draw, element)
 
-    if qfont.bold() and qfont.italic():
-        font_path = _FONT_BOLD_ITALIC
-    elif qfont.bold():
-        font_path = _FONT_BOLD
-    elif qfont.italic():
-        font_path = _FONT_ITALIC
-    else:
-        font_path = _FONT_REGULAR
 
-    try:
-        return ImageFont.truetype(font_path, size)
-    except Exception:
-        return ImageFont.load_default()
+def element_bbox(element, image_size):
+    """Area touched by an element, clipped to the image; None when nothing is drawn."""
+    left, top, right, bottom = element.bbox
+    width, height = image_size
+    left, top = max(0, left), max(0, top)
+    right, bottom = min(width, right), min(height, bottom)
+    if left >= right or top >= bottom:
+        return None
+    return left, top, right, bottom
+
+
+def scale_element(element, scale_x, scale_y):
+    """Map an element from base-image coordinates to a scaled image."""
+    return element.scaled(scale_x, scale_y)
 
 
 def _draw_text(draw, element):
-    _, text, pos, qfont, color = element
-    pil_font = _pil_font_from_qfont(qfont)
-    x, y = int(pos[0]), int(pos[1])
+    pil_font = element.font
+    x, y = element.x, element.y
 
-    draw.text((x, y), text, font=pil_font, fill=color)
+    draw.text((x, y), element.text, font=pil_font, fill=element.rgba)
 
-    if qfont.underline():
+    if element.underline:
         try:
-            text_width = int(draw.textlength(text, font=pil_font))
+            text_width = int(draw.textlength(element.text, font=pil_font))
         except Exception:
-            text_width = int(len(text) * max(8, pil_font.size // 2))
+            text_width = int(len(element.text) * max(8, pil_font.size // 2))
         underline_y = y + pil_font.size + 2
-        draw.line((x, underline_y, x + text_width, underline_y), fill=color, width=2)
+        draw.line((x, underline_y, x + text_width, underline_y), fill=element.rgba, width=2)
 
 
 def _draw_line(draw, element):
-    _, (x1, y1, x2, y2), size, color = element
-    draw.line((int(x1), int(y1), int(x2), int(y2)), fill=color, width=max(2, int(size)))
+    draw.line(element.points, fill=element.rgba, width=max(2, element.size))
 
 
 def _draw_rectangle(draw, element):
-    _, (x1, y1, x2, y2), size, color = element
-    draw.rectangle([int(x1), int(y1), int(x2), int(y2)], outline=color, width=max(1, int(size)))
+    draw.rectangle(list(element.points), outline=element.rgba, width=max(1, element.size))
 
 
 def _draw_arrow(draw, element):
-    _, (x1, y1, x2, y2), size, color = element
-    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-    size = max(2, int(size))
+    x1, y1, x2, y2 = element.points
+    size = max(2, element.size)
 
-    draw.line((x1, y1, x2, y2), fill=color, width=size)
+    draw.line((x1, y1, x2, y2), fill=element.rgba, width=size)
 
     angle = math.atan2(y2 - y1, x2 - x1)
-    head_size = max(10, size * 4)
+    head_size = element.head_size
 
     left_x = x2 - head_size * math.cos(angle - math.pi / 4)
     left_y = y2 - head_size * math.sin(angle - math.pi / 4)
     right_x = x2 - head_size * math.cos(angle + math.pi / 4)
     right_y = y2 - head_size * math.sin(angle + math.pi / 4)
 
-    draw.polygon([(x2, y2), (left_x, left_y), (right_x, right_y)], fill=color)
+    draw.polygon([(x2, y2), (left_x, left_y), (right_x, right_y)], fill=element.rgba)
+
+
+_DRAWERS = {
+    "text": _draw_text,
+    "arrow": _draw_arrow,
+    "line": _draw_line,
+    "rectangle": _draw_rectangle,
+}
@@ -1,27 +1,53 @@
+from PIL import Image
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
+from printado.config import Config
 from printado.core.blur_background import BlurBackground
 from printado.core.toolbar import is_background_dark, update_button_styles
-from printado.modules.update_checker import check_for_update
 from printado.core.image_utils import pil_image_to_qpixmap
+from printado.core.renderer import AnnotationRenderer
+from printado.core.tracing import span
 
 def process_screenshot(screenshot_tool, screenshot):
-    check_for_update(screenshot_tool)
-
     if not screenshot_tool.blur_background:
-        screenshot_tool.blur_background = BlurBackground(screenshot_tool)
+        frame = getattr(screenshot_tool, "frozen_frame", None)
+        screenshot_tool.blur_background = BlurBackground(screenshot_tool, frame=frame)
         screenshot_tool.blur_background.show_blur()
         screenshot_tool.blur_background.lower()
+    screenshot_tool.frozen_frame = None
 
     QApplication.restoreOverrideCursor()
     screenshot_tool.base_screenshot = screenshot
-    screenshot_tool.rendered_screenshot = screenshot.copy()
+    screenshot_tool.rendered_screenshot = None
     screenshot_tool.elements = []
+    # Without the proxy the editor displays the full resolution render.
+    screenshot_tool.renderer = None if Config.PREVIEW_PROXY else AnnotationRenderer(screenshot)
 
     adjust_screenshot_size(screenshot_tool)
+    build_preview(screenshot_tool)
     update_ui_with_screenshot(screenshot_tool)
 
 
+def build_preview(screenshot_tool):
+    """Downscale the capture once to the display size used by the editor."""
+    screenshot_tool.preview_screenshot = None
+    screenshot_tool.preview_renderer = None
+
+    if not Config.PREVIEW_PROXY:
+        return
+
+    base = screenshot_tool.base_screenshot
+    size = (screenshot_tool.new_width, screenshot_tool.new_height)
+    preview = base if base.size == size else base.resize(size, Image.LANCZOS)
+
+    scale = (
+        screenshot_tool.new_width / screenshot_tool.original_width,
+        screenshot_tool.new_height / screenshot_tool.original_height,
+    )
+    screenshot_tool.preview_screenshot = preview
+    screenshot_tool.preview_renderer = AnnotationRenderer(preview, scale=None if preview is base else scale)
+
+
 def adjust_screenshot_size(screenshot_tool):
     min_width, min_height = 400, 300
     max_width, max_height = 1024, 576
@@ -50,13 +76,16 @@ def adjust_screenshot_size(screenshot_tool):
 
 
 def update_ui_with_screenshot(screenshot_tool):
-    pixmap = pil_image_to_qpixmap(screenshot_tool.base_screenshot)
-    pixmap = pixmap.scaled(
-        screenshot_tool.new_width,
-        screenshot_tool.new_height,
-        Qt.KeepAspectRatio,
-        Qt.SmoothTransformation,
-    )
+    preview = getattr(screenshot_tool, "preview_screenshot", None)
+    pixmap = pil_image_to_qpixmap(preview or screenshot_tool.base_screenshot)
+    if preview is None:
+        with span("pixmap.scaled"):
+            pixmap = pixmap.scaled(
+                screenshot_tool.new_width,
+                screenshot_tool.new_height,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
     screenshot_tool.label.setPixmap(pixmap)
     screenshot_tool.label.setFixedSize(screenshot_tool.display_width, screenshot_tool.display_height)
     screenshot_tool.label.setAlignment(Qt.AlignCenter)
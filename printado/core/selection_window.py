@@ -1,25 +1,48 @@
 import sys
-import time
 import mss
 from PyQt5.QtWidgets import QApplication, QWidget, QRubberBand, QLabel
 from PyQt5.QtCore import Qt, QRect, QPoint, pyqtSignal
-from PyQt5.QtGui import QScreen
-from PIL import Image
+from PyQt5.QtGui import QScreen, QPainter
+from printado.core.capture import FrozenDesktop, bounding_rect, grab_logical_rect, match_screens
+from printado.core.image_utils import pil_image_to_qpixmap
+from printado.core.capture_scheduler import CaptureScheduler
+
+
+def get_screen_regions(monitors=None):
+    """Map every Qt screen to the mss monitor that shows it."""
+    if monitors is None:
+        with mss.mss() as sct:
+            monitors = sct.monitors[1:]
+    screens = [
+        (geometry.x(), geometry.y(), geometry.width(), geometry.height(), screen.devicePixelRatio())
+        for screen in QApplication.screens()
+        for geometry in (screen.geometry(),)
+    ]
+    return match_screens(screens, monitors)
+
 
 class SelectionWindow(QWidget):
     selection_finished = pyqtSignal(object)
 
-    def __init__(self, main_app):
+    def __init__(self, main_app, frozen_frame=None, freeze=None, show=True):
         super().__init__()
         self.main_app = main_app
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.X11BypassWindowManagerHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet("background: transparent;") 
+
+        # Freeze-frame mode: the desktop was grabbed once before the overlay
+        # opened; it is painted as the background and the selection is cropped
+        # from it instead of grabbing the screen again.
+        self.freeze = frozen_frame is not None if freeze is None else freeze
+        if not self.freeze:
+            self.setAttribute(Qt.WA_TranslucentBackground)
+            self.setStyleSheet("background: transparent;") 
 
         self.screen_rect = self.get_combined_screen_geometry()
         self.setGeometry(self.screen_rect)
+        self.set_frozen_frame(frozen_frame)
 
         self.origin = QPoint()
+        self.capture_scheduler = None
         self.rubberBand = QRubberBand(QRubberBand.Rectangle, self)
 
         self.size_label = QLabel(self)
@@ -32,7 +55,40 @@ class SelectionWindow(QWidget):
         """)
         self.size_label.hide()
 
-        self.show() 
+        if show:
+            self.show()
+
+    def can_reuse(self, frozen_frame):
+        # Translucency is fixed once the native window exists.
+        return (frozen_frame is not None) == self.freeze
+
+    def reset(self, frozen_frame=None):
+        """Prepare a hidden overlay for a new capture."""
+        if self.capture_scheduler is not None:
+            self.capture_scheduler.deleteLater()
+        self.capture_scheduler = None
+        self.origin = QPoint()
+        self.rubberBand.hide()
+        self.rubberBand.setGeometry(QRect())
+        self.size_label.hide()
+        self.screen_rect = self.get_combined_screen_geometry()
+        self.setGeometry(self.screen_rect)
+        self.set_frozen_frame(frozen_frame)
+
+    def set_frozen_frame(self, frozen_frame):
+        """Accept a per-screen ``FrozenDesktop`` or a single image of the whole desktop."""
+        if frozen_frame is not None and not isinstance(frozen_frame, FrozenDesktop):
+            desktop = self.screen_rect
+            frozen_frame = FrozenDesktop.from_image(frozen_frame, (desktop.x(), desktop.y(), desktop.width(), desktop.height()))
+        self.frozen_frame = frozen_frame
+        # One pixmap per screen, painted over that screen's logical geometry;
+        # the device pixel ratio keeps HiDPI screens at native sharpness.
+        self.frozen_pixmaps = []
+        for region, image in (frozen_frame.frames if frozen_frame is not None else ()):
+            pixmap = pil_image_to_qpixmap(image)
+            pixmap.setDevicePixelRatio(max(region.scale))
+            target = QRect(region.x - self.screen_rect.x(), region.y - self.screen_rect.y(), region.width, region.height)
+            self.frozen_pixmaps.append((target, pixmap))
 
     def get_combined_screen_geometry(self):
         screens = QApplication.screens()
@@ -43,6 +99,15 @@ class SelectionWindow(QWidget):
 
         return QRect(x_min, y_min, x_max - x_min, y_max - y_min)
 
+    def paintEvent(self, event):
+        if not self.frozen_pixmaps:
+            return super().paintEvent(event)
+
+        painter = QPainter(self)
+        for target, pixmap in self.frozen_pixmaps:
+            painter.drawPixmap(target, pixmap)
+        painter.end()
+
     def mousePressEvent(self, event):
         self.origin = event.globalPos()
         self.rubberBand.setGeometry(QRect(self.origin, self.origin))
@@ -92,24 +157,59 @@ class SelectionWindow(QWidget):
 
 
     def mouseReleaseEvent(self, event):
-        self.hide()
-        time.sleep(0.2)
-        rect = self.rubberBand.geometry()
-
-        with mss.mss() as sct:
-            if rect.width() > 10 and rect.height() > 10:
-                raw_screenshot = sct.grab({
-                    "left": max(0, rect.x()), 
-                    "top": max(0, rect.y()),
-                    "width": rect.width(),
-                    "height": rect.height()
-                })
-                screenshot = Image.frombytes("RGB", raw_screenshot.size, raw_screenshot.rgb)
-            else:
-                monitor_full = sct.monitors[0]
-                raw_screenshot = sct.grab(monitor_full)
-                screenshot = Image.frombytes("RGB", raw_screenshot.size, raw_screenshot.rgb)
+        if self.frozen_frame is not None:
+            self.hide()
+            self.capture_selection()
+            return
+
+        if self.capture_scheduler is not None:
+            return
+        # Hide without blocking the event loop; grab once the overlay is gone.
+        self.capture_scheduler = CaptureScheduler(self, self.capture_selection, parent=self)
+        self.capture_scheduler.start()
+
+    def capture_selection(self):
+        selection = self.rubberBand.geometry()
+        regions = self.frozen_frame.regions if self.frozen_frame is not None else get_screen_regions()
+        if not regions:
+            # No screen could be mapped to a monitor: there is nothing to grab.
+            self._abort()
+            return
+
+        if selection.width() > 10 and selection.height() > 10:
+            rect = (selection.x(), selection.y(), selection.width(), selection.height())
+        else:
+            # A click without a drag captures the screen under the cursor.
+            rect = self._screen_at(regions, self.origin).logical
+
+        screenshot = self._grab(rect, regions)
+        if screenshot is None:
+            # The selection missed every screen; capture all of them instead.
+            screenshot = self._grab(bounding_rect(regions), regions)
+        self._finish(screenshot)
+
+    def _grab(self, rect, regions):
+        if self.frozen_frame is not None:
+            return self.frozen_frame.crop(rect)
+        return grab_logical_rect(rect, regions)
+
+    @staticmethod
+    def _screen_at(regions, point):
+        for region in regions:
+            if region.contains(point.x(), point.y()):
+                return region
+        return regions[0]
+
+    def _abort(self):
+        """Close without a screenshot, as if the capture was cancelled."""
+        QApplication.restoreOverrideCursor()
+        self.frozen_frame = None
+        self.frozen_pixmaps = []
+        self.close()
+        if hasattr(self.main_app, "close"):
+            self.main_app.close()
 
+    def _finish(self, screenshot):
         # Preferred: emit a signal so the caller controls the flow.
         try:
             self.selection_finished.emit(screenshot)
@@ -122,4 +222,6 @@ class SelectionWindow(QWidget):
                 self.main_app.process_screenshot(screenshot)
         except Exception:
             pass
+        self.frozen_frame = None
+        self.frozen_pixmaps = []
         self.close()
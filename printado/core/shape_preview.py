@@ -0,0 +1,106 @@
+import math
+import time
+
+from PyQt5.QtCore import QPointF, QRect, Qt
+from PyQt5.QtGui import QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QWidget
+
+
+class ShapePreviewOverlay(QWidget):
+    """Transparent layer that draws the shape being dragged at display resolution.
+
+    Nothing is rendered into the PIL image while dragging; the editor commits
+    the annotation on mouse release. ``frame_time_hook``, when set, is called
+    with the duration of every paint in milliseconds.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+        self.kind = None
+        self.start = None
+        self.end = None
+        self.origin = (0, 0)
+        self.color = None
+        self.pen_width = 1
+        self.frame_time_hook = None
+        self.hide()
+
+    def begin(self, kind, start, color, pen_width, origin=(0, 0)):
+        self.setGeometry(self.parentWidget().rect())
+        self.kind = kind
+        self.start = start
+        self.end = start
+        self.color = color
+        self.pen_width = max(1, int(round(pen_width)))
+        self.origin = origin
+        self.show()
+        self.raise_()
+
+    def move_to(self, end):
+        if self.kind is None:
+            return
+        dirty = self._shape_rect()
+        self.end = end
+        # Only repaint what the old and new shapes cover.
+        self.update(dirty.united(self._shape_rect()))
+
+    def finish(self):
+        dirty = self._shape_rect() if self.kind is not None else None
+        self.kind = None
+        self.start = None
+        self.end = None
+        if dirty is not None:
+            self.update(dirty)
+        self.hide()
+
+    def is_active(self):
+        return self.kind is not None
+
+    def _head_size(self):
+        return max(10, self.pen_width * 4)
+
+    def _shape_rect(self):
+        (x1, y1), (x2, y2) = self.start, self.end
+        pad = self.pen_width + 2
+        if self.kind == "arrow":
+            pad += self._head_size()
+        left = min(x1, x2) + self.origin[0] - pad
+        top = min(y1, y2) + self.origin[1] - pad
+        return QRect(left, top, abs(x2 - x1) + 2 * pad + 1, abs(y2 - y1) + 2 * pad + 1)
+
+    def paintEvent(self, event):
+        if self.kind is None:
+            return
+
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(self.origin[0], self.origin[1])
+        painter.setPen(QPen(self.color, self.pen_width, Qt.SolidLine, Qt.FlatCap, Qt.MiterJoin))
+
+        (x1, y1), (x2, y2) = self.start, self.end
+        if self.kind == "rectangle":
+            painter.drawRect(min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1))
+        else:
+            painter.drawLine(x1, y1, x2, y2)
+
+        if self.kind == "arrow" and (x1, y1) != (x2, y2):
+            angle = math.atan2(y2 - y1, x2 - x1)
+            head_size = self._head_size()
+            head = QPolygonF([
+                QPointF(x2, y2),
+                QPointF(x2 - head_size * math.cos(angle - math.pi / 4), y2 - head_size * math.sin(angle - math.pi / 4)),
+                QPointF(x2 - head_size * math.cos(angle + math.pi / 4), y2 - head_size * math.sin(angle + math.pi / 4)),
+            ])
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.color)
+            painter.drawPolygon(head)
+
+        painter.end()
+
+        if self.frame_time_hook is not None:
+            self.frame_time_hook((time.perf_counter() - started) * 1000)
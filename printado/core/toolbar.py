@@ -1,14 +1,54 @@
 from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import Qt
+import weakref
 import qtawesome as qta
-from PIL import ImageStat
+from PIL import Image, ImageStat
 from printado.core.theme import get_theme
 
+# Longest side of the strided sample used to estimate brightness
+BRIGHTNESS_SAMPLE_SIZE = 64
+
+# id(image) -> (weakref to image, brightness); entries go away with the image
+_brightness_cache = {}
+
+
+def _forget_brightness(key, ref):
+    cached = _brightness_cache.get(key)
+    if cached is not None and cached[0] is ref:
+        del _brightness_cache[key]
+
+
+def image_brightness(image):
+    """Mean luminance (0-255) of an image, estimated from a small sample.
+
+    Results are memoized per image object, so images must not be modified in
+    place after being measured (the base screenshot never is).
+    """
+    key = id(image)
+    cached = _brightness_cache.get(key)
+    if cached is not None and cached[0]() is image:
+        return cached[1]
+
+    sample = image
+    if max(image.size) > BRIGHTNESS_SAMPLE_SIZE:
+        scale = BRIGHTNESS_SAMPLE_SIZE / max(image.size)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        sample = image.resize(size, Image.NEAREST)
+    brightness = ImageStat.Stat(sample.convert("L")).mean[0]
+
+    ref = weakref.ref(image, lambda ref, key=key: _forget_brightness(key, ref))
+    _brightness_cache[key] = (ref, brightness)
+    return brightness
+
+
 def is_background_dark(image):
-    grayscale_image = image.convert("L")
-    stat = ImageStat.Stat(grayscale_image)
-    brightness = stat.mean[0]
-    return brightness < 128
+    return image_brightness(image) < 128
+
+
+def is_screenshot_dark(parent):
+    """Theme decision for widgets drawn over a capture, based on its base image."""
+    image = getattr(parent, "base_screenshot", None)
+    return is_background_dark(image) if image is not None else True
 
 def set_active_tool(parent, tool_name):
 
@@ -39,10 +79,9 @@ def set_active_tool(parent, tool_name):
         if hasattr(parent, 'size_slider'):
             parent.size_slider.hide()
 
-    image = getattr(parent, "rendered_screenshot", None) or getattr(parent, "base_screenshot", None)
     update_button_styles(
         parent.toolbar_widget,
-        is_background_dark(image) if image else True,
+        is_screenshot_dark(parent),
         parent.buttons,
         tool_name,
     )
@@ -76,6 +115,7 @@ def update_button_styles(toolbar_widget, is_dark, buttons, active_tool=None):
         "add_rectangle": "fa5s.border-style",
         "adjust_size": "fa5s.arrows-alt-h",
         "undo_last_action": "fa5s.undo",
+        "redo_last_action": "fa5s.redo",
         "upload_screenshot": "fa5s.cloud-upload-alt",
         "save_screenshot": "fa5s.save",
         "quit": "fa5s.times",
@@ -127,6 +167,7 @@ def setup_toolbar_buttons(parent):
         "add_rectangle": ("fa5s.border-style", parent.enable_rectangle_mode, "Adicionar Retângulo"),
         "adjust_size": ("fa5s.arrows-alt-h", parent.enable_size_adjustment, "Ajustar Tamanho/Espessura"),
         "undo_last_action": ("fa5s.undo", parent.undo_last_action, "Desfazer"),
+        "redo_last_action": ("fa5s.redo", parent.redo_last_action, "Refazer"),
         "upload_screenshot": ("fa5s.cloud-upload-alt", parent.upload_screenshot, "Fazer Upload da Captura"),
         "save_screenshot": ("fa5s.save", parent.save_screenshot, "Salvar Captura"),
         "quit": ("fa5s.times", parent.close, "Descartar"),
@@ -151,9 +192,7 @@ def setup_toolbar_buttons(parent):
 
 
 def apply_tooltip_style(parent):
-    image = getattr(parent, "rendered_screenshot", None) or getattr(parent, "base_screenshot", None)
-    is_dark = is_background_dark(image) if image else True
-    theme = get_theme(is_dark)
+    theme = get_theme(is_screenshot_dark(parent))
    
     tooltip_style = f"""
         QToolTip {{
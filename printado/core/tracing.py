@@ -0,0 +1,202 @@
+"""Timing spans for the capture → render → export pipeline.
+
+    with span("render_image", elements=len(elements)):
+        ...
+
+Tracing is off unless ``TRACE_ENABLED`` or ``TRACE_FILE`` is set (or
+``enable()`` is called); a disabled ``span()`` returns a shared no-op
+context manager. When enabled, every span feeds a per-name histogram and
+the most recent spans are kept for ``chrome_trace()``. ``dump()`` writes
+both into one JSON file that chrome://tracing and Perfetto open directly;
+``TRACE_FILE`` does that when the process exits.
+"""
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from printado.config import Config
+
+
+# Upper bounds of the histogram buckets, in milliseconds (the last one is open).
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_enabled = Config.TRACE_ENABLED or bool(Config.TRACE_FILE)
+_lock = threading.Lock()
+_histograms = {}
+_events = deque(maxlen=max(Config.TRACE_EVENT_LIMIT, 0))
+_origin_ns = time.perf_counter_ns()
+
+
+class Histogram:
+    __slots__ = ("count", "total_ms", "min_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of the samples."""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return BUCKETS_MS[index] if index < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": {
+                (f"<={bound}" if index < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): count
+                for index, (bound, count) in enumerate(zip(BUCKETS_MS + (None,), self.buckets))
+                if count
+            },
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("name", "args", "start_ns")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end_ns = time.perf_counter_ns()
+        record(self.name, self.start_ns, end_ns, self.args)
+        return False
+
+
+def span(name, **args):
+    """Time the ``with`` block under ``name``; ``args`` end up in the Chrome trace."""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def record(name, start_ns, end_ns, args=None):
+    ms = (end_ns - start_ns) / 1e6
+    thread = threading.current_thread()
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(ms)
+        _events.append((name, start_ns, end_ns, thread.ident, thread.name, args))
+
+
+def enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _events.clear()
+
+
+def summary():
+    """Histograms by span name."""
+    with _lock:
+        return {name: histogram.as_dict() for name, histogram in sorted(_histograms.items())}
+
+
+def chrome_trace():
+    """The recorded spans as Chrome trace "complete" events (timestamps in µs)."""
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+
+    trace_events = []
+    threads = {}
+    for name, start_ns, end_ns, tid, thread_name, args in events:
+        threads[tid] = thread_name
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start_ns - _origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        trace_events.append(event)
+    for tid, thread_name in threads.items():
+        trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+    return trace_events
+
+
+def dump(path):
+    """Write the histograms and the Chrome trace to ``path`` and return it."""
+    data = {
+        "traceEvents": chrome_trace(),
+        "displayTimeUnit": "ms",
+        "histograms": summary(),
+    }
+    tmp_path = f"{path}.part"
+    with open(tmp_path, "w", encoding="utf-8") as trace_file:
+        json.dump(data, trace_file, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _dump_at_exit():
+    if _histograms:
+        try:
+            dump(Config.TRACE_FILE)
+        except OSError:
+            pass
+
+
+if Config.TRACE_FILE:
+    atexit.register(_dump_at_exit)
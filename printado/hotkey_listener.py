@@ -1,26 +1,25 @@
 from pynput import keyboard
-from printado.core.utils import delete_temp_screenshot
+from printado.ipc import send_command
 import subprocess
 import sys
-import os
 
 
 main_process = None
 pressed_keys = set() 
 
 def run_screenshot_tool():
+    """Ask the resident instance for a capture; start one only if none is running."""
     global main_process
-    script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "main.py"))
+
+    if send_command("hotkey"):
+        return
 
     if main_process is None or main_process.poll() is not None:
-        main_process = subprocess.Popen([sys.executable, script_path])
+        # This process already watches PrintScreen; the tray must not as well.
+        main_process = subprocess.Popen([sys.executable, "-m", "printado", "--capture", "--no-hotkey"])
 
 def stop_screenshot_tool():
-    global main_process
-    if main_process is not None:
-        delete_temp_screenshot()
-        main_process.terminate()
-        main_process = None
+    send_command("cancel")
 
 def on_press(key):
     global pressed_keys
@@ -41,5 +40,6 @@ def on_release(key):
     if key in pressed_keys:
         pressed_keys.remove(key)
 
-with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
-    listener.join()
+if __name__ == "__main__":
+    with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
+        listener.join()
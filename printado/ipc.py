@@ -0,0 +1,84 @@
+"""Single-instance command channel between Printado processes.
+
+The tray listens on a local socket (a Unix domain socket, or a named pipe
+on Windows); other processes, such as the global hotkey listener, send it
+one-line commands instead of starting a new interpreter per capture.
+"""
+import getpass
+import os
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+from printado.core.utils import get_runtime_dir
+
+
+# "hotkey" is a PrintScreen seen by the standalone listener; "capture" is
+# an explicit request (e.g. ``printado --capture`` while the tray runs).
+COMMANDS = ("capture", "hotkey", "cancel", "ping")
+
+
+def server_name() -> str:
+    if os.name == "nt":
+        return f"printado-{getpass.getuser()}"
+    return os.path.join(get_runtime_dir(), f"printado-{getpass.getuser()}.sock")
+
+
+def send_command(command, name=None, timeout_ms=500) -> bool:
+    """Send ``command`` to the running instance; False when none is listening."""
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+
+    try:
+        socket.write(f"{command}\n".encode())
+        if not socket.waitForBytesWritten(timeout_ms):
+            return False
+        while not socket.canReadLine():
+            if not socket.waitForReadyRead(timeout_ms):
+                return False
+        return bytes(socket.readLine()).strip() == b"ok"
+    finally:
+        socket.disconnectFromServer()
+
+
+class CommandServer(QObject):
+    """Receives commands on the local socket and re-emits them on the GUI thread."""
+
+    command_received = pyqtSignal(str)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._accept)
+
+    def listen(self) -> bool:
+        """Start listening; False when another instance already owns the socket."""
+        if send_command("ping", self.name):
+            return False
+        # Nobody answered: whatever is left at the address is stale.
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.server.close()
+
+    def _accept(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self._read(connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def _read(self, connection):
+        while connection.canReadLine():
+            command = bytes(connection.readLine()).decode(errors="replace").strip()
+            if command not in COMMANDS:
+                connection.write(b"unknown\n")
+                continue
+            connection.write(b"ok\n")
+            if command != "ping":
+                self.command_received.emit(command)
+        connection.flush()
@@ -1,5 +1,23 @@
-from .gui import ScreenshotTool
-from .text_format import TextFormat
-from .update_checker import check_for_update
-from .upload import UploadThread
-from .upload_dialog import UploadDialog
+import importlib
+
+# Resolved on first access; see printado/core/__init__.py.
+_EXPORTS = {
+    "ScreenshotTool": ".gui",
+    "TextFormat": ".text_format",
+    "check_for_update": ".update_checker",
+    "UpdateService": ".update_service",
+    "UploadThread": ".upload",
+    "UploadDialog": ".upload_dialog",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
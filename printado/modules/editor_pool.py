@@ -0,0 +1,60 @@
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+from printado.config import Config
+from printado.modules.gui import ScreenshotTool
+
+
+REFILL_DELAY_MS = 500
+
+
+class EditorPool(QObject):
+    """Hidden, pre-built editors kept by the tray between captures.
+
+    Building a ``ScreenshotTool`` (toolbar icons, layouts, the selection
+    overlay) is the slow part of reacting to the hotkey, so it is done
+    ahead of time; closed editors are reset and put back in the pool.
+    """
+
+    def __init__(self, size=None, factory=ScreenshotTool, parent=None):
+        super().__init__(parent)
+        self.size = Config.EDITOR_POOL_SIZE if size is None else size
+        self.factory = factory
+        self.idle = []
+        self.active = set()
+
+    def warm(self):
+        # Editors in use come back when they close; they count towards the size.
+        while len(self.idle) + len(self.active) < self.size:
+            self.idle.append(self._create())
+
+    def acquire(self):
+        """Return a ready editor and start its selection overlay."""
+        editor = self.idle.pop() if self.idle else self._create()
+        self.active.add(editor)
+        editor.start_selection()
+        if len(self.idle) + len(self.active) < self.size:
+            # Refill once the overlay is on screen and idle, not before its first paint.
+            QTimer.singleShot(REFILL_DELAY_MS, self.warm)
+        return editor
+
+    def release(self, editor):
+        if editor not in self.active:
+            return
+        self.active.discard(editor)
+        if len(self.idle) >= self.size:
+            editor.deleteLater()
+            return
+        editor.reset()
+        self.idle.append(editor)
+
+    def clear(self):
+        for editor in self.idle:
+            editor.deleteLater()
+        self.idle = []
+
+    def _create(self):
+        editor = self.factory(start_selection=False)
+        editor.warm_up()
+        # Reset after closeEvent has fully run, not from inside it.
+        editor.closed.connect(lambda editor=editor: self.release(editor), Qt.QueuedConnection)
+        return editor
@@ -12,33 +12,45 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 from PyQt5.QtGui import QColor, QCursor, QIcon, QPixmap
-from PyQt5.QtCore import Qt
-
-from printado.core.event_handler import handle_mouse_press, handle_mouse_release
-from printado.core.image_utils import pil_image_to_png_bytes
+from PyQt5.QtCore import QPoint, Qt, pyqtSignal
+
+from printado.config import Config
+from printado.core.annotations import Arrow, Line, Rectangle, Text
+from printado.core.capture import grab_frozen_desktop
+from printado.core.encoding import preset_extension
+from printado.core.event_handler import handle_mouse_move, handle_mouse_press, handle_mouse_release, image_origin
+from printado.core.history import History
+from printado.core.export import get_export_service
 from printado.core.screenshot_editor import update_screenshot as update_screenshot_core
 from printado.core.screenshot_manager import process_screenshot as process_screenshot_core
-from printado.core.selection_window import SelectionWindow
+from printado.core.selection_window import SelectionWindow, get_screen_regions
+from printado.core.shape_preview import ShapePreviewOverlay
 from printado.core.tool_manager import enable_tool
-from printado.core.toolbar import setup_toolbar_buttons
+from printado.core.toolbar import set_active_tool, setup_toolbar_buttons
 from printado.core.utils import delete_temp_screenshot
 from printado.modules.text_format import TextFormat
 from printado.modules.upload_dialog import UploadDialog
 
 
 class ScreenshotTool(QMainWindow):
-    def __init__(self):
+    closed = pyqtSignal()
+
+    def __init__(self, start_selection=True):
         super().__init__()
         self.blur_background = None
+        self.selector = None
+        self.frozen_frame = None  # desktop grabbed when the capture started (freeze-frame mode)
         self.setWindowTitle("Printado")
 
         # Base image (original capture) and rendered image (base + elements)
         self.base_screenshot = None
         self.rendered_screenshot = None
+        self.renderer = None  # incremental renderer bound to base_screenshot
+        self.preview_screenshot = None  # display-sized proxy of base_screenshot
+        self.preview_renderer = None
 
-        # Elements are stored in base-image coordinates
-        self.elements = []
-        self.history = []  # stack of previous elements snapshots
+        # Annotations (printado.core.annotations) in base-image coordinates
+        self.history = History()  # owns the annotation list, see the elements property
 
         self.selected_color = QColor(Qt.red)
         self.text_format = TextFormat()
@@ -67,7 +79,8 @@ class ScreenshotTool(QMainWindow):
 
         self.initUI()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.start_selection()
+        if start_selection:
+            self.start_selection()
 
     def initUI(self):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
@@ -95,12 +108,70 @@ class ScreenshotTool(QMainWindow):
         container.setLayout(main_layout)
         self.setCentralWidget(container)
 
+        # In-progress arrow/line/rectangle, drawn over the label while dragging
+        self.shape_preview = ShapePreviewOverlay(self)
+
     def start_selection(self):
-        self.selector = SelectionWindow(self)
-        self.selector.selection_finished.connect(self.on_selection_finished)
+        self.frozen_frame = None
+        if Config.FREEZE_FRAME:
+            try:
+                self.frozen_frame = grab_frozen_desktop(get_screen_regions())
+            except Exception:
+                self.frozen_frame = None
+
+        if self.selector is not None and self.selector.can_reuse(self.frozen_frame):
+            self.selector.reset(self.frozen_frame)
+        else:
+            self._create_selector(self.frozen_frame)
         self.selector.showFullScreen()
         QApplication.setOverrideCursor(QCursor(Qt.CrossCursor))
 
+    def _create_selector(self, frozen_frame, freeze=None):
+        if self.selector is not None:
+            self.selector.deleteLater()
+        self.selector = SelectionWindow(self, frozen_frame=frozen_frame, freeze=freeze, show=False)
+        self.selector.selection_finished.connect(self.on_selection_finished)
+
+    def warm_up(self):
+        """Build the (hidden) selection overlay ahead of the first capture."""
+        if self.selector is None:
+            self._create_selector(None, freeze=Config.FREEZE_FRAME)
+
+    def reset(self):
+        """Return a closed editor to its initial state so it can be reused."""
+        self.hide()
+        if self.selector is not None and self.selector.isVisible():
+            # Closed while the user was still selecting.
+            self.selector.hide()
+            QApplication.restoreOverrideCursor()
+        if self.blur_background is not None:
+            self.blur_background.hide_blur()
+            self.blur_background.deleteLater()
+            self.blur_background = None
+        self.frozen_frame = None
+
+        self.base_screenshot = None
+        self.rendered_screenshot = None
+        self.renderer = None
+        self.preview_screenshot = None
+        self.preview_renderer = None
+        self.history.reset()
+
+        set_active_tool(self, None)
+        self.text_position = None
+        if self.text_edit is not None:
+            self.text_edit.deleteLater()
+            self.text_edit = None
+        self.arrow_start = self.arrow_end = None
+        self.line_start = self.line_end = None
+        self.rectangle_start = self.rectangle_end = None
+        if getattr(self, "upload_dialog", None) is not None:
+            self.upload_dialog.deleteLater()
+            self.upload_dialog = None
+
+        self.shape_preview.finish()
+        self.label.clear()
+
     def on_selection_finished(self, screenshot):
         process_screenshot_core(self, screenshot)
         self.update_screenshot()
@@ -108,8 +179,13 @@ class ScreenshotTool(QMainWindow):
     def update_screenshot(self):
         update_screenshot_core(self)
 
-    def _push_history(self):
-        self.history.append(list(self.elements))
+    @property
+    def elements(self):
+        return self.history.elements
+
+    @elements.setter
+    def elements(self, elements):
+        self.history.reset(elements)
 
     def _display_to_base(self, x, y):
         # new_width/new_height are the displayed dimensions; original_width/original_height are base dims
@@ -177,6 +253,9 @@ class ScreenshotTool(QMainWindow):
     def mousePressEvent(self, event):
         handle_mouse_press(self, event)
 
+    def mouseMoveEvent(self, event):
+        handle_mouse_move(self, event)
+
     def mouseReleaseEvent(self, event):
         handle_mouse_release(self, event)
 
@@ -187,10 +266,10 @@ class ScreenshotTool(QMainWindow):
         self.text_edit = QLineEdit(self)
         x, y = self.text_position
 
-        final_x = self.image_offset_x + x
-        final_y = self.image_offset_y + y
+        # Same origin the click was mapped from, so the box opens where the text lands.
+        position = image_origin(self) + QPoint(x, y)
 
-        self.text_edit.setGeometry(final_x, final_y, 200, 30)
+        self.text_edit.setGeometry(position.x(), position.y(), 200, 30)
         self.text_edit.setPlaceholderText("Digite o texto aqui...")
 
         self.text_edit.returnPressed.connect(self.add_text_to_screenshot)
@@ -211,14 +290,17 @@ class ScreenshotTool(QMainWindow):
 
         base_x, base_y = self._display_to_base(self.text_position[0], self.text_position[1])
 
-        self._push_history()
-        self.elements.append(
-            (
-                "text",
+        self.history.add(
+            Text(
                 text_input,
-                (base_x, base_y),
-                self.text_format.get_font(),
-                self.selected_color.name(),
+                base_x,
+                base_y,
+                self.selected_color,
+                self.text_format.font_family,
+                self.text_format.font_size,
+                self.text_format.bold,
+                self.text_format.italic,
+                self.text_format.underline,
             )
         )
 
@@ -233,8 +315,7 @@ class ScreenshotTool(QMainWindow):
         x1, y1 = self._display_to_base(start[0], start[1])
         x2, y2 = self._display_to_base(end[0], end[1])
 
-        self._push_history()
-        self.elements.append(("arrow", (x1, y1, x2, y2), self.tool_size, self.selected_color.name()))
+        self.history.add(Arrow(x1, y1, x2, y2, self.tool_size, self.selected_color))
         self.update_screenshot()
 
     def commit_line(self, start, end):
@@ -244,8 +325,7 @@ class ScreenshotTool(QMainWindow):
         x1, y1 = self._display_to_base(start[0], start[1])
         x2, y2 = self._display_to_base(end[0], end[1])
 
-        self._push_history()
-        self.elements.append(("line", (x1, y1, x2, y2), self.tool_size, self.selected_color.name()))
+        self.history.add(Line(x1, y1, x2, y2, self.tool_size, self.selected_color))
         self.update_screenshot()
 
     def commit_rectangle(self, start, end):
@@ -255,47 +335,44 @@ class ScreenshotTool(QMainWindow):
         x1, y1 = self._display_to_base(start[0], start[1])
         x2, y2 = self._display_to_base(end[0], end[1])
 
-        start_x = min(x1, x2)
-        start_y = min(y1, y2)
-        end_x = max(x1, x2)
-        end_y = max(y1, y2)
-
-        self._push_history()
-        self.elements.append(
-            ("rectangle", (start_x, start_y, end_x, end_y), self.tool_size, self.selected_color.name())
-        )
+        self.history.add(Rectangle(x1, y1, x2, y2, self.tool_size, self.selected_color))
         self.update_screenshot()
 
     def undo_last_action(self):
-        if not self.history:
-            return
-        self.elements = self.history.pop()
-        self.update_screenshot()
+        if self.history.undo():
+            self.update_screenshot()
+
+    def redo_last_action(self):
+        if self.history.redo():
+            self.update_screenshot()
 
     def upload_screenshot(self):
-        if not self.rendered_screenshot:
+        if not self.base_screenshot:
             return
 
-        image_bytes = pil_image_to_png_bytes(self.rendered_screenshot)
+        # Rendering and PNG encoding run on the export pool; the dialog starts
+        # the upload once the bytes are ready.
+        job = get_export_service().encode(self.base_screenshot, self.elements)
         self.upload_dialog = UploadDialog(self)
-        self.upload_dialog.start_upload(image_bytes=image_bytes, filename="printado.png")
+        self.upload_dialog.start_export_upload(job, filename="printado" + preset_extension())
         self.upload_dialog.exec_()
 
     def save_screenshot(self):
         enable_tool(self, "save_screenshot")
-        if not self.rendered_screenshot:
+        if not self.base_screenshot:
             return
 
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Salvar Imagem",
-            "screenshot.png",
-            "PNG Files (*.png);;JPEG Files (*.jpg)",
+            "screenshot" + preset_extension(),
+            "PNG Files (*.png);;WebP Files (*.webp);;JPEG Files (*.jpg)",
         )
         if not filename:
             return
 
-        self.rendered_screenshot.save(filename)
+        # The write finishes in the background; the editor can close right away.
+        get_export_service().save(self.base_screenshot, self.elements, filename)
         delete_temp_screenshot()
         self.close()
 
@@ -307,3 +384,4 @@ class ScreenshotTool(QMainWindow):
         except Exception:
             pass
         super().closeEvent(event)
+        self.closed.emit()
@@ -0,0 +1,107 @@
+import io
+import mimetypes
+import os
+import uuid
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadCancelled(Exception):
+    pass
+
+
+class MultipartStream:
+    """Read-only, seekable ``multipart/form-data`` body with a single file field.
+
+    The payload is either an in-memory buffer, served through a memoryview
+    (never copied into a second full-size body), or a path read from disk
+    chunk by chunk. Every ``read`` reports progress and checks for
+    cancellation; ``seek``/``tell`` let urllib3 rewind the body on retries.
+    """
+
+    def __init__(self, field, filename, data=None, path=None, content_type=None,
+                 on_progress=None, is_cancelled=None):
+        if data is None and path is None:
+            raise ValueError("Nenhuma imagem fornecida para upload.")
+
+        self.boundary = uuid.uuid4().hex
+        content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+        if data is not None:
+            self._payload = memoryview(data).cast("B")
+            self._file = None
+            payload_size = self._payload.nbytes
+        else:
+            self._payload = None
+            self._file = open(path, "rb")
+            payload_size = os.fstat(self._file.fileno()).st_size
+
+        self.len = len(self._head) + payload_size + len(self._tail)
+        self._payload_end = len(self._head) + payload_size
+        self._position = 0
+        self.on_progress = on_progress
+        self.is_cancelled = is_cancelled
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self):
+        return self.len - self._position
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.len
+        self._position = min(max(offset, 0), self.len)
+        return self._position
+
+    def read(self, size=-1):
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise UploadCancelled("Envio cancelado.")
+
+        if size is None or size < 0:
+            size = self.len - self._position
+        chunks = []
+        while size > 0 and self._position < self.len:
+            chunk = self._read_at(self._position, size)
+            self._position += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+
+        if self.on_progress is not None:
+            self.on_progress(self._position, self.len)
+        return b"".join(chunks)
+
+    def _read_at(self, position, size):
+        head_size = len(self._head)
+        if position < head_size:
+            return self._head[position:position + size]
+        if position < self._payload_end:
+            offset = position - head_size
+            size = min(size, self._payload_end - position)
+            if self._payload is not None:
+                return bytes(self._payload[offset:offset + size])
+            self._file.seek(offset)
+            return self._file.read(size)
+        offset = position - self._payload_end
+        return self._tail[offset:offset + size]
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._payload is not None:
+            self._payload.release()
+            self._payload = None
@@ -1,29 +1,24 @@
 import sys
-import requests
 import webbrowser
 from PyQt5.QtWidgets import QDialog, QLabel, QVBoxLayout, QPushButton, QHBoxLayout, QWidget
 from PyQt5.QtCore import Qt, QTimer
 import qtawesome as qta
-from printado.config import Config
 from printado.core.theme import get_theme
 
 from printado.version import __version__
-from printado.core.toolbar import is_background_dark
+from printado.core.toolbar import is_screenshot_dark
 from printado.core.versioning import is_version_newer
+from printado.modules.update_service import fetch_latest_version
 
 
-def _update_url() -> str:
-    base = (Config.BASE_URL or "").strip()
-    if not base:
-        base = "https://printado.com.br/"
-    base = base.rstrip("/") + "/"
-    return f"{base}latest_version.json"
-
 def check_for_update(parent):
+    """Synchronous check; answered from the on-disk cache while it is fresh.
+
+    The tray app uses UpdateService instead, which runs off the GUI thread.
+    """
     try:
-        response = requests.get(_update_url(), timeout=5)
-        if response.status_code == 200:
-            data = response.json()
+        data = fetch_latest_version()
+        if data:
             latest_version = data.get("latest_version", __version__)
             download_url = data.get("download_url", "")
             changelog = data.get("changelog", [])
@@ -39,9 +34,7 @@ class UpdateDialog(QDialog):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Popup | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        image = getattr(parent, "rendered_screenshot", None) or getattr(parent, "base_screenshot", None)
-        is_dark = is_background_dark(image) if image else True
-        theme = get_theme(is_dark)
+        theme = get_theme(is_screenshot_dark(parent))
 
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -0,0 +1,158 @@
+import json
+import os
+import time
+
+import requests
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from printado.config import Config
+from printado.core.utils import get_runtime_dir
+from printado.core.versioning import is_version_newer
+from printado.version import __version__
+
+
+def _update_url() -> str:
+    base = (Config.BASE_URL or "").strip()
+    if not base:
+        base = "https://printado.com.br/"
+    base = base.rstrip("/") + "/"
+    return f"{base}latest_version.json"
+
+
+def get_update_cache_path() -> str:
+    return os.path.join(get_runtime_dir(), "latest_version.json")
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        if isinstance(cache, dict) and isinstance(cache.get("data"), dict):
+            return cache
+    except Exception:
+        pass
+    return None
+
+
+def _save_cache(cache_path, cache):
+    try:
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+
+
+def fetch_latest_version(url=None, cache_path=None, ttl=None, timeout=5, now=None):
+    """Return the latest_version.json payload, hitting the network at most once per ``ttl`` seconds.
+
+    The response is cached on disk together with its ETag/Last-Modified
+    headers so a later refresh can be answered with 304 Not Modified.
+    Returns None when nothing is known yet and the server is unreachable.
+    """
+    url = url or _update_url()
+    cache_path = cache_path or get_update_cache_path()
+    ttl = Config.UPDATE_CHECK_INTERVAL if ttl is None else ttl
+    now = time.time() if now is None else now
+
+    cache = _load_cache(cache_path)
+    if cache and cache.get("url") == url and 0 <= now - cache.get("checked_at", 0) < ttl:
+        return cache["data"]
+
+    headers = {}
+    if cache and cache.get("url") == url:
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+    except requests.exceptions.RequestException:
+        return cache["data"] if cache else None
+
+    if response.status_code == 304 and cache:
+        cache["checked_at"] = now
+        _save_cache(cache_path, cache)
+        return cache["data"]
+
+    if response.status_code != 200:
+        return cache["data"] if cache else None
+
+    try:
+        data = response.json()
+    except Exception:
+        return cache["data"] if cache else None
+
+    _save_cache(cache_path, {
+        "url": url,
+        "checked_at": now,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "data": data,
+    })
+    return data
+
+
+class UpdateCheckThread(QThread):
+    check_finished = pyqtSignal(object)
+
+    def __init__(self, url=None, cache_path=None, ttl=None):
+        super().__init__()
+        self.url = url
+        self.cache_path = cache_path
+        self.ttl = ttl
+
+    def run(self):
+        try:
+            data = fetch_latest_version(self.url, self.cache_path, self.ttl)
+        except Exception:
+            data = None
+        self.check_finished.emit(data)
+
+
+class UpdateService(QObject):
+    """Checks for new versions in the background, at most once per interval."""
+
+    update_available = pyqtSignal(str, str, list)
+
+    def __init__(self, parent=None, url=None, cache_path=None, interval=None):
+        super().__init__(parent)
+        self.url = url
+        self.cache_path = cache_path
+        self.interval = Config.UPDATE_CHECK_INTERVAL if interval is None else interval
+        self.thread = None
+        self.notified_version = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+
+    def start(self):
+        self.check()
+        if self.interval > 0:
+            self.timer.start(self.interval * 1000)
+
+    def stop(self):
+        self.timer.stop()
+
+    def check(self):
+        if self.thread is not None and self.thread.isRunning():
+            return
+
+        self.thread = UpdateCheckThread(self.url, self.cache_path, self.interval)
+        self.thread.check_finished.connect(self._on_check_finished)
+        self.thread.start()
+
+    def _on_check_finished(self, data):
+        if not isinstance(data, dict):
+            return
+
+        latest_version = str(data.get("latest_version", __version__))
+        if not is_version_newer(latest_version, str(__version__)):
+            return
+        if latest_version == self.notified_version:
+            return
+
+        self.notified_version = latest_version
+        self.update_available.emit(latest_version, data.get("download_url", ""), list(data.get("changelog", [])))
@@ -1,37 +1,63 @@
-import io
+import os
+import threading
 import requests
 from PyQt5.QtCore import QThread, pyqtSignal
-from printado.config import Config
+from printado.modules.multipart import MultipartStream, UploadCancelled
+from printado.modules.upload_client import RETRY_STATUS_CODES, get_upload_client
 
 class UploadThread(QThread):
     upload_finished = pyqtSignal(str)
+    upload_progress = pyqtSignal(int, int)
+    upload_queued = pyqtSignal(str)
 
-    def __init__(self, filepath=None, image_bytes=None, filename="screenshot.png"):
+    def __init__(self, filepath=None, image_bytes=None, filename="screenshot.png", client=None, queue=None):
         super().__init__()
+        self.client = client
+        self.queue = queue
         self.filepath = filepath
         self.image_bytes = image_bytes
         self.filename = filename
+        self.cancel_event = threading.Event()
+        self._reported_percent = -1
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _report_progress(self, sent, total):
+        percent = sent * 100 // total if total else 100
+        if percent != self._reported_percent:
+            self._reported_percent = percent
+            self.upload_progress.emit(sent, total)
+
+    def _fail(self, message, retryable=False):
+        """Report a failure; images that may go through later are spooled instead."""
+        if retryable and self.queue is not None:
+            try:
+                self.queue.enqueue(self.filename, data=self.image_bytes, path=self.filepath or None)
+            except Exception as e:
+                print(f"❌ Falha ao guardar o envio na fila: {e}")
+            else:
+                self.upload_queued.emit(message)
+                return
+        self.upload_finished.emit(message)
 
     def run(self):
         try:
-            headers = {"X-API-KEY": Config.API_KEY}
-
-            if self.image_bytes is not None:
-                file_obj = io.BytesIO(self.image_bytes)
-                files = {"image": (self.filename, file_obj, "image/png")}
-            elif self.filepath:
-                file_obj = open(self.filepath, "rb")
-                files = {"image": file_obj}
-            else:
-                raise ValueError("Nenhuma imagem fornecida para upload.")
+            client = self.client or get_upload_client()
+
+            body = MultipartStream(
+                "image",
+                self.filename if self.image_bytes is not None else os.path.basename(self.filepath or ""),
+                data=self.image_bytes,
+                path=self.filepath or None,
+                on_progress=self._report_progress,
+                is_cancelled=self.cancel_event.is_set,
+            )
 
             try:
-                response = requests.post(Config.UPLOAD_URL, files=files, headers=headers, timeout=10)
+                response = client.upload(body)
             finally:
-                try:
-                    file_obj.close()
-                except Exception:
-                    pass
+                body.close()
 
             status_code = response.status_code
             response_text = response.text
@@ -51,16 +77,22 @@ class UploadThread(QThread):
 
             else:
                 print(f"❌ Erro HTTP {status_code}: {response_text}")
-                self.upload_finished.emit(f"Erro {status_code}: {response_text}")
+                self._fail(f"Erro {status_code}: {response_text}", retryable=status_code in RETRY_STATUS_CODES)
+
+        except UploadCancelled:
+            self.upload_finished.emit("Erro: Envio cancelado.")
 
         except requests.exceptions.Timeout:
-            self.upload_finished.emit("Erro: O servidor demorou muito para responder.")
+            self._fail("Erro: O servidor demorou muito para responder.", retryable=True)
 
         except requests.exceptions.ConnectionError:
-            self.upload_finished.emit("Erro de conexão: O servidor está indisponível.")
+            self._fail("Erro de conexão: O servidor está indisponível.", retryable=True)
 
         except requests.exceptions.RequestException as e:
             self.upload_finished.emit(f"Erro de rede: {str(e)}")
 
         except Exception as e:
             self.upload_finished.emit(f"Erro desconhecido: {str(e)}")
+
+        finally:
+            self.image_bytes = None
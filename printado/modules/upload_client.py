@@ -0,0 +1,73 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from printado.config import Config
+from printado.core.tracing import span
+
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class UploadClient:
+    """Long-lived HTTP client shared by every upload in the process.
+
+    A single ``requests.Session`` keeps connections to the upload server
+    alive between captures (no new DNS/TCP/TLS handshake per upload) and
+    retries connection errors and 5xx answers with exponential backoff.
+    """
+
+    def __init__(self, pool_size=None, retries=None, backoff=None, timeout=None):
+        self.timeout = Config.UPLOAD_TIMEOUT if timeout is None else timeout
+
+        retry = Retry(
+            total=Config.UPLOAD_RETRIES if retries is None else retries,
+            backoff_factor=Config.UPLOAD_BACKOFF if backoff is None else backoff,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        pool_size = pool_size or Config.UPLOAD_POOL_SIZE
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def upload(self, body, url=None, headers=None, timeout=None):
+        """POST a ``MultipartStream`` body; it is streamed, never buffered whole."""
+        request_headers = {"X-API-KEY": Config.API_KEY, "Content-Type": body.content_type}
+        request_headers.update(headers or {})
+        with span("upload", bytes=len(body)):
+            return self.session.post(
+                url or Config.UPLOAD_URL,
+                data=body,
+                headers=request_headers,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+
+    def close(self):
+        self.session.close()
+
+
+_upload_client = None
+_upload_client_lock = threading.Lock()
+
+
+def get_upload_client():
+    """Process-wide upload client (owned by the tray app when it is running)."""
+    global _upload_client
+    with _upload_client_lock:
+        if _upload_client is None:
+            _upload_client = UploadClient()
+        return _upload_client
+
+
+def close_upload_client():
+    global _upload_client
+    with _upload_client_lock:
+        if _upload_client is not None:
+            _upload_client.close()
+            _upload_client = None
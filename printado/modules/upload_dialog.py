@@ -1,10 +1,12 @@
-from PyQt5.QtWidgets import QLabel, QVBoxLayout, QPushButton, QDialog, QHBoxLayout, QWidget, QApplication
+from PyQt5.QtWidgets import QLabel, QVBoxLayout, QPushButton, QDialog, QHBoxLayout, QWidget
 from PyQt5.QtCore import Qt
 import webbrowser
 import pyperclip
 import qtawesome as qta
+from printado.config import Config
 from printado.modules.upload import UploadThread
-from printado.core.toolbar import is_background_dark
+from printado.modules.upload_queue import get_upload_queue
+from printado.core.toolbar import is_screenshot_dark
 from printado.core.utils import delete_temp_screenshot
 from printado.core.theme import get_theme
 
@@ -15,9 +17,7 @@ class UploadDialog(QDialog):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Popup)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        image = getattr(parent, "rendered_screenshot", None) or getattr(parent, "base_screenshot", None)
-        is_dark = is_background_dark(image) if image else True
-        theme = get_theme(is_dark)
+        theme = get_theme(is_screenshot_dark(parent))
 
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -69,26 +69,91 @@ class UploadDialog(QDialog):
         """)
         self.open_button.hide()
 
+        self.cancel_button = QPushButton(qta.icon("fa5s.times", color=theme['button_color_reverse']), " Cancelar")
+        self.cancel_button.clicked.connect(self.cancel_upload)
+        self.cancel_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: rgba({theme['button_bg_reverse']}, 0.7);
+                color: {theme['button_color_reverse']};
+                border-radius: 5px;
+                padding: 6px;
+            }}
+            QPushButton:hover {{
+                background-color: rgba({theme['button_bg_reverse']}, 0.4);
+            }}
+        """)
+        self.cancel_button.hide()
+
         self.button_layout.addWidget(self.copy_button)
         self.button_layout.addWidget(self.open_button)
+        self.button_layout.addWidget(self.cancel_button)
         self.container_layout.addLayout(self.button_layout)
 
         self.setFixedSize(320, 100)
 
+        self.upload_thread = None
+        self.export_job = None
+
     def start_upload(self, filepath=None, image_bytes=None, filename="screenshot.png"):
         self.loading_label.setText("🔄 Enviando a imagem, aguarde...")
         self.loading_label.show()
         self.copy_button.hide()
         self.open_button.hide()
+        self.cancel_button.show()
 
-        self.upload_thread = UploadThread(filepath=filepath, image_bytes=image_bytes, filename=filename)
+        queue = get_upload_queue() if Config.UPLOAD_QUEUE_ENABLED else None
+        self.upload_thread = UploadThread(filepath=filepath, image_bytes=image_bytes, filename=filename, queue=queue)
         self.upload_thread.upload_finished.connect(self.upload_complete)
+        self.upload_thread.upload_queued.connect(self.upload_queued)
+        self.upload_thread.upload_progress.connect(self.upload_progress)
         self.upload_thread.start()
 
         self.show()
 
+    def start_export_upload(self, job, filename="screenshot.png"):
+        self.loading_label.setText("🔄 Preparando a imagem...")
+        self.loading_label.show()
+        self.copy_button.hide()
+        self.open_button.hide()
+
+        self.export_job = job
+        job.progress.connect(self.export_progress)
+        job.finished.connect(lambda image_bytes: self.export_ready(image_bytes, filename))
+        job.failed.connect(lambda error: self.upload_complete(f"Erro ao preparar a imagem: {error}"))
+
+        self.show()
+
+    def export_progress(self, percent):
+        if percent < 100:
+            self.loading_label.setText(f"🔄 Preparando a imagem... {percent}%")
+
+    def export_ready(self, image_bytes, filename):
+        # Hand the only copy of the encoded image to the upload thread.
+        self.export_job.result = None
+        self.export_job = None
+        self.start_upload(image_bytes=image_bytes, filename=filename)
+
+    def upload_progress(self, sent, total):
+        percent = sent * 100 // total if total else 100
+        self.loading_label.setText(f"🔄 Enviando a imagem... {percent}%")
+
+    def cancel_upload(self):
+        if self.upload_thread is not None and self.upload_thread.isRunning():
+            self.upload_thread.cancel()
+
+    def closeEvent(self, event):
+        self.cancel_upload()
+        super().closeEvent(event)
+
+    def upload_queued(self, reason):
+        self.cancel_button.hide()
+        self.loading_label.setWordWrap(True)
+        self.loading_label.setText(f"📥 {reason}\nA imagem será enviada automaticamente.")
+        self.loading_label.show()
+
     def upload_complete(self, url):
         self.loading_label.hide()
+        self.cancel_button.hide()
 
         if url.startswith("Erro"):
             self.loading_label.setText(f"❌ {url}")
@@ -104,9 +169,15 @@ class UploadDialog(QDialog):
         pyperclip.copy(self.uploaded_url)
         self.copy_button.setText("✅ Copiado!")
         delete_temp_screenshot()
-        QApplication.quit()
+        self.close_with_editor()
 
     def open_in_browser(self):
         webbrowser.open_new_tab(self.uploaded_url)
         delete_temp_screenshot()
-        QApplication.quit()
+        self.close_with_editor()
+
+    def close_with_editor(self):
+        # Only this capture is done; the tray (and its other windows) keep running.
+        self.close()
+        if self.parent() is not None:
+            self.parent().close()
@@ -0,0 +1,275 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+import requests
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from printado.config import Config
+from printado.core.utils import get_runtime_dir
+from printado.modules.multipart import MultipartStream
+from printado.modules.upload_client import RETRY_STATUS_CODES, get_upload_client
+
+
+def get_spool_dir() -> str:
+    path = os.path.join(get_runtime_dir(), "spool")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class SpoolEntry:
+    __slots__ = ("id", "path", "filename", "created", "attempts", "next_attempt", "error")
+
+    def __init__(self, entry_id, path, filename, created):
+        self.id = entry_id
+        self.path = path
+        self.filename = filename
+        self.created = created
+        self.attempts = 0
+        self.next_attempt = created
+        self.error = None
+
+
+class UploadQueue(QObject):
+    """Durable queue of uploads that failed because the server was unreachable.
+
+    Encoded images are spooled next to an append-only ``index.jsonl``; the
+    index is the only state, so captures queued by any Printado process are
+    picked up by the tray's worker, and survive restarts. Failed attempts are
+    retried with exponential backoff, with at most ``concurrency`` uploads
+    in flight.
+    """
+
+    uploaded = pyqtSignal(str, str)
+    dropped = pyqtSignal(str, str)
+    pending_changed = pyqtSignal(int)
+
+    def __init__(self, spool_dir=None, client=None, concurrency=None, backoff=None,
+                 max_backoff=None, max_attempts=None, poll_interval=None, parent=None):
+        super().__init__(parent)
+        self.spool_dir = spool_dir or get_spool_dir()
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self.index_path = os.path.join(self.spool_dir, "index.jsonl")
+        self.client = client
+        self.backoff = Config.UPLOAD_QUEUE_BACKOFF if backoff is None else backoff
+        self.max_backoff = Config.UPLOAD_QUEUE_MAX_BACKOFF if max_backoff is None else max_backoff
+        self.max_attempts = max_attempts or Config.UPLOAD_QUEUE_MAX_ATTEMPTS
+        self.poll_interval = Config.UPLOAD_QUEUE_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.semaphore = threading.BoundedSemaphore(concurrency or Config.UPLOAD_QUEUE_CONCURRENCY)
+
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._in_flight = set()
+        self._workers = []
+        self._thread = None
+
+    # -- spool -------------------------------------------------------------
+
+    def enqueue(self, filename, data=None, path=None):
+        """Spool ``data`` (or a copy of the file at ``path``) and return the entry id."""
+        entry_id = uuid.uuid4().hex
+        spool_path = os.path.join(self.spool_dir, entry_id + os.path.splitext(filename)[1])
+        tmp_path = spool_path + ".part"
+        if data is not None:
+            with open(tmp_path, "wb") as spool_file:
+                spool_file.write(data)
+        else:
+            shutil.copyfile(path, tmp_path)
+
+        # Record first: the entry only becomes visible once its file exists.
+        self._append({"op": "add", "id": entry_id, "file": os.path.basename(spool_path),
+                      "filename": filename, "created": time.time()})
+        os.replace(tmp_path, spool_path)
+        self._wake.set()
+        self.pending_changed.emit(len(self.pending()))
+        return entry_id
+
+    def pending(self):
+        """Replay the index into the entries that still have to be uploaded."""
+        entries = {}
+        known = set()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                for line in index_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crashed process
+                    entry_id = record.get("id")
+                    if record.get("op") == "add":
+                        entries[entry_id] = SpoolEntry(
+                            entry_id, os.path.join(self.spool_dir, record["file"]),
+                            record["filename"], record["created"],
+                        )
+                    elif record.get("op") == "retry" and entry_id in entries:
+                        entries[entry_id].attempts = record["attempts"]
+                        entries[entry_id].next_attempt = record["next_attempt"]
+                        entries[entry_id].error = record.get("error")
+                    elif record.get("op") in ("done", "drop"):
+                        entries.pop(entry_id, None)
+                    known.add(record.get("file") or entry_id)
+        except FileNotFoundError:
+            pass
+
+        # Images whose "add" record was lost (e.g. the index was compacted
+        # while another process was enqueuing) are adopted, not dropped.
+        for name in os.listdir(self.spool_dir):
+            entry_id, extension = os.path.splitext(name)
+            path = os.path.join(self.spool_dir, name)
+            if name in known or entry_id in known or extension in (".part", ".jsonl") or not os.path.isfile(path):
+                continue
+            entries[entry_id] = SpoolEntry(entry_id, path, "printado" + extension, os.path.getmtime(path))
+            self._append({"op": "add", "id": entry_id, "file": name,
+                          "filename": entries[entry_id].filename, "created": entries[entry_id].created})
+
+        return [entry for entry in entries.values() if os.path.exists(entry.path)]
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                index_file.write(line)
+
+    def _compact(self):
+        """Drop the index once nothing is pending, so it does not grow forever."""
+        with self._lock:
+            if self._in_flight or self.pending():
+                return
+            try:
+                os.remove(self.index_path)
+            except FileNotFoundError:
+                pass
+
+    # -- worker ------------------------------------------------------------
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="printado-upload-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.join(timeout)
+
+    def wake(self):
+        self._wake.set()
+
+    def retry_delay(self, attempts):
+        return min(self.max_backoff, self.backoff * 2 ** max(attempts - 1, 0))
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.clear()
+            now = time.time()
+            next_due = now + self.poll_interval
+            for entry in self.pending():
+                with self._lock:
+                    if entry.id in self._in_flight:
+                        continue
+                if entry.next_attempt > now:
+                    next_due = min(next_due, entry.next_attempt)
+                    continue
+                if not self._acquire_slot():
+                    return
+                worker = threading.Thread(target=self._upload, args=(entry,), daemon=True)
+                with self._lock:
+                    self._in_flight.add(entry.id)
+                    self._workers = [thread for thread in self._workers if thread.is_alive()] + [worker]
+                worker.start()
+            self._wake.wait(max(next_due - time.time(), 0))
+
+    def _acquire_slot(self):
+        while not self.semaphore.acquire(timeout=0.1):
+            if self._stopping.is_set():
+                return False
+        return True
+
+    def _upload(self, entry):
+        outcome = None
+        try:
+            link, error, retryable = self._send(entry)
+            if link:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+                self._append({"op": "done", "id": entry.id, "link": link})
+                outcome = (self.uploaded, entry.id, link)
+            elif retryable and entry.attempts + 1 < self.max_attempts:
+                attempts = entry.attempts + 1
+                self._append({"op": "retry", "id": entry.id, "attempts": attempts,
+                              "next_attempt": time.time() + self.retry_delay(attempts), "error": error})
+            else:
+                # Keep the image around; only the queue gives up on it.
+                failed_path = self._move_to_failed(entry)
+                self._append({"op": "drop", "id": entry.id, "error": error})
+                outcome = (self.dropped, failed_path, error)
+        finally:
+            with self._lock:
+                self._in_flight.discard(entry.id)
+            self.semaphore.release()
+            self._compact()
+            self._wake.set()
+
+        self.pending_changed.emit(len(self.pending()))
+        if outcome is not None:
+            signal, *args = outcome
+            signal.emit(*args)
+
+    def _move_to_failed(self, entry):
+        failed_dir = os.path.join(self.spool_dir, "failed")
+        os.makedirs(failed_dir, exist_ok=True)
+        failed_path = os.path.join(failed_dir, os.path.basename(entry.path))
+        try:
+            os.replace(entry.path, failed_path)
+        except OSError:
+            return entry.path
+        return failed_path
+
+    def _send(self, entry):
+        """Upload one entry; returns ``(link, error, retryable)``."""
+        client = self.client or get_upload_client()
+        try:
+            body = MultipartStream("image", entry.filename, path=entry.path)
+            try:
+                response = client.upload(body)
+            finally:
+                body.close()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            return None, str(e), True
+        except Exception as e:
+            return None, str(e), False
+
+        if response.status_code == 200:
+            try:
+                link = response.json().get("link", "")
+            except ValueError:
+                link = ""
+            if link:
+                return link, None, False
+            return None, "Resposta do servidor não contém um link válido.", False
+        return None, f"Erro {response.status_code}: {response.text}", response.status_code in RETRY_STATUS_CODES
+
+
+_upload_queue = None
+
+
+def get_upload_queue():
+    """Process-wide upload queue; only the tray app starts its worker."""
+    global _upload_queue
+    if _upload_queue is None:
+        _upload_queue = UploadQueue()
+    return _upload_queue
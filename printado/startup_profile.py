@@ -0,0 +1,71 @@
+"""Where the tray's startup time goes.
+
+    python -m printado --profile-startup
+
+Imports ``printado.tray`` in a fresh interpreter with ``-X importtime``
+and prints the slowest modules, the same numbers Python reports but
+sorted and summed.
+"""
+import os
+import subprocess
+import sys
+
+
+# Import time budget for printado.tray, checked by tests/test_startup.py.
+STARTUP_IMPORT_BUDGET_MS = 500
+
+# Modules that must only be imported after the tray icon is on screen.
+DEFERRED_MODULES = (
+    "requests",
+    "mss",
+    "pynput",
+    "qtawesome",
+    "PIL.ImageFilter",
+    "printado.modules.gui",
+    "printado.modules.upload_dialog",
+    "printado.core.screenshot_editor",
+)
+
+
+def parse_importtime(output):
+    """Parse ``-X importtime`` lines into ``(module, self_us, cumulative_us)`` rows."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_imports(module="printado.tray"):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def format_report(rows, module="printado.tray", top=25):
+    lines = [f"{'cumulativo (ms)':>16}{'próprio (ms)':>14}  módulo"]
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:>16.1f}{self_us / 1000:>14.1f}  {name}")
+
+    total = next((row[2] for row in rows if row[0] == module), sum(row[1] for row in rows))
+    lines.append("")
+    lines.append(f"Importar {module}: {total / 1000:.1f} ms (orçamento: {STARTUP_IMPORT_BUDGET_MS} ms)")
+    loaded = {row[0] for row in rows}
+    early = [name for name in DEFERRED_MODULES if name in loaded]
+    if early:
+        lines.append("Carregados antes do ícone (deveriam ser adiados): " + ", ".join(early))
+    return "\n".join(lines)
+
+
+def main():
+    print(format_report(measure_imports()))
+    return 0
@@ -1,18 +1,34 @@
 import os
 import sys
 import threading
+import time
+import webbrowser
 
-from PyQt5.QtCore import QCoreApplication, QTimer
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction, QApplication, QMenu, QSystemTrayIcon
-from pynput import keyboard
 
-from printado.modules.gui import ScreenshotTool
+from printado.config import Config
+from printado.ipc import CommandServer, send_command
+
+# The editor, Pillow, requests, mss, qtawesome and pynput are imported by the
+# start_* functions below, after the tray icon is already on screen.
 
 
 tray = None
 menu = None
 current_tool = None
+editor_pool = None
+command_server = None
+update_service = None
+hotkey_relay = None
+message_link = None
+
+
+class HotkeyRelay(QObject):
+    """Carries hotkey presses from pynput's thread to the Qt event loop."""
+
+    triggered = pyqtSignal()
 
 
 def _resolve_app_icon() -> QIcon:
@@ -29,40 +45,168 @@ def _resolve_app_icon() -> QIcon:
     return QIcon()
 
 
+def show_message(text, icon=QSystemTrayIcon.Information, msecs=5000, link=None):
+    """Show a tray balloon; clicking it opens ``link`` only if this message has one."""
+    global message_link
+    if tray is None:
+        return
+    message_link = link
+    tray.showMessage("Printado", text, icon, msecs)
+
+
+def on_message_clicked():
+    if message_link:
+        webbrowser.open_new_tab(message_link)
+
+
 def start_capture():
     """Open the capture tool."""
     global current_tool
 
     try:
-        if current_tool is not None:
-            current_tool.close()
+        cancel_capture()
     except Exception:
         pass
 
-    current_tool = ScreenshotTool()
+    if editor_pool is not None:
+        current_tool = editor_pool.acquire()
+    else:
+        from printado.modules.gui import ScreenshotTool
+
+        current_tool = ScreenshotTool()
+
+
+def cancel_capture():
+    """Close the capture in progress, if any."""
+    # Pooled editors that were already closed are idle and must stay untouched.
+    if current_tool is not None and (editor_pool is None or current_tool in editor_pool.active):
+        current_tool.close()
+
+
+def handle_command(command: str):
+    if command == "capture":
+        start_capture()
+    elif command == "hotkey":
+        # With its own listener the tray already saw this key press.
+        if hotkey_relay is None:
+            start_capture()
+    elif command == "cancel":
+        cancel_capture()
+
+
+def start_command_server(app: QApplication) -> bool:
+    """Accept capture/cancel commands from other processes (e.g. hotkey_listener)."""
+    global command_server
+
+    command_server = CommandServer(parent=app)
+    if not command_server.listen():
+        return False
+    command_server.command_received.connect(handle_command)
+    app.aboutToQuit.connect(command_server.close)
+    return True
+
+
+def start_editor_pool(app: QApplication):
+    """Build the editor before the first PrintScreen instead of on it."""
+    global editor_pool
+    from printado.modules.editor_pool import EditorPool
+
+    editor_pool = EditorPool(parent=app)
+    QTimer.singleShot(0, editor_pool.warm)
+
+
+def dump_trace():
+    """Write the timings collected so far (histograms + Chrome trace) and say where."""
+    from printado.core import tracing
+    from printado.core.utils import get_runtime_dir
+
+    path = Config.TRACE_FILE or os.path.join(get_runtime_dir(), time.strftime("trace-%Y%m%d-%H%M%S.json"))
+    try:
+        tracing.dump(path)
+    except OSError as e:
+        show_message(f"Falha ao salvar as medições: {e}", QSystemTrayIcon.Warning)
+        return
+    show_message(f"Medições de desempenho salvas em {path}")
 
 
 def create_tray(app: QApplication):
     global tray, menu
+    from printado.core import tracing
 
     tray = QSystemTrayIcon(_resolve_app_icon(), app)
     tray.setToolTip("Printado - Captura de tela")
 
     menu = QMenu()
-    capture_action = QAction("Capturar tela")
-    quit_action = QAction("Sair")
+    capture_action = QAction("Capturar tela", menu)
+    quit_action = QAction("Sair", menu)
 
     capture_action.triggered.connect(start_capture)
     quit_action.triggered.connect(QCoreApplication.quit)
 
     menu.addAction(capture_action)
+    if tracing.enabled():
+        trace_action = QAction("Salvar medições de desempenho", menu)
+        trace_action.triggered.connect(dump_trace)
+        menu.addAction(trace_action)
     menu.addSeparator()
     menu.addAction(quit_action)
 
     tray.setContextMenu(menu)
+    tray.messageClicked.connect(on_message_clicked)
     tray.show()
 
 
+def start_update_service(app: QApplication):
+    """Check for updates in the background, never on the capture path."""
+    global update_service
+    from printado.modules.update_checker import notify_update
+    from printado.modules.update_service import UpdateService
+
+    update_service = UpdateService(app)
+    update_service.update_available.connect(
+        lambda latest_version, download_url, changelog: notify_update(
+            current_tool, latest_version, download_url, changelog
+        )
+    )
+    update_service.start()
+
+
+def start_export_notifications():
+    """Report saves that finish after the editor has already closed."""
+    from printado.core.export import get_export_service
+
+    service = get_export_service()
+
+    def on_finished(job):
+        if isinstance(job.result, str):
+            show_message(f"Captura salva em {job.result}", msecs=3000)
+
+    def on_failed(job, error):
+        show_message(f"Falha ao salvar a captura: {error}", QSystemTrayIcon.Warning)
+
+    service.job_finished.connect(on_finished)
+    service.job_failed.connect(on_failed)
+
+
+def start_upload_queue(app: QApplication):
+    """Retry spooled uploads in the background and report the resulting links."""
+    from printado.modules.upload_queue import get_upload_queue
+
+    queue = get_upload_queue()
+
+    def on_uploaded(_entry_id, link):
+        show_message(f"Captura enviada: {link}", link=link)
+
+    def on_dropped(path, error):
+        show_message(f"Não foi possível enviar a captura ({error}). Ela está em {path}",
+                     QSystemTrayIcon.Warning, 8000)
+
+    queue.uploaded.connect(on_uploaded)
+    queue.dropped.connect(on_dropped)
+    app.aboutToQuit.connect(lambda: queue.stop(timeout=1))
+    queue.start()
+
+
 def start_hotkey_listener():
     """Global hotkey PrintScreen.
 
@@ -70,12 +214,19 @@ def start_hotkey_listener():
     screenshot shortcut. If it does not trigger, disable/rebind the system
     PrintScreen shortcut in Keyboard settings.
     """
+    global hotkey_relay
+    from pynput import keyboard
+
+    # pynput calls back on its own (non-Qt) thread: emitting a signal of an
+    # object living on the GUI thread queues the call to start_capture there.
+    hotkey_relay = HotkeyRelay()
+    hotkey_relay.triggered.connect(start_capture)
 
     def listener_thread():
         def on_press(key):
             try:
                 if key == keyboard.Key.print_screen:
-                    QTimer.singleShot(0, start_capture)
+                    hotkey_relay.triggered.emit()
             except Exception:
                 pass
 
@@ -89,12 +240,53 @@ def start_hotkey_listener():
     thread.start()
 
 
+def start_font_index():
+    """Ask fontconfig for the installed fonts off the GUI thread, before the first text annotation."""
+    from printado.core.fonts import load_font_index
+
+    threading.Thread(target=load_font_index, name="printado-fonts", daemon=True).start()
+
+
+def start_upload_client(app: QApplication):
+    """One pooled HTTP session for every upload made while the tray is running."""
+    from printado.modules.upload_client import close_upload_client, get_upload_client
+
+    get_upload_client()
+    app.aboutToQuit.connect(close_upload_client)
+
+
+def start_background_services(app: QApplication, capture_on_start=False, hotkey=True):
+    if hotkey:
+        start_hotkey_listener()
+    if capture_on_start:
+        start_capture()
+    start_font_index()
+    start_editor_pool(app)
+    start_export_notifications()
+    start_update_service(app)
+    start_upload_client(app)
+    if Config.UPLOAD_QUEUE_ENABLED:
+        start_upload_queue(app)
+
+
 def main():
+    capture_on_start = "--capture" in sys.argv[1:]
+    # Started by printado.hotkey_listener, which watches PrintScreen itself.
+    hotkey = "--no-hotkey" not in sys.argv[1:]
     app = QApplication(sys.argv)
+
+    # Already running: hand the request over instead of starting a second tray.
+    if send_command("capture" if capture_on_start else "ping"):
+        sys.exit(0)
+
     app.setQuitOnLastWindowClosed(False)
 
+    if not start_command_server(app):
+        print("⚠️ Não foi possível abrir o canal de comandos do Printado.")
     create_tray(app)
-    start_hotkey_listener()
+
+    # Everything else starts once the event loop runs and the icon is visible.
+    QTimer.singleShot(0, lambda: start_background_services(app, capture_on_start, hotkey))
 
     sys.exit(app.exec_())
 
@@ -30,6 +30,8 @@ setup(
     author_email="felipe@feharo.com.br",
     url="https://github.com/Feharo-Tech/Printado",
     packages=find_packages(),
+    # Annotations, encoder presets and screen regions are slotted dataclasses.
+    python_requires=">=3.10",
     install_requires=_read_requirements(),
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -2,3 +2,24 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Widget tests run without a display server.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+from tests.http_stub import StubServer
+
+
+@pytest.fixture
+def http_server():
+    """``http_server(respond, path)`` starts a StubServer that is stopped after the test."""
+    servers = []
+
+    def start(respond, path="/"):
+        servers.append(StubServer(respond, path).start())
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.stop()
@@ -0,0 +1,76 @@
+"""Local HTTP stand-in for the upload and update servers.
+
+Used by the ``http_server`` fixture in conftest.py and by the benchmarks.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+
+class StubServer:
+    """HTTP/1.1 server on 127.0.0.1 whose replies come from ``respond(request)``.
+
+    ``request`` has ``method``, ``path``, ``headers`` and ``body``; ``respond``
+    returns ``(status, body)`` or ``(status, body, headers)``, where a dict or
+    list body is sent as JSON. Requests are kept in ``requests`` unless
+    ``record`` is false; those whose body was cut short (the client gave up)
+    get no reply and are not recorded.
+    """
+
+    def __init__(self, respond, path="/", record=True):
+        self.respond = respond
+        self.record = record
+        self.requests = []
+        self.connections = set()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}{path}"
+        self._thread = None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1  # headers and body in one send, or Nagle adds ~40 ms per reply
+
+            def do_GET(self):
+                self._handle()
+
+            def do_POST(self):
+                self._handle()
+
+            def _handle(self):
+                stub.connections.add(self.client_address)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if len(body) < length:
+                    return
+
+                request = SimpleNamespace(method=self.command, path=self.path, headers=dict(self.headers), body=body)
+                if stub.record:
+                    stub.requests.append(request)
+                status, payload, *headers = stub.respond(request)
+                if isinstance(payload, (dict, list)):
+                    payload = json.dumps(payload).encode()
+
+                self.send_response(status)
+                for name, value in (headers[0] if headers else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,58 @@
+import pytest
+from PIL import Image
+from PyQt5.QtGui import QColor
+
+from printado.core.annotations import Arrow, Line, Rectangle, Text, annotation_from_dict, dumps, loads, parse_color
+from printado.core.screenshot_editor import render_image
+
+
+def test_colors_are_parsed_once():
+    assert parse_color("#ff8000") == (255, 128, 0, 255)
+    assert parse_color((1, 2, 3)) == (1, 2, 3, 255)
+    assert parse_color(QColor(10, 20, 30, 40)) == (10, 20, 30, 40)
+    assert Line(0, 0, 1, 1, 2, "red").rgba == (255, 0, 0, 255)
+
+
+def test_annotations_are_slotted_and_immutable():
+    line = Line(0, 0, 10, 10, 3, "#000000")
+    assert not hasattr(line, "__dict__")
+    with pytest.raises(AttributeError):
+        line.x1 = 5
+
+
+def test_rectangle_is_normalized():
+    assert Rectangle(50, 40, 10, 20, 2, "#000000").points == (10, 20, 50, 40)
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Arrow(20, 30, 180, 90, 6, "#ff0000"),
+        Line(190, 10, 15, 110, 9, "#00ff00"),
+        Rectangle(40, 20, 150, 100, 4, "#0000ff"),
+        Text("Printado", 30, 40, "#ffffff", "Arial", 24, bold=True, underline=True),
+    ],
+)
+def test_bbox_covers_drawn_pixels(annotation):
+    blank = Image.new("RGB", (400, 300))
+    drawn = render_image(blank, [annotation.scaled(1, 1)])
+    changed = Image.eval(drawn, lambda v: 255 if v else 0).getbbox()
+
+    left, top, right, bottom = annotation.bbox
+    assert left <= changed[0] and top <= changed[1]
+    assert changed[2] <= right and changed[3] <= bottom
+
+
+def test_json_roundtrip():
+    annotations = [
+        Arrow(1, 2, 3, 4, 5, "#ff0000"),
+        Line(5, 6, 7, 8, 2, (0, 0, 255, 128)),
+        Rectangle(9, 10, 11, 12, 1, "#00ff00"),
+        Text("Olá", 13, 14, "#000000", "DejaVu Sans", 12, italic=True),
+    ]
+    assert loads(dumps(annotations)) == annotations
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        annotation_from_dict({"kind": "circle"})
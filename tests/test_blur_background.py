@@ -0,0 +1,54 @@
+import threading
+
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+from printado.core.blur_background import BlurBackground, blur_frame
+
+
+def _desktop(width=640, height=360):
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    noise = Image.effect_noise((width, height), 40).convert("RGB")
+    return Image.blend(image, noise, 0.3)
+
+
+def test_blur_frame_downscales():
+    assert blur_frame(_desktop(), downscale=4).size == (160, 90)
+    assert blur_frame(_desktop(), downscale=1).size == (640, 360)
+
+
+def test_downscaled_blur_matches_full_blur():
+    frame = _desktop()
+    full = frame.filter(ImageFilter.GaussianBlur(radius=15))
+    approx = blur_frame(frame, downscale=4).resize(frame.size, Image.BILINEAR)
+
+    diff = ImageStat.Stat(ImageChops.difference(full, approx)).mean
+    assert max(diff) < 3
+
+
+def test_blur_background_fades_in_without_grabbing(qtbot):
+    blur = BlurBackground(frame=_desktop())
+    qtbot.addWidget(blur)
+    assert blur.frame is None
+
+    blur.show_blur()
+    with qtbot.waitSignal(blur.blur_applied, timeout=5000):
+        pass
+
+    assert not blur.pixmap().isNull()
+    assert blur.opacity_effect.opacity() == 1.0
+
+
+def test_desktop_is_grabbed_before_the_worker_starts(qtbot, monkeypatch):
+    grabs = []
+
+    def grab():
+        grabs.append(threading.current_thread())
+        return _desktop()
+
+    monkeypatch.setattr("printado.core.blur_background.ImageGrab.grab", grab)
+    blur = BlurBackground()
+    qtbot.addWidget(blur)
+
+    assert grabs == [threading.main_thread()]
+    with qtbot.waitSignal(blur.blur_applied, timeout=5000):
+        blur.show_blur()
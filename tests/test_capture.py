@@ -0,0 +1,92 @@
+import random
+
+from mss.screenshot import ScreenShot
+from PIL import Image
+
+from printado.core.capture import (
+    CAPTURE_BACKENDS, FrozenDesktop, compose_logical_rect, match_screens, screenshot_to_image,
+)
+
+
+def _fake_screenshot(width=13, height=7, seed=0):
+    rng = random.Random(seed)
+    data = bytearray(rng.randrange(256) for _ in range(width * height * 4))
+    return ScreenShot.from_size(data, width, height)
+
+
+def test_backends_produce_identical_images():
+    raw = _fake_screenshot()
+    images = [convert(raw) for convert in CAPTURE_BACKENDS.values()]
+
+    for image in images:
+        assert image.mode == "RGB"
+        assert image.size == (13, 7)
+        assert image.tobytes() == images[0].tobytes()
+
+
+def test_buffer_backend_maps_bgra_to_rgb():
+    raw = ScreenShot.from_size(bytearray([10, 20, 30, 255]), 1, 1)
+    assert screenshot_to_image(raw, "buffer").getpixel((0, 0)) == (30, 20, 10)
+
+
+def test_image_does_not_alias_capture_buffer():
+    raw = _fake_screenshot(seed=1)
+    image = screenshot_to_image(raw, "buffer")
+    before = image.tobytes()
+
+    raw.raw[:] = bytes(len(raw.raw))
+    assert image.tobytes() == before
+
+
+def test_unknown_backend_falls_back_to_buffer():
+    raw = _fake_screenshot(seed=2)
+    assert screenshot_to_image(raw, "nope").tobytes() == screenshot_to_image(raw, "rgb").tobytes()
+
+
+# A 1080p screen at 100% next to a 4K screen at 200%: 3200x1080 logical pixels.
+SCREENS = [(0, 0, 1920, 1080, 1.0), (1920, 0, 1920, 1080, 2.0)]
+MONITORS = [
+    {"left": 1920, "top": 0, "width": 3840, "height": 2160},
+    {"left": 0, "top": 0, "width": 1920, "height": 1080},
+]
+
+
+def test_screens_are_matched_to_monitors_by_physical_size():
+    standard, hidpi = match_screens(SCREENS, MONITORS)
+
+    assert standard.monitor == (0, 0, 1920, 1080)
+    assert hidpi.monitor == (1920, 0, 3840, 2160)
+    assert hidpi.scale == (2.0, 2.0)
+    assert hidpi.physical_box((2000, 100, 50, 25)) == (1920 + 160, 200, 1920 + 260, 250)
+
+
+def test_single_screen_selection_grabs_only_that_screen():
+    regions = match_screens(SCREENS, MONITORS)
+    calls = []
+
+    def grab(region, box):
+        calls.append((region.monitor, box))
+        return Image.new("RGB", (box[2] - box[0], box[3] - box[1]))
+
+    image = compose_logical_rect((2000, 100, 50, 25), regions, grab)
+
+    assert calls == [((1920, 0, 3840, 2160), (2080, 200, 2180, 250))]
+    assert image.size == (100, 50)  # native 4K pixels, not logical ones
+
+
+def test_frozen_desktop_spanning_mixed_dpi_screens():
+    regions = match_screens(SCREENS, MONITORS)
+    desktop = FrozenDesktop([
+        (regions[0], Image.new("RGB", (1920, 1080), (255, 0, 0))),
+        (regions[1], Image.new("RGB", (3840, 2160), (0, 0, 255))),
+    ])
+
+    image = desktop.crop((1900, 0, 40, 10))
+    assert image.size == (80, 20)  # composed at the highest ratio
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+    assert image.getpixel((79, 19)) == (0, 0, 255)
+
+    composite = desktop.composite()
+    assert composite.size == (3840, 1080)
+    assert composite.getpixel((1919, 0)) == (255, 0, 0)
+    assert composite.getpixel((1920, 0)) == (0, 0, 255)
@@ -0,0 +1,54 @@
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget
+
+from printado.core.capture_scheduler import CaptureScheduler
+
+
+def _shown_widget(qtbot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.resize(200, 200)
+    widget.show()
+    qtbot.waitExposed(widget)
+    return widget
+
+
+def test_capture_runs_once_overlay_is_hidden(qtbot):
+    widget = _shown_widget(qtbot)
+    calls = []
+    scheduler = CaptureScheduler(widget, lambda: calls.append(widget.isVisible()), settle_ms=0)
+
+    with qtbot.waitSignal(scheduler.ready, timeout=1000):
+        scheduler.start()
+
+    assert calls == [False]
+    assert not scheduler.timed_out
+    assert scheduler.latency_ms < 100
+
+
+def test_event_loop_keeps_running_while_waiting(qtbot):
+    widget = _shown_widget(qtbot)
+    ticks = []
+    ticker = QTimer()
+    ticker.timeout.connect(lambda: ticks.append(1))
+    ticker.start(1)
+
+    scheduler = CaptureScheduler(widget, settle_ms=30)
+    with qtbot.waitSignal(scheduler.ready, timeout=1000):
+        scheduler.start()
+    ticker.stop()
+
+    assert ticks
+    assert 30 <= scheduler.latency_ms < 200
+
+
+def test_timeout_bounds_wait(qtbot):
+    widget = _shown_widget(qtbot)
+    scheduler = CaptureScheduler(widget, timeout_ms=50, settle_ms=0)
+    scheduler.is_hidden = lambda: False
+
+    with qtbot.waitSignal(scheduler.ready, timeout=1000):
+        scheduler.start()
+
+    assert scheduler.timed_out
+    assert 50 <= scheduler.latency_ms < 200
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from PIL import Image, ImageChops
+
+from printado.cli import main
+from printado.core.annotations import Arrow, Rectangle, dumps
+from printado.core.screenshot_editor import render_image
+
+
+ELEMENTS = [Rectangle(10, 10, 120, 90, 3, "#ff0000"), Arrow(150, 100, 20, 20, 4, "#0000ff")]
+
+
+def _inputs(tmp_path, count=3):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"captura{index}.png"
+        Image.new("RGB", (200, 150), (40 * index, 120, 200)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def _results(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_annotate_in_parallel_streams_json_lines(tmp_path, capsys):
+    spec = tmp_path / "anotacoes.json"
+    spec.write_text(dumps(ELEMENTS))
+    inputs = _inputs(tmp_path)
+
+    assert main(["annotate", str(spec), *inputs, "-o", str(tmp_path / "saida"), "--jobs", "2"]) == 0
+
+    results = _results(capsys)
+    assert sorted(result["input"] for result in results) == sorted(inputs)
+    for result in results:
+        assert result["ok"] and result["command"] == "annotate"
+        expected = render_image(Image.open(result["input"]).convert("RGB"), ELEMENTS)
+        assert ImageChops.difference(Image.open(result["output"]).convert("RGB"), expected).getbbox() is None
+
+
+def test_export_reports_failures_per_input(tmp_path, capsys):
+    inputs = _inputs(tmp_path, count=1) + [str(tmp_path / "inexistente.png")]
+
+    assert main(["export", *inputs, "-o", str(tmp_path / "saida"), "--preset", "webp", "--jobs", "1"]) == 1
+
+    ok, failed = _results(capsys)
+    assert ok["ok"] and ok["output"].endswith("captura0.webp")
+    assert not failed["ok"] and failed["error"]
+
+
+def test_export_refuses_inputs_that_share_an_output(tmp_path, capsys):
+    first, second = tmp_path / "a", tmp_path / "b"
+    for folder in (first, second):
+        folder.mkdir()
+        Image.new("RGB", (20, 20)).save(folder / "captura.png")
+    output_dir = tmp_path / "saida"
+
+    with pytest.raises(SystemExit) as excinfo:
+        main(["export", str(first / "captura.png"), str(second / "captura.png"), "-o", str(output_dir)])
+
+    assert excinfo.value.code == 2
+    assert "mesmo arquivo de saída" in capsys.readouterr().err
+    assert not output_dir.exists()
+
+
+def test_capture_failure_is_reported_as_json(tmp_path, capsys, monkeypatch):
+    import mss
+
+    def broken():
+        raise mss.exception.ScreenShotError("sem tela")
+
+    monkeypatch.setattr(mss, "mss", broken)
+
+    assert main(["capture", "-o", str(tmp_path / "tela.png")]) == 1
+
+    (result,) = _results(capsys)
+    assert result["command"] == "capture" and result["input"] == "screen"
+    assert not result["ok"] and "sem tela" in result["error"]
@@ -0,0 +1,82 @@
+from PIL import Image
+
+from printado.modules.editor_pool import EditorPool
+
+
+def _capture(editor, qtbot):
+    editor.selector.hide()
+    editor.on_selection_finished(Image.new("RGB", (640, 360), "white"))
+    editor.commit_arrow((10, 10), (200, 100))
+    editor.close()
+    qtbot.waitUntil(lambda: len(editor.elements) == 0)
+
+
+def test_closed_editor_is_reset_and_reused(qtbot, monkeypatch):
+    monkeypatch.setattr("printado.config.Config.FREEZE_FRAME", False)
+    pool = EditorPool(size=1)
+    pool.warm()
+    warm_editor = pool.idle[0]
+    selector = warm_editor.selector
+    assert not warm_editor.isVisible() and not selector.isVisible()
+
+    editor = pool.acquire()
+    assert editor is warm_editor
+    assert editor.selector is selector and selector.isVisible()
+    assert pool.idle == []  # the editor in use comes back, nothing is rebuilt
+
+    selector.hide()
+    editor.on_selection_finished(Image.new("RGB", (640, 360), "white"))
+    editor.commit_arrow((10, 10), (200, 100))
+    assert len(editor.elements) == 1
+
+    editor.close()
+    qtbot.waitUntil(lambda: editor not in pool.active)
+    assert editor.base_screenshot is None
+    assert editor.elements == [] and not editor.history.can_undo()
+    assert editor.blur_background is None
+    assert pool.idle == [editor]
+    pool.clear()
+
+
+def test_consecutive_captures_share_one_editor(qtbot, monkeypatch):
+    monkeypatch.setattr("printado.config.Config.FREEZE_FRAME", False)
+    created = []
+
+    def factory(**kwargs):
+        from printado.modules.gui import ScreenshotTool
+
+        editor = ScreenshotTool(**kwargs)
+        created.append(editor)
+        return editor
+
+    pool = EditorPool(size=1, factory=factory)
+    pool.warm()
+
+    first = pool.acquire()
+    qtbot.wait(600)  # the user is still annotating when a refill would have run
+    _capture(first, qtbot)
+    qtbot.waitUntil(lambda: first in pool.idle)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(created) == 1
+    pool.clear()
+
+
+def test_editor_returned_to_a_full_pool_is_dropped(qtbot, monkeypatch):
+    monkeypatch.setattr("printado.config.Config.FREEZE_FRAME", False)
+    pool = EditorPool(size=1)
+    pool.warm()
+    first = pool.acquire()
+    first.close()  # cancelled; its release is queued
+    second = pool.acquire()  # built on demand while the first is still out
+    qtbot.waitUntil(lambda: first in pool.idle)
+
+    resets = []
+    monkeypatch.setattr(second, "reset", lambda: resets.append(second))
+    second.close()
+    qtbot.waitUntil(lambda: second not in pool.active)
+
+    assert pool.idle == [first]
+    assert resets == []
+    pool.clear()
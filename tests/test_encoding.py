@@ -0,0 +1,59 @@
+import io
+import os
+
+import pytest
+from PIL import Image, ImageChops
+
+from printado.core.encoding import (
+    EXPORT_PRESETS,
+    encode_image,
+    format_for_filename,
+    get_preset,
+    preset_extension,
+    to_palette,
+)
+
+CAPTURES_DIR = os.path.join(os.path.dirname(__file__), "data", "captures")
+
+
+def _captures():
+    for name in sorted(os.listdir(CAPTURES_DIR)):
+        yield name, Image.open(os.path.join(CAPTURES_DIR, name)).convert("RGB")
+
+
+@pytest.mark.parametrize("preset", sorted(EXPORT_PRESETS))
+def test_presets_are_lossless(preset):
+    for name, image in _captures():
+        decoded = Image.open(io.BytesIO(encode_image(image, preset=preset))).convert("RGB")
+        assert ImageChops.difference(decoded, image).getbbox() is None, name
+
+
+def test_palette_only_for_few_colors():
+    flat = Image.new("RGB", (64, 64), "#336699")
+    assert to_palette(flat).mode == "P"
+
+    noisy = Image.merge("RGB", [Image.effect_noise((64, 64), 80) for _ in range(3)])
+    assert to_palette(noisy) is None
+
+
+def test_small_preset_beats_default_png():
+    for name, image in _captures():
+        default = io.BytesIO()
+        image.save(default, format="PNG")
+        assert len(encode_image(image, preset="small")) <= len(default.getvalue()), name
+
+
+def test_format_follows_filename():
+    assert format_for_filename("captura.webp") == "WEBP"
+    assert format_for_filename("captura.JPG") == "JPEG"
+    assert format_for_filename("captura") == "PNG"
+
+    image = Image.new("RGB", (8, 8), "white")
+    assert encode_image(image, preset="balanced", format="WEBP")[8:12] == b"WEBP"
+
+
+def test_unknown_preset_is_rejected():
+    assert preset_extension("webp") == ".webp"
+    assert get_preset(EXPORT_PRESETS["fast"]).name == "fast"
+    with pytest.raises(ValueError):
+        get_preset("ultra")
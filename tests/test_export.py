@@ -0,0 +1,78 @@
+import io
+
+from PIL import Image, ImageChops
+
+from printado.core.annotations import Arrow, Rectangle
+from printado.core.export import ExportService
+from printado.core.screenshot_editor import render_image
+
+
+def _capture():
+    return Image.linear_gradient("L").resize((320, 200)).convert("RGB")
+
+
+ELEMENTS = [
+    Rectangle(10, 10, 120, 90, 3, "#ff0000"),
+    Arrow(200, 150, 40, 30, 4, "#00ff00"),
+]
+
+
+def test_save_writes_rendered_image(qtbot, tmp_path):
+    service = ExportService(max_workers=1)
+    target = tmp_path / "capture.png"
+    progress = []
+
+    job = service.save(_capture(), ELEMENTS, str(target))
+    job.progress.connect(progress.append)
+    with qtbot.waitSignal(job.finished, timeout=5000) as blocker:
+        pass
+
+    assert blocker.args == [str(target)]
+    saved = Image.open(target).convert("RGB")
+    assert ImageChops.difference(saved, render_image(_capture(), ELEMENTS)).getbbox() is None
+    assert not list(tmp_path.glob(".*.part"))
+    qtbot.waitUntil(lambda: len(progress) > 0 and progress[-1] == 100)
+    assert progress == sorted(progress)
+    service.shutdown()
+
+
+def test_snapshot_is_isolated_from_later_edits(qtbot):
+    service = ExportService(max_workers=1)
+    elements = list(ELEMENTS)
+
+    job = service.encode(_capture(), elements, preset="fast")
+    elements.clear()
+    with qtbot.waitSignal(job.finished, timeout=5000) as blocker:
+        pass
+
+    encoded = Image.open(io.BytesIO(blocker.args[0])).convert("RGB")
+    assert ImageChops.difference(encoded, render_image(_capture(), ELEMENTS)).getbbox() is None
+    service.shutdown()
+
+
+def test_failure_is_reported(qtbot, tmp_path):
+    service = ExportService(max_workers=1)
+    target = tmp_path / "missing" / "capture.png"
+
+    job = service.save(_capture(), ELEMENTS, str(target))
+    with qtbot.waitSignals([job.failed, service.job_failed], timeout=5000):
+        pass
+
+    assert job.error
+    assert not service.jobs
+    service.shutdown()
+
+
+def test_job_that_finishes_before_callers_connect_is_still_delivered(qtbot):
+    service = ExportService(max_workers=1)
+
+    job = service.submit("Rápido", lambda job: "pronto")
+    job.wait(5)  # the worker emits before anything is connected
+    finished = []
+    service.job_finished.connect(finished.append)
+    with qtbot.waitSignal(job.finished, timeout=1000) as blocker:
+        pass
+
+    assert blocker.args == ["pronto"]
+    assert finished == [job] and not service.jobs
+    service.shutdown()
@@ -0,0 +1,97 @@
+import subprocess
+
+import pytest
+
+from printado.core import fonts
+from printado.core.fonts import clear_font_cache, font_cache_info, get_pil_font, resolve_font_path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_font_cache()
+    yield
+    clear_font_cache()
+
+
+def test_fonts_are_loaded_once_per_key():
+    first = get_pil_font("Arial", 18)
+    second = get_pil_font("Arial", 18)
+    bold = get_pil_font("Arial", 18, bold=True)
+
+    assert first is second
+    assert bold is not first
+
+    info = font_cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+
+
+def test_fallback_without_fontconfig(monkeypatch):
+    monkeypatch.setattr(fonts.shutil, "which", lambda name: None)
+
+    assert resolve_font_path("Arial", bold=True).endswith("DejaVuSans-Bold.ttf")
+    assert resolve_font_path("Arial", italic=True).endswith("DejaVuSans-Oblique.ttf")
+
+
+def _fake_fontconfig(monkeypatch, fc_list="", fc_match=None):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        if args[0].endswith("fc-list"):
+            stdout = fc_list
+        else:
+            stdout = (fc_match or {}).get(args[-1], "")
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(fonts.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(fonts.subprocess, "run", fake_run)
+    return calls
+
+
+def test_families_resolved_from_one_fc_list(monkeypatch):
+    calls = _fake_fontconfig(monkeypatch, fc_list=(
+        "Family,Family Alt\t80\t0\t/fonts/Family-Regular.ttf\n"
+        "Family\t210\t0\t/fonts/Family-Black.ttf\n"
+        "Family\t200\t0\t/fonts/Family-Bold.ttf\n"
+        "Family\t80\t100\t/fonts/Family-Italic.ttf\n"
+        "Variable\t[0 210]\t0\t/fonts/Variable.ttf\n"
+        "Arial\t80\t0\t/fonts/Arial.ttf\n"
+    ))
+
+    assert resolve_font_path("Family") == "/fonts/Family-Regular.ttf"
+    assert resolve_font_path("family alt") == "/fonts/Family-Regular.ttf"
+    assert resolve_font_path("Family", bold=True) == "/fonts/Family-Bold.ttf"
+    assert resolve_font_path("Family", bold=True, italic=True) == "/fonts/Family-Bold.ttf"
+    assert resolve_font_path("Family", italic=True) == "/fonts/Family-Italic.ttf"
+    assert resolve_font_path("Variable", bold=True) == "/fonts/Variable.ttf"
+    assert resolve_font_path("Missing").endswith("DejaVuSans.ttf")
+    assert [args[0] for args in calls] == ["/usr/bin/fc-list"]
+
+
+def test_aliased_default_family_uses_fc_match_once(monkeypatch):
+    calls = _fake_fontconfig(monkeypatch, fc_match={
+        "Arial": "/fonts/LiberationSans-Regular.ttf",
+        "Arial:bold": "/fonts/LiberationSans-Bold.ttf",
+    })
+
+    assert resolve_font_path("Arial") == "/fonts/LiberationSans-Regular.ttf"
+    assert resolve_font_path("Arial", bold=True) == "/fonts/LiberationSans-Bold.ttf"
+    assert resolve_font_path("Arial", bold=True, italic=True) == "/fonts/LiberationSans-Bold.ttf"
+    assert len(calls) == 5  # fc-list, then fc-match for each style, all while loading the index
+
+
+def test_font_cache_size_is_read_on_first_use(monkeypatch):
+    monkeypatch.setattr(fonts.Config, "FONT_CACHE_SIZE", 1)
+    clear_font_cache()
+
+    get_pil_font("Arial", 12)
+    get_pil_font("Arial", 14)
+
+    assert font_cache_info()["max_size"] == 1
+    assert font_cache_info()["size"] == 1
+
+
+def test_unloadable_font_falls_back_to_default(monkeypatch):
+    monkeypatch.setattr(fonts, "resolve_font_path", lambda *args: "/nonexistent.ttf")
+    assert get_pil_font("Missing", 12) is not None
@@ -0,0 +1,113 @@
+import random
+
+from PIL import Image
+
+from printado.core.annotations import Line, Rectangle
+from printado.core.history import History
+from printado.core.renderer import AnnotationRenderer
+from printado.core.screenshot_editor import render_image
+
+
+def _annotation(rng):
+    kind = rng.choice([Line, Rectangle])
+    return kind(*(rng.randint(0, 200) for _ in range(4)), rng.randint(1, 8), rng.choice(["#ff0000", "#0000ff"]))
+
+
+def test_long_session_matches_snapshot_reference():
+    rng = random.Random(0)
+    history = History(max_depth=0)
+
+    # Reference implementation: full snapshots, as the editor used to keep.
+    current, undo_stack, redo_stack = [], [], []
+
+    for _ in range(5000):
+        choice = rng.random()
+        if choice < 0.55 or not current:
+            undo_stack.append(list(current))
+            redo_stack.clear()
+            if choice < 0.35 or not current:
+                index = rng.randint(0, len(current))
+                annotation = _annotation(rng)
+                history.add(annotation, index=index)
+                current.insert(index, annotation)
+            elif choice < 0.45:
+                index = rng.randrange(len(current))
+                history.remove(index)
+                del current[index]
+            else:
+                index = rng.randrange(len(current))
+                annotation = _annotation(rng)
+                history.modify(index, annotation)
+                current[index] = annotation
+        elif choice < 0.8:
+            assert history.undo() == bool(undo_stack)
+            if undo_stack:
+                redo_stack.append(current)
+                current = undo_stack.pop()
+        else:
+            assert history.redo() == bool(redo_stack)
+            if redo_stack:
+                undo_stack.append(current)
+                current = redo_stack.pop()
+
+        assert history.elements == current
+
+
+def test_undo_redo_roundtrip():
+    history = History()
+    a, b = Line(0, 0, 1, 1, 1, "#000000"), Line(2, 2, 3, 3, 1, "#000000")
+    history.add(a)
+    history.add(b)
+
+    assert history.undo() and history.elements == [a]
+    assert history.redo() and history.elements == [a, b]
+    assert not history.redo()
+
+    history.undo()
+    history.add(Line(4, 4, 5, 5, 1, "#000000"))
+    assert not history.can_redo()
+
+
+def test_depth_is_bounded():
+    history = History(max_depth=10)
+    for i in range(1000):
+        history.add(Line(i, 0, i, 10, 1, "#000000"))
+
+    undone = 0
+    while history.undo():
+        undone += 1
+
+    assert undone == 10
+    assert len(history.elements) == 990
+
+
+def test_reset_clears_stacks_and_keeps_list_identity():
+    history = History()
+    elements = history.elements
+    history.add(Line(0, 0, 1, 1, 1, "#000000"))
+    history.reset()
+
+    assert history.elements is elements
+    assert history.elements == [] and not history.can_undo()
+
+
+def test_renderer_replays_from_checkpoint():
+    base = Image.new("RGB", (220, 220), (40, 40, 40))
+    rng = random.Random(1)
+    history = History()
+    renderer = AnnotationRenderer(base, checkpoint_interval=10, checkpoint_limit=3)
+
+    for _ in range(45):
+        history.add(_annotation(rng))
+        renderer.render(history.elements)
+
+    drawn = []
+    original_append = renderer._append
+    renderer._append = lambda elements: (drawn.extend(elements), original_append(elements))
+
+    # Editing a late element is not a tail change: replay from the checkpoint at 40.
+    history.modify(42, _annotation(rng))
+    result = renderer.render(history.elements)
+
+    assert len(drawn) == 5
+    assert result.tobytes() == render_image(base, history.elements).tobytes()
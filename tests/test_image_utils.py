@@ -0,0 +1,82 @@
+import gc
+
+from PIL import Image
+from PyQt5.QtGui import QImage
+
+from printado.core.image_utils import pil_image_to_png_bytes, pil_image_to_qimage, pil_image_to_qpixmap
+
+
+def _pixels(pil_image):
+    return [pil_image.getpixel((x, y)) for y in range(pil_image.height) for x in range(pil_image.width)]
+
+
+def _qimage_pixels(qimage, alpha=False):
+    pixels = []
+    for y in range(qimage.height()):
+        for x in range(qimage.width()):
+            color = qimage.pixelColor(x, y)
+            rgb = (color.red(), color.green(), color.blue())
+            pixels.append(rgb + (color.alpha(),) if alpha else rgb)
+    return pixels
+
+
+def _gradient(mode, size=(7, 5)):
+    image = Image.new("RGBA", size)
+    for y in range(size[1]):
+        for x in range(size[0]):
+            image.putpixel((x, y), (x * 30, y * 40, (x + y) * 10, 255))
+    return image.convert(mode)
+
+
+def test_rgb_is_wrapped_without_alpha():
+    image = _gradient("RGB")
+    qimage = pil_image_to_qimage(image)
+
+    assert not qimage.hasAlphaChannel()
+    assert _qimage_pixels(qimage) == _pixels(image)
+
+
+def test_rgba_keeps_alpha():
+    image = _gradient("RGBA")
+    image.putpixel((0, 0), (10, 20, 30, 0))
+    qimage = pil_image_to_qimage(image)
+
+    assert qimage.hasAlphaChannel()
+    assert qimage.pixelColor(0, 0).alpha() == 0
+    assert _qimage_pixels(qimage, alpha=True)[1:] == _pixels(image)[1:]
+
+
+def test_grayscale_odd_width_uses_explicit_stride():
+    image = _gradient("L", size=(5, 3))
+    qimage = pil_image_to_qimage(image)
+
+    assert qimage.format() == QImage.Format_Grayscale8
+    assert [p[0] for p in _qimage_pixels(qimage)] == _pixels(image)
+
+
+def test_palette_image_is_converted():
+    image = _gradient("RGB").convert("P")
+    qimage = pil_image_to_qimage(image)
+
+    assert _qimage_pixels(qimage) == _pixels(image.convert("RGB"))
+
+
+def test_qimage_keeps_backing_buffer_alive():
+    qimage = pil_image_to_qimage(_gradient("RGB"))
+    gc.collect()
+
+    assert _qimage_pixels(qimage)[-1] == (180, 160, 100)
+
+
+def test_qpixmap_outlives_wrapped_buffer(qapp):
+    # Large enough for the buffer to be unmapped when it is freed.
+    pixmap = pil_image_to_qpixmap(Image.new("RGB", (1600, 1200), (10, 20, 30)))
+    gc.collect()
+
+    assert pixmap.toImage().pixelColor(1599, 1199).getRgb()[:3] == (10, 20, 30)
+
+
+def test_png_bytes_roundtrip():
+    image = _gradient("RGB")
+    data = pil_image_to_png_bytes(image)
+    assert data.startswith(b"\x89PNG")
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+import threading
+
+from printado.ipc import CommandServer, send_command
+
+
+RESIDENT_INSTANCE = """
+import sys
+from PyQt5.QtCore import QCoreApplication
+from printado.ipc import CommandServer
+app = QCoreApplication([])
+server = CommandServer(sys.argv[1])
+assert server.listen()
+print("ready", flush=True)
+app.exec_()
+"""
+
+
+def _send_in_thread(command, name, results):
+    thread = threading.Thread(target=lambda: results.append(send_command(command, name, timeout_ms=2000)))
+    thread.start()
+    return thread
+
+
+def test_commands_reach_the_running_instance(qtbot, tmp_path):
+    name = str(tmp_path / "printado.sock")
+    server = CommandServer(name)
+    assert server.listen()
+
+    results = []
+    with qtbot.waitSignal(server.command_received, timeout=3000) as blocker:
+        thread = _send_in_thread("capture", name, results)
+    qtbot.waitUntil(lambda: not thread.is_alive(), timeout=3000)
+
+    assert blocker.args == ["capture"]
+    assert results == [True]
+    server.close()
+
+
+def test_second_instance_does_not_take_over(tmp_path):
+    name = str(tmp_path / "printado.sock")
+    instance = subprocess.Popen(
+        [sys.executable, "-c", RESIDENT_INSTANCE, name],
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    try:
+        assert instance.stdout.readline().strip() == "ready"
+
+        second = CommandServer(name)
+        assert not second.listen()
+        assert send_command("ping", name, timeout_ms=2000)
+    finally:
+        instance.kill()
+        instance.wait()
+
+
+def test_without_instance_commands_fail_and_stale_sockets_are_replaced(tmp_path):
+    name = str(tmp_path / "printado.sock")
+    assert not send_command("capture", name, timeout_ms=200)
+
+    (tmp_path / "printado.sock").write_text("stale")
+    server = CommandServer(name)
+    assert server.listen()
+    server.close()
@@ -0,0 +1,53 @@
+from email.parser import BytesParser
+
+import pytest
+
+from printado.modules.multipart import MultipartStream, UploadCancelled
+
+
+PAYLOAD = bytes(range(256)) * 1000
+
+
+def _parse(stream, body):
+    message = BytesParser().parsebytes(f"Content-Type: {stream.content_type}\r\n\r\n".encode() + body)
+    return message.get_payload()[0]
+
+
+def test_stream_matches_payload_in_any_chunking():
+    stream = MultipartStream("image", "printado.png", data=PAYLOAD)
+    body = b"".join(iter(lambda: stream.read(7919), b""))
+
+    assert len(body) == stream.len
+    part = _parse(stream, body)
+    assert part.get_filename() == "printado.png"
+    assert part.get_content_type() == "image/png"
+    assert part.get_payload(decode=True) == PAYLOAD
+
+
+def test_stream_from_file_and_rewind(tmp_path):
+    path = tmp_path / "capture.webp"
+    path.write_bytes(PAYLOAD)
+    stream = MultipartStream("image", "capture.webp", path=str(path))
+
+    first = stream.read()
+    assert stream.tell() == stream.len and len(stream) == 0
+    stream.seek(0)
+    assert stream.read() == first
+    assert _parse(stream, first).get_payload(decode=True) == PAYLOAD
+    stream.close()
+
+
+def test_progress_and_cancellation():
+    progress = []
+    cancelled = {"value": False}
+    stream = MultipartStream(
+        "image", "printado.png", data=PAYLOAD,
+        on_progress=lambda sent, total: progress.append((sent, total)),
+        is_cancelled=lambda: cancelled["value"],
+    )
+
+    stream.read(1024)
+    cancelled["value"] = True
+    with pytest.raises(UploadCancelled):
+        stream.read(1024)
+    assert progress == [(1024, stream.len)]
@@ -0,0 +1,116 @@
+import random
+
+from PIL import Image
+
+from printado.core.annotations import Arrow, Line, Rectangle, Text
+from printado.core.renderer import AnnotationRenderer
+from printado.core.screenshot_editor import render_image, scale_element
+
+
+def _random_base(width=320, height=240, seed=0):
+    rng = random.Random(seed)
+    data = bytes(rng.randrange(256) for _ in range(width * height * 3))
+    return Image.frombytes("RGB", (width, height), data)
+
+
+def _random_element(rng, width, height):
+    kind = rng.choice([Arrow, Line, Rectangle, Text])
+    color = rng.choice(["#ff0000", "#00ff00", "#0000ff", "#ffffff"])
+
+    if kind is Text:
+        return Text(
+            "Printado",
+            rng.randint(-20, width),
+            rng.randint(-20, height),
+            color,
+            "Arial",
+            rng.randint(8, 30),
+            bold=rng.random() < 0.5,
+            underline=rng.random() < 0.5,
+        )
+
+    coords = [rng.randint(-40, max(width, height) + 40) for _ in range(4)]
+    return kind(*coords, rng.randint(1, 15), color)
+
+
+def _assert_same(a, b):
+    assert a.size == b.size
+    assert a.tobytes() == b.tobytes()
+
+
+def test_append_matches_full_replay():
+    base = _random_base()
+    renderer = AnnotationRenderer(base)
+    rng = random.Random(1)
+    elements = []
+
+    for _ in range(30):
+        elements.append(_random_element(rng, *base.size))
+        _assert_same(renderer.render(elements), render_image(base, elements))
+
+
+def test_undo_matches_full_replay():
+    base = _random_base(seed=2)
+    renderer = AnnotationRenderer(base)
+    rng = random.Random(3)
+    elements = []
+    history = []
+
+    for _ in range(300):
+        if history and rng.random() < 0.4:
+            elements = history.pop()
+        else:
+            history.append(list(elements))
+            elements.append(_random_element(rng, *base.size))
+        _assert_same(renderer.render(elements), render_image(base, elements))
+
+
+def test_unrelated_change_rebuilds():
+    base = _random_base(seed=4)
+    renderer = AnnotationRenderer(base)
+    rng = random.Random(5)
+    elements = [_random_element(rng, *base.size) for _ in range(5)]
+    renderer.render(elements)
+
+    elements[2] = _random_element(rng, *base.size)
+    _assert_same(renderer.render(elements), render_image(base, elements))
+
+
+def test_render_does_not_touch_base_image():
+    base = _random_base(seed=6)
+    original = base.tobytes()
+    renderer = AnnotationRenderer(base)
+    renderer.render([Line(0, 0, 100, 100, 5, "#ff0000")])
+    assert base.tobytes() == original
+
+
+def test_scaled_renderer_matches_scaled_replay():
+    base = _random_base(seed=7)
+    preview = base.resize((160, 120))
+    scale = (160 / base.width, 120 / base.height)
+    renderer = AnnotationRenderer(preview, scale=scale)
+    rng = random.Random(8)
+    elements = []
+    history = []
+
+    for _ in range(60):
+        if history and rng.random() < 0.3:
+            elements = history.pop()
+        else:
+            history.append(list(elements))
+            elements.append(_random_element(rng, *base.size))
+        expected = render_image(preview, [scale_element(e, *scale) for e in elements])
+        _assert_same(renderer.render(elements), expected)
+
+
+def test_full_resolution_renderer_only_without_preview_proxy(qtbot, monkeypatch):
+    from printado.modules.gui import ScreenshotTool
+
+    editor = ScreenshotTool(start_selection=False)
+    qtbot.addWidget(editor)
+    editor.on_selection_finished(Image.new("RGB", (1920, 1080), "white"))
+    assert editor.renderer is None and editor.preview_renderer is not None
+
+    monkeypatch.setattr("printado.config.Config.PREVIEW_PROXY", False)
+    editor.on_selection_finished(Image.new("RGB", (1920, 1080), "white"))
+    assert editor.renderer is not None and editor.preview_renderer is None
@@ -0,0 +1,71 @@
+from PIL import Image
+from PyQt5.QtCore import QRect
+from PyQt5.QtWidgets import QApplication
+
+from printado.core import selection_window
+from printado.core.selection_window import SelectionWindow
+
+
+def _frame(width, height):
+    image = Image.new("RGB", (width, height))
+    for x in range(0, width, 7):
+        for y in range(0, height, 5):
+            image.putpixel((x, y), (x % 256, y % 256, 128))
+    return image
+
+
+def test_frozen_selection_is_cropped_without_grabbing(qtbot):
+    class App:
+        pass
+
+    screen_rect = QApplication.primaryScreen().virtualGeometry()
+    frame = _frame(screen_rect.width() * 2, screen_rect.height() * 2)
+    window = SelectionWindow(App(), frozen_frame=frame)
+    qtbot.addWidget(window)
+    assert window.screen_rect == screen_rect
+    window.rubberBand.setGeometry(QRect(screen_rect.x() + 10, screen_rect.y() + 20, 100, 50))
+
+    with qtbot.waitSignal(window.selection_finished, timeout=1000) as blocker:
+        window.mouseReleaseEvent(None)
+
+    assert blocker.args[0].tobytes() == frame.crop((20, 40, 220, 140)).tobytes()
+    assert window.frozen_frame is None
+
+
+def test_selection_off_every_screen_captures_the_whole_desktop(qtbot):
+    class App:
+        pass
+
+    screen_rect = QApplication.primaryScreen().virtualGeometry()
+    frame = _frame(screen_rect.width(), screen_rect.height())
+    window = SelectionWindow(App(), frozen_frame=frame)
+    qtbot.addWidget(window)
+    window.rubberBand.setGeometry(QRect(screen_rect.right() + 50, screen_rect.y(), 100, 50))
+
+    with qtbot.waitSignal(window.selection_finished, timeout=1000) as blocker:
+        window.mouseReleaseEvent(None)
+
+    assert blocker.args[0].tobytes() == frame.tobytes()
+
+
+def test_capture_without_screens_closes_without_a_screenshot(qtbot, monkeypatch):
+    class App:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+        def process_screenshot(self, screenshot):
+            raise AssertionError("no screenshot expected")
+
+    monkeypatch.setattr(selection_window, "get_screen_regions", lambda: [])
+    app = App()
+    window = SelectionWindow(app)
+    qtbot.addWidget(window)
+    finished = []
+    window.selection_finished.connect(finished.append)
+
+    window.capture_selection()
+
+    assert finished == [] and app.closed
+    assert not window.isVisible()
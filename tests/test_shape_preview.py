@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+
+from PyQt5.QtCore import QPoint, Qt
+from PyQt5.QtGui import QColor
+from PIL import Image
+from PyQt5.QtWidgets import QLabel, QWidget
+
+from printado.core.event_handler import handle_mouse_move, handle_mouse_press, handle_mouse_release
+from printado.core.shape_preview import ShapePreviewOverlay
+
+
+def _event(x, y):
+    return SimpleNamespace(x=lambda: x, y=lambda: y)
+
+
+def _tool(qtbot):
+    window = QWidget()
+    qtbot.addWidget(window)
+    window.resize(400, 300)
+    window.show()
+    qtbot.waitExposed(window)
+
+    commits = []
+    tool = SimpleNamespace(
+        image_offset_x=10,
+        image_offset_y=20,
+        new_width=300,
+        new_height=200,
+        original_width=600,
+        tool_size=6,
+        selected_color=QColor(Qt.red),
+        rectangle_mode=False,
+        line_mode=True,
+        arrow_mode=False,
+        text_mode=False,
+        line_start=None,
+        line_end=None,
+        label=QLabel(window),
+        shape_preview=ShapePreviewOverlay(window),
+        commit_line=lambda start, end: commits.append((start, end)),
+    )
+    return window, tool, commits
+
+
+def test_drag_previews_without_committing(qtbot):
+    window, tool, commits = _tool(qtbot)
+    frame_times = []
+    tool.shape_preview.frame_time_hook = frame_times.append
+
+    handle_mouse_press(tool, _event(30, 40))
+    assert tool.shape_preview.is_active()
+    assert tool.shape_preview.pen_width == 3
+
+    for x in range(40, 200, 10):
+        handle_mouse_move(tool, _event(x, 40))
+    qtbot.waitUntil(lambda: len(frame_times) > 0, timeout=1000)
+
+    assert commits == []
+    assert tool.shape_preview.end == (180, 20)
+    assert all(ms >= 0 for ms in frame_times)
+
+    # The in-progress line is visible at display position (offset + point).
+    pixel = window.grab().toImage().pixelColor(QPoint(100, 40))
+    assert (pixel.red(), pixel.green(), pixel.blue()) == (255, 0, 0)
+
+
+def test_release_commits_once_and_hides_preview(qtbot):
+    window, tool, commits = _tool(qtbot)
+
+    handle_mouse_press(tool, _event(30, 40))
+    handle_mouse_move(tool, _event(120, 90))
+    handle_mouse_release(tool, _event(120, 90))
+
+    assert commits == [((20, 20), (110, 70))]
+    assert not tool.shape_preview.is_active()
+    assert not tool.shape_preview.isVisible()
+
+
+def test_move_without_drag_is_ignored(qtbot):
+    window, tool, commits = _tool(qtbot)
+    handle_mouse_move(tool, _event(50, 50))
+
+    assert not tool.shape_preview.is_active()
+
+
+def _red_box(qimage):
+    xs, ys = [], []
+    for y in range(qimage.height()):
+        for x in range(qimage.width()):
+            color = qimage.pixelColor(x, y)
+            if color.red() > 200 and color.green() < 60 and color.blue() < 60:
+                xs.append(x)
+                ys.append(y)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def test_preview_lines_up_with_committed_shape(qtbot):
+    from printado.modules.gui import ScreenshotTool
+
+    editor = ScreenshotTool(start_selection=False)
+    qtbot.addWidget(editor)
+    editor.on_selection_finished(Image.new("RGB", (1280, 720), "white"))
+    editor.show()
+    qtbot.waitExposed(editor)
+    assert editor.label.pos() != QPoint(0, 0)  # the layout margin must be accounted for
+
+    editor.enable_line_mode()
+    editor.selected_color = QColor(Qt.red)
+    origin = editor.label.mapTo(editor, QPoint(editor.image_offset_x, editor.image_offset_y))
+    start, end = origin + QPoint(100, 80), origin + QPoint(300, 80)
+
+    handle_mouse_press(editor, _event(start.x(), start.y()))
+    handle_mouse_move(editor, _event(end.x(), end.y()))
+    qtbot.wait(50)
+    preview_box = _red_box(editor.grab().toImage())
+
+    handle_mouse_release(editor, _event(end.x(), end.y()))
+    qtbot.wait(50)
+    committed_box = _red_box(editor.grab().toImage())
+
+    assert all(abs(a - b) <= 2 for a, b in zip(preview_box, committed_box))
+    assert abs(committed_box[0] - start.x()) <= 3 and abs(committed_box[1] - start.y()) <= 3
+
+
+def test_text_input_opens_where_the_user_clicked(qtbot):
+    from printado.modules.gui import ScreenshotTool
+
+    editor = ScreenshotTool(start_selection=False)
+    qtbot.addWidget(editor)
+    editor.on_selection_finished(Image.new("RGB", (1280, 720), "white"))
+    editor.show()
+    qtbot.waitExposed(editor)
+    assert editor.label.pos() != QPoint(0, 0)
+
+    editor.enable_text_mode()
+    origin = editor.label.mapTo(editor, QPoint(editor.image_offset_x, editor.image_offset_y))
+    click = origin + QPoint(120, 90)
+    handle_mouse_press(editor, _event(click.x(), click.y()))
+
+    assert editor.text_position == (120, 90)
+    assert editor.text_edit.pos() == click
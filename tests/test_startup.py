@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+
+from printado.cli import SUBCOMMANDS
+from printado.startup_profile import (
+    DEFERRED_MODULES,
+    STARTUP_IMPORT_BUDGET_MS,
+    format_report,
+    measure_imports,
+    parse_importtime,
+)
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _fresh_interpreter(code):
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen", "PYNPUT_BACKEND": "dummy"}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+
+
+def test_tray_import_defers_heavy_modules():
+    result = _fresh_interpreter("import json, sys, printado.tray; print(json.dumps(sorted(sys.modules)))")
+    loaded = set(json.loads(result.stdout))
+
+    assert [name for name in DEFERRED_MODULES if name in loaded] == []
+
+
+def test_tray_import_within_budget():
+    rows = measure_imports("printado.tray")
+    tray = next(row for row in rows if row[0] == "printado.tray")
+
+    assert tray[2] / 1000 < STARTUP_IMPORT_BUDGET_MS, format_report(rows)
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+    )
+    rows = parse_importtime(output)
+
+    assert rows == [("json.decoder", 120, 120), ("json", 300, 420)]
+    assert "json: 0.4 ms" in format_report(rows, module="json")
+
+
+def test_cli_import_defers_pillow():
+    result = _fresh_interpreter("import json, sys, printado.cli; print(json.dumps(sorted(sys.modules)))")
+    loaded = set(json.loads(result.stdout))
+
+    assert not {"PIL", "printado.core.encoding"} & loaded
+
+
+def test_main_dispatches_cli_subcommands():
+    for command in SUBCOMMANDS:
+        result = _fresh_interpreter(
+            "import runpy, sys\n"
+            f"sys.argv = ['printado', {command!r}, '--help']\n"
+            "try:\n"
+            "    runpy.run_module('printado', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('printado.tray' in sys.modules)\n"
+        )
+        assert f"usage: printado {command}" in result.stdout
+        assert result.stdout.strip().endswith("False")
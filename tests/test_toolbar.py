@@ -0,0 +1,47 @@
+import gc
+
+from PIL import Image
+
+from printado.core import toolbar
+from printado.core.toolbar import image_brightness, is_background_dark, is_screenshot_dark
+
+
+def test_dark_and_light_backgrounds():
+    assert is_background_dark(Image.new("RGB", (3000, 2000), (20, 20, 20)))
+    assert not is_background_dark(Image.new("RGB", (3000, 2000), (240, 240, 240)))
+
+
+def test_sampled_brightness_is_close_to_full_mean():
+    image = Image.linear_gradient("L").resize((1920, 1080)).convert("RGB")
+    assert abs(image_brightness(image) - 127.5) < 4
+
+
+def test_brightness_is_memoized_per_image(monkeypatch):
+    image = Image.new("RGB", (800, 600), (200, 200, 200))
+    image_brightness(image)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("brightness recomputed")
+
+    monkeypatch.setattr(toolbar.ImageStat, "Stat", fail)
+    assert image_brightness(image) > 128
+
+
+def test_cache_entry_dropped_with_image():
+    image = Image.new("RGB", (100, 100))
+    image_brightness(image)
+    key = id(image)
+    assert key in toolbar._brightness_cache
+
+    del image
+    gc.collect()
+    assert key not in toolbar._brightness_cache
+
+
+def test_is_screenshot_dark_uses_base_screenshot():
+    class Tool:
+        base_screenshot = Image.new("RGB", (10, 10), (255, 255, 255))
+        rendered_screenshot = Image.new("RGB", (10, 10), (0, 0, 0))
+
+    assert not is_screenshot_dark(Tool())
+    assert is_screenshot_dark(object())
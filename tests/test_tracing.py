@@ -0,0 +1,74 @@
+import json
+import threading
+
+import pytest
+from PIL import Image
+
+from printado.core import tracing
+from printado.core.encoding import encode_image
+from printado.core.screenshot_editor import render_image
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    monkeypatch.setattr(tracing, "_enabled", True)
+    tracing.reset()
+    yield tracing
+    tracing.reset()
+
+
+def test_disabled_span_records_nothing(monkeypatch):
+    monkeypatch.setattr(tracing, "_enabled", False)
+    tracing.reset()
+
+    with tracing.span("noop", size=1):
+        pass
+
+    assert tracing.span("other") is tracing.span("noop")
+    assert tracing.summary() == {}
+    assert tracing.chrome_trace() == []
+
+
+def test_spans_feed_histograms(traced):
+    tracing.record("step", 0, 2_000_000)  # 2 ms
+    tracing.record("step", 0, 40_000_000)  # 40 ms
+    with tracing.span("step"):
+        pass
+
+    histogram = traced.summary()["step"]
+    assert histogram["count"] == 3
+    assert histogram["max_ms"] == 40.0
+    assert histogram["p95_ms"] == 50
+    assert sum(histogram["buckets"].values()) == 3
+
+
+def test_chrome_trace_has_complete_events_per_thread(traced):
+    def work():
+        with tracing.span("worker", item=1):
+            pass
+
+    thread = threading.Thread(target=work, name="printado-test")
+    thread.start()
+    thread.join()
+    with tracing.span("main"):
+        pass
+
+    events = traced.chrome_trace()
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert spans["worker"]["args"] == {"item": 1}
+    assert spans["worker"]["tid"] != spans["main"]["tid"]
+    assert {"name": "printado-test"} in [event["args"] for event in events if event["ph"] == "M"]
+
+
+def test_dump_writes_histograms_and_trace(traced, tmp_path):
+    image = Image.new("RGB", (64, 48), (200, 30, 30))
+    render_image(image, [])
+    encode_image(image, preset="fast")
+
+    path = traced.dump(str(tmp_path / "trace.json"))
+    with open(path, encoding="utf-8") as trace_file:
+        data = json.load(trace_file)
+
+    assert {"render_image", "encode"} <= set(data["histograms"])
+    encode = next(event for event in data["traceEvents"] if event["name"] == "encode")
+    assert encode["args"] == {"preset": "fast", "format": "PNG"}
@@ -0,0 +1,122 @@
+import sys
+import threading
+import types
+
+from printado import tray
+
+
+def _fake_pynput(monkeypatch):
+    """A pynput whose listener presses PrintScreen once, on its own thread."""
+
+    class Listener:
+        def __init__(self, on_press, on_release):
+            self.on_press = on_press
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def join(self):
+            self.on_press(keyboard.Key.print_screen)
+
+    keyboard = types.SimpleNamespace(Key=types.SimpleNamespace(print_screen="print_screen", esc="esc"), Listener=Listener)
+    monkeypatch.setitem(sys.modules, "pynput", types.SimpleNamespace(keyboard=keyboard))
+    return keyboard
+
+
+def _record_captures(monkeypatch):
+    captures = []
+    monkeypatch.setattr(tray, "start_capture", lambda: captures.append(threading.current_thread()))
+    monkeypatch.setattr(tray, "hotkey_relay", None)
+    return captures
+
+
+def test_print_screen_from_listener_thread_starts_capture(qtbot, monkeypatch):
+    _fake_pynput(monkeypatch)
+    captures = _record_captures(monkeypatch)
+    tray.start_hotkey_listener()
+
+    qtbot.waitUntil(lambda: len(captures) == 1, timeout=2000)
+    assert captures == [threading.main_thread()]
+
+
+def _hotkey_listener(monkeypatch):
+    monkeypatch.delitem(sys.modules, "printado.hotkey_listener", raising=False)
+    from printado import hotkey_listener
+
+    monkeypatch.setattr(hotkey_listener, "main_process", None)
+    return hotkey_listener
+
+
+def test_key_press_seen_by_both_listeners_captures_once(qtbot, monkeypatch):
+    keyboard = _fake_pynput(monkeypatch)
+    captures = _record_captures(monkeypatch)
+    hotkey_listener = _hotkey_listener(monkeypatch)
+    monkeypatch.setattr(hotkey_listener, "send_command", lambda command: tray.handle_command(command) or True)
+    tray.start_hotkey_listener()
+
+    hotkey_listener.on_press(keyboard.Key.print_screen)  # the same press, seen by the standalone listener
+    qtbot.waitUntil(lambda: len(captures) == 1, timeout=2000)
+    qtbot.wait(50)
+
+    assert len(captures) == 1
+
+
+def test_tray_started_by_the_listener_captures_on_its_commands(monkeypatch):
+    captures = _record_captures(monkeypatch)
+    started = []
+    monkeypatch.setattr(tray, "start_hotkey_listener", lambda: started.append(True))
+    for name in ("start_editor_pool", "start_export_notifications", "start_update_service", "start_upload_client",
+                 "start_font_index", "start_upload_queue"):
+        monkeypatch.setattr(tray, name, lambda *args: None)
+
+    tray.start_background_services(None, hotkey=False)
+    tray.handle_command("hotkey")
+
+    assert started == []
+    assert len(captures) == 1
+
+
+def test_listener_starts_the_tray_without_its_own_hotkey(monkeypatch):
+    keyboard = _fake_pynput(monkeypatch)
+    hotkey_listener = _hotkey_listener(monkeypatch)
+    commands, launched = [], []
+    monkeypatch.setattr(hotkey_listener, "send_command", lambda command: commands.append(command) or False)
+    monkeypatch.setattr(hotkey_listener.subprocess, "Popen", lambda args: launched.append(args))
+
+    hotkey_listener.on_press(keyboard.Key.print_screen)
+
+    assert commands == ["hotkey"]
+    assert launched[0][-3:] == ["printado", "--capture", "--no-hotkey"]
+
+
+def test_font_index_is_loaded_off_the_gui_thread(qtbot, monkeypatch):
+    from printado.core import fonts
+
+    loads = []
+    monkeypatch.setattr(fonts, "load_font_index", lambda: loads.append(threading.current_thread()))
+    tray.start_font_index()
+
+    qtbot.waitUntil(lambda: len(loads) == 1, timeout=2000)
+    assert loads[0] is not threading.main_thread()
+
+
+def test_clicking_a_message_opens_only_its_own_link(monkeypatch):
+    class Tray:
+        def showMessage(self, title, text, icon, msecs):
+            shown.append(text)
+
+    shown, opened = [], []
+    monkeypatch.setattr(tray, "tray", Tray())
+    monkeypatch.setattr(tray, "message_link", None)
+    monkeypatch.setattr(tray.webbrowser, "open_new_tab", opened.append)
+
+    tray.show_message("Captura enviada: https://example.com/a", link="https://example.com/a")
+    tray.on_message_clicked()
+    tray.show_message("Captura salva em /tmp/a.png")
+    tray.on_message_clicked()
+
+    assert len(shown) == 2
+    assert opened == ["https://example.com/a"]
@@ -0,0 +1,68 @@
+
+import pytest
+
+from printado.modules.update_service import UpdateService, fetch_latest_version
+
+
+PAYLOAD = {"latest_version": "99.0.0", "download_url": "https://example.com/dl", "changelog": ["novo"]}
+
+
+@pytest.fixture
+def update_server(http_server):
+    state = {"etag": '"v1"', "status": 200}
+
+    def respond(request):
+        if state["status"] != 200:
+            return state["status"], b""
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return 304, b""
+        return 200, PAYLOAD, {"Content-Type": "application/json", "ETag": state["etag"]}
+
+    server = http_server(respond, "/latest_version.json")
+    state["url"] = server.url
+    state["requests"] = server.requests
+    return state
+
+
+def test_fetch_is_cached_within_ttl(update_server, tmp_path):
+    cache_path = str(tmp_path / "latest_version.json")
+
+    assert fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1000) == PAYLOAD
+    assert fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1030) == PAYLOAD
+    assert len(update_server["requests"]) == 1
+
+
+def test_expired_cache_revalidates_with_etag(update_server, tmp_path):
+    cache_path = str(tmp_path / "latest_version.json")
+    fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1000)
+
+    assert fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1100) == PAYLOAD
+    assert len(update_server["requests"]) == 2
+    assert update_server["requests"][1].headers.get("If-None-Match") == '"v1"'
+
+    # The 304 refreshed the cache timestamp.
+    fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1120)
+    assert len(update_server["requests"]) == 2
+
+
+def test_server_errors_fall_back_to_cache(update_server, tmp_path):
+    cache_path = str(tmp_path / "latest_version.json")
+    assert fetch_latest_version(update_server["url"], cache_path, ttl=60, now=1000) == PAYLOAD
+
+    update_server["status"] = 500
+    assert fetch_latest_version(update_server["url"], cache_path, ttl=60, now=2000) == PAYLOAD
+
+
+def test_unreachable_server_without_cache(tmp_path):
+    cache_path = str(tmp_path / "latest_version.json")
+    assert fetch_latest_version("http://127.0.0.1:9/latest_version.json", cache_path, ttl=60, timeout=1) is None
+
+
+def test_service_emits_update_from_worker_thread(qtbot, update_server, tmp_path):
+    service = UpdateService(url=update_server["url"], cache_path=str(tmp_path / "cache.json"), interval=0)
+
+    with qtbot.waitSignal(service.update_available, timeout=5000) as blocker:
+        service.start()
+
+    assert blocker.args == ["99.0.0", "https://example.com/dl", ["novo"]]
+    service.thread.wait()
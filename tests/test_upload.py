@@ -19,10 +19,10 @@ def test_upload_thread_creation():
 
 
 def test_upload_thread_emits_link(monkeypatch):
-    def fake_post(url, files=None, headers=None, timeout=None):
+    def fake_upload(self, body, url=None, headers=None, timeout=None):
         return _FakeResponse(200, payload={"link": "https://example.com/x"})
 
-    monkeypatch.setattr("printado.modules.upload.requests.post", fake_post)
+    monkeypatch.setattr("printado.modules.upload_client.UploadClient.upload", fake_upload)
 
     emitted = {"value": None}
     thread = UploadThread(image_bytes=b"png-bytes", filename="test.png")
@@ -0,0 +1,85 @@
+
+import pytest
+
+from printado.modules.upload import UploadThread
+from printado.modules.upload_client import UploadClient
+
+
+@pytest.fixture
+def upload_server(http_server):
+    state = {"uploads": [], "failures": 0}
+
+    def respond(request):
+        if state["failures"]:
+            state["failures"] -= 1
+            return 503, b"ocupado"
+        state["uploads"].append({"api_key": request.headers.get("X-API-KEY"), "body": request.body})
+        return 200, {"link": f"https://example.com/{len(state['uploads'])}"}
+
+    server = http_server(respond, "/upload")
+    state["url"] = server.url
+    state["connections"] = server.connections
+    return state
+
+
+def _upload(client, url, monkeypatch, payload=b"png-bytes"):
+    monkeypatch.setattr("printado.config.Config.UPLOAD_URL", url)
+    emitted = []
+    thread = UploadThread(image_bytes=payload, filename="test.png", client=client)
+    thread.upload_finished.connect(emitted.append)
+    thread.run()
+    return emitted[0]
+
+
+def test_connection_is_reused_between_uploads(upload_server, monkeypatch):
+    client = UploadClient(retries=0)
+
+    links = [_upload(client, upload_server["url"], monkeypatch) for _ in range(3)]
+
+    assert links == ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
+    assert len(upload_server["connections"]) == 1
+    assert b"png-bytes" in upload_server["uploads"][0]["body"]
+    client.close()
+
+
+def test_server_errors_are_retried(upload_server, monkeypatch):
+    upload_server["failures"] = 2
+    client = UploadClient(retries=3, backoff=0)
+
+    assert _upload(client, upload_server["url"], monkeypatch) == "https://example.com/1"
+    assert len(upload_server["uploads"]) == 1
+    client.close()
+
+
+def test_exhausted_retries_report_the_last_error(upload_server, monkeypatch):
+    upload_server["failures"] = 5
+    client = UploadClient(retries=1, backoff=0)
+
+    assert _upload(client, upload_server["url"], monkeypatch) == "Erro 503: ocupado"
+    client.close()
+
+
+def test_upload_streams_progress_and_can_be_cancelled(upload_server, monkeypatch):
+    monkeypatch.setattr("printado.config.Config.UPLOAD_URL", upload_server["url"])
+    client = UploadClient(retries=0)
+    payload = b"x" * (1024 * 1024)
+
+    progress = []
+    emitted = []
+    thread = UploadThread(image_bytes=payload, filename="test.png", client=client)
+    thread.upload_progress.connect(lambda sent, total: progress.append((sent, total)))
+    thread.upload_finished.connect(emitted.append)
+    thread.run()
+
+    assert emitted == ["https://example.com/1"]
+    assert progress[-1][0] == progress[-1][1] > len(payload)
+    assert 2 < len(progress) <= 101
+
+    thread = UploadThread(image_bytes=payload, filename="test.png", client=client)
+    thread.upload_progress.connect(lambda sent, total: thread.cancel())
+    thread.upload_finished.connect(emitted.append)
+    thread.run()
+
+    assert emitted[-1] == "Erro: Envio cancelado."
+    assert len(upload_server["uploads"]) == 1
+    client.close()
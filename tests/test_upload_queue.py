@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+
+from printado.modules.upload import UploadThread
+from printado.modules.upload_client import UploadClient
+from printado.modules.upload_queue import UploadQueue
+
+
+@pytest.fixture
+def flaky_server(http_server):
+    state = {"failures": 0, "uploads": 0, "active": 0, "max_active": 0, "lock": threading.Lock(),
+             "release": threading.Event()}
+    state["release"].set()
+
+    def respond(request):
+        with state["lock"]:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        state["release"].wait(5)
+        with state["lock"]:
+            state["active"] -= 1
+            if state["failures"]:
+                state["failures"] -= 1
+                return 503, b"fora do ar"
+            state["uploads"] += 1
+            return 200, {"link": f"https://example.com/{state['uploads']}"}
+
+    state["url"] = http_server(respond, "/upload").url
+    yield state
+    state["release"].set()
+
+
+def _queue(tmp_path, **kwargs):
+    options = dict(client=UploadClient(retries=0), backoff=0.05, max_backoff=0.2, poll_interval=0.05)
+    options.update(kwargs)
+    return UploadQueue(spool_dir=str(tmp_path / "spool"), **options)
+
+
+def test_spool_survives_restart(tmp_path):
+    queue = _queue(tmp_path)
+    entry_id = queue.enqueue("printado.png", data=b"png-bytes")
+
+    pending = _queue(tmp_path).pending()
+    assert [entry.id for entry in pending] == [entry_id]
+    with open(pending[0].path, "rb") as spool_file:
+        assert spool_file.read() == b"png-bytes"
+
+
+def test_unreachable_server_spools_the_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr("printado.config.Config.UPLOAD_URL", "http://127.0.0.1:9/upload")
+    queue = _queue(tmp_path)
+    queued, finished = [], []
+
+    thread = UploadThread(image_bytes=b"png-bytes", filename="test.png", client=UploadClient(retries=0), queue=queue)
+    thread.upload_queued.connect(queued.append)
+    thread.upload_finished.connect(finished.append)
+    thread.run()
+
+    assert queued and not finished
+    assert len(queue.pending()) == 1
+
+
+def test_worker_retries_with_backoff_until_success(qtbot, tmp_path, monkeypatch, flaky_server):
+    monkeypatch.setattr("printado.config.Config.UPLOAD_URL", flaky_server["url"])
+    flaky_server["failures"] = 2
+    queue = _queue(tmp_path)
+    queue.enqueue("printado.png", data=b"png-bytes")
+
+    with qtbot.waitSignal(queue.uploaded, timeout=5000) as blocker:
+        queue.start()
+    queue.stop(timeout=2)
+
+    assert blocker.args[1] == "https://example.com/1"
+    assert queue.pending() == []
+    assert not os.path.exists(queue.index_path)
+    assert [name for name in os.listdir(queue.spool_dir)] == []
+
+
+def test_concurrent_uploads_are_bounded(qtbot, tmp_path, monkeypatch, flaky_server):
+    monkeypatch.setattr("printado.config.Config.UPLOAD_URL", flaky_server["url"])
+    flaky_server["release"].clear()
+    queue = _queue(tmp_path, concurrency=2)
+    for _ in range(5):
+        queue.enqueue("printado.png", data=b"png-bytes")
+
+    uploaded = []
+    queue.uploaded.connect(lambda entry_id, link: uploaded.append(link))
+    queue.start()
+    qtbot.waitUntil(lambda: flaky_server["active"] == 2, timeout=5000)
+    qtbot.wait(100)
+    flaky_server["release"].set()
+    qtbot.waitUntil(lambda: len(uploaded) == 5, timeout=5000)
+    queue.stop(timeout=2)
+
+    assert flaky_server["max_active"] == 2
+
+
+def test_retry_delay_grows_exponentially(tmp_path):
+    queue = _queue(tmp_path, backoff=5, max_backoff=60)
+    assert [queue.retry_delay(n) for n in range(1, 6)] == [5, 10, 20, 40, 60]